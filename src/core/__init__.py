@@ -15,5 +15,13 @@ __description__ = "Sistema simplificado de automação para SimpleMMO"
 # - step: Sistema de steps
 # - captcha: Detecção de captcha
 # - healing: Sistema de cura
+# - checkpoint: Salvamento e retomada do estado da sessão
+# - router: Classificação de páginas e recuperação fora do travel
+# - estatisticas: Histórico local de atividades e consultas agregadas
+# - politica: Decisão de lutar ou seguir em cada encontro
+# - battle_queue: Fila de prioridade de batalhas pendentes
+# - quest: Execução de quests em lote perto do máximo de quest points
+# - arena: Rodadas de arena com oponentes ordenados por valor esperado
+# - planejador: Ordem das atividades pelo valor por segundo e simulação offline
 
 __all__ = []
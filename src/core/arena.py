@@ -0,0 +1,191 @@
+"""
+Arena SimpleMMO Bot
+
+Este módulo descobre os oponentes disponíveis na arena com uma única
+consulta à página, ordena-os pela recompensa esperada por segundo segundo
+o histórico de lutas e os executa em sequência pela fila de batalhas,
+sem voltar ao travel entre uma luta e outra.
+"""
+
+from dataclasses import dataclass
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from core import fight, politica, step
+from core.context import obter_configuracao
+from driver.manager import get_driver
+from utils.logger import inserir_log
+
+URL_ARENA = "https://web.simple-mmo.com/battle/arena"
+
+TIMEOUT_OPONENTES_ARENA = 10.0
+
+# Página pronta e sem oponentes por este tempo: a arena está vazia (ms)
+ESPERA_ARENA_VAZIA_MS = 1500
+
+# Oponentes listados na arena: nome, nível e URL de ataque de cada cartão.
+# Retorna null até a página carregar; lista vazia só após ESPERA_ARENA_VAZIA_MS
+# com a página pronta, para não confundir arena vazia com lista ainda renderizando.
+SCRIPT_OPONENTES_ARENA = """
+const [esperaVaziaMs] = arguments;
+if (document.readyState !== 'complete'
+        || !window.location.pathname.startsWith('/battle/arena')) return null;
+const visivel = (el) => !!el && el.getClientRects().length > 0;
+const vistos = new Set();
+const oponentes = [];
+for (const a of document.querySelectorAll("a[href*='/attack/']")) {
+    if (!visivel(a) || vistos.has(a.href)) continue;
+    vistos.add(a.href);
+    let cartao = a;
+    for (let i = 0; i < 4 && cartao.parentElement; i++) {
+        cartao = cartao.parentElement;
+        if ((cartao.innerText || '').split('\\n').length >= 3) break;
+    }
+    const linhas = (cartao.innerText || '').split('\\n').map((l) => l.trim()).filter(Boolean);
+    let nivel = null, nome = null;
+    for (const linha of linhas) {
+        const m = linha.match(/(?:level|lvl)\\.?\\s*(\\d+)/i);
+        if (m && nivel === null) { nivel = parseInt(m[1], 10); continue; }
+        if (nome === null && !/attack/i.test(linha)) nome = linha;
+    }
+    oponentes.push({nome: nome, nivel: nivel, url: a.href});
+}
+if (oponentes.length) return {oponentes: oponentes};
+const agora = Date.now();
+if (!window.__smmoBotArenaVazia) window.__smmoBotArenaVazia = agora;
+return agora - window.__smmoBotArenaVazia >= esperaVaziaMs ? {oponentes: []} : null;
+"""
+
+_ultima_arena = 0.0
+
+
+@dataclass
+class OponenteArena:
+    """Oponente da arena com o valor previsto por segundo de luta."""
+
+    encontro: politica.Encontro
+    valor: float | None = None
+
+
+def descobrir_oponentes() -> list[politica.Encontro]:
+    """Lê todos os oponentes da arena em uma única chamada."""
+    driver = get_driver()
+    if not driver:
+        return []
+
+    try:
+        dados = WebDriverWait(driver, TIMEOUT_OPONENTES_ARENA, 0.2).until(
+            lambda d: d.execute_script(SCRIPT_OPONENTES_ARENA, ESPERA_ARENA_VAZIA_MS)
+        )
+    except Exception:
+        return []
+
+    return [
+        politica.Encontro(
+            nome=item.get("nome") or "Desconhecido",
+            nivel=item.get("nivel"),
+            url=item.get("url"),
+        )
+        for item in dados.get("oponentes", [])
+        if item.get("url")
+    ]
+
+
+def ranquear_oponentes(
+    oponentes: list[politica.Encontro], objetivo: str | None = None
+) -> list[OponenteArena]:
+    """
+    Ordena os oponentes pela recompensa esperada por segundo.
+
+    Oponentes sem histórico recebem a média dos conhecidos, para serem
+    explorados sem passar à frente dos melhores.
+    """
+    avaliados = [
+        OponenteArena(
+            encontro, politica.valor_luta_por_segundo(encontro.nome, objetivo)
+        )
+        for encontro in oponentes
+    ]
+    conhecidos = [o.valor for o in avaliados if o.valor is not None]
+    padrao = sum(conhecidos) / len(conhecidos) if conhecidos else 0.0
+
+    # sorted é estável: sem histórico algum a ordem da página é mantida
+    return sorted(
+        avaliados,
+        key=lambda o: o.valor if o.valor is not None else padrao,
+        reverse=True,
+    )
+
+
+def max_lutas_arena() -> int:
+    """Limite de lutas de arena por rodada."""
+    try:
+        return max(1, int(obter_configuracao("max_lutas_arena")))
+    except (TypeError, ValueError):
+        return fight.TAMANHO_LOTE_BATALHAS
+
+
+def executar_arena(log_box=None) -> int:
+    """
+    Navega à arena, ranqueia os oponentes e luta contra os melhores em sequência.
+
+    Returns:
+        Quantidade de lutas de arena efetivamente travadas
+    """
+    driver = get_driver()
+    if not driver:
+        return 0
+
+    driver.get(URL_ARENA)
+    ranking = ranquear_oponentes(descobrir_oponentes())
+    if not ranking:
+        inserir_log(log_box, "🏟️ Nenhum oponente disponível na arena")
+        return 0
+
+    escolhidos = 0
+    for oponente in ranking[: max_lutas_arena()]:
+        encontro = oponente.encontro
+        valor = (
+            f"{oponente.valor:.2f}/s" if oponente.valor is not None else "sem histórico"
+        )
+        inserir_log(log_box, f"🏟️ {encontro.nome}: {valor}", debug=True)
+        if fight.queue_arena_fight(encontro.nome, encontro.url, log_box):
+            escolhidos += 1
+
+    if not escolhidos:
+        return 0
+
+    # Só as entradas da arena: lutas do travel ou manuais seguem na fila
+    _, lutadas = fight.executar_lote_batalhas(
+        log_box, tamanho_lote=escolhidos, origem="arena"
+    )
+    return lutadas
+
+
+def verificar_e_executar_arena(log_box=None) -> bool:
+    """
+    Executa uma rodada de arena a cada `intervalo_arena` segundos.
+
+    Returns:
+        True se alguma luta de arena foi executada (a página deixou o travel)
+    """
+    global _ultima_arena
+
+    try:
+        intervalo = float(obter_configuracao("intervalo_arena"))
+    except (TypeError, ValueError):
+        intervalo = 600.0
+    if time.time() - _ultima_arena < intervalo:
+        return False
+    _ultima_arena = time.time()
+
+    inicio = time.time()
+    lutas = executar_arena(log_box)
+    if lutas:
+        inserir_log(
+            log_box,
+            f"🏟️ Rodada de arena: {lutas} luta(s) em {time.time() - inicio:.0f}s",
+        )
+    step.navegar_para_travel(log_box)
+    return lutas > 0
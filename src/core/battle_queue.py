@@ -0,0 +1,153 @@
+"""
+Fila de Batalhas SimpleMMO Bot
+
+Este módulo mantém uma fila de prioridade limitada de batalhas pendentes
+(encontros do travel, lutas de arena e URLs adicionadas manualmente),
+com deduplicação por URL e expiração de entradas antigas. As batalhas são
+retiradas em lotes para serem executadas em sequência, sem voltar ao
+travel entre uma e outra.
+"""
+
+from dataclasses import asdict, dataclass, field
+import heapq
+import itertools
+import threading
+import time
+from typing import Any
+
+# Origem -> prioridade (menor sai primeiro)
+PRIORIDADES = {
+    "travel": 0,
+    "manual": 1,
+    "arena": 2,
+}
+
+# Origem -> validade da entrada em segundos
+VALIDADE = {
+    "travel": 60.0,
+    "manual": 3600.0,
+    "arena": 600.0,
+}
+
+TAMANHO_MAXIMO = 20
+
+
+@dataclass
+class QueuedBattle:
+    """Batalha pendente na fila."""
+
+    url: str
+    enemy_name: str
+    origem: str = "manual"
+    prioridade: int = 1
+    criado_em: float = field(default_factory=time.time)
+    expira_em: float = 0.0
+
+    @property
+    def expirada(self) -> bool:
+        """Indica se a entrada já passou da validade."""
+        return time.time() >= self.expira_em
+
+
+class BattleQueue:
+    """Fila de prioridade limitada com deduplicação por URL."""
+
+    def __init__(self, tamanho_maximo: int = TAMANHO_MAXIMO):
+        self.tamanho_maximo = tamanho_maximo
+        self._heap: list[tuple[int, int, QueuedBattle]] = []
+        self._por_url: dict[str, QueuedBattle] = {}
+        self._sequencia = itertools.count()
+        self._lock = threading.Lock()
+
+    def _remover_expiradas(self) -> None:
+        """Descarta entradas expiradas (chamado com o lock adquirido)."""
+        for url, batalha in list(self._por_url.items()):
+            if batalha.expirada:
+                del self._por_url[url]
+        self._heap = [item for item in self._heap if item[2].url in self._por_url]
+        heapq.heapify(self._heap)
+
+    def adicionar(self, url: str, enemy_name: str, origem: str = "manual") -> bool:
+        """
+        Adiciona uma batalha à fila.
+
+        Returns:
+            False se a URL já estava na fila ou a fila está cheia
+        """
+        prioridade = PRIORIDADES.get(origem, PRIORIDADES["manual"])
+        agora = time.time()
+        batalha = QueuedBattle(
+            url=url,
+            enemy_name=enemy_name,
+            origem=origem,
+            prioridade=prioridade,
+            criado_em=agora,
+            expira_em=agora + VALIDADE.get(origem, VALIDADE["manual"]),
+        )
+
+        with self._lock:
+            self._remover_expiradas()
+            if url in self._por_url:
+                return False
+            if len(self._por_url) >= self.tamanho_maximo:
+                return False
+            self._por_url[url] = batalha
+            heapq.heappush(self._heap, (prioridade, next(self._sequencia), batalha))
+            return True
+
+    def retirar_lote(
+        self, tamanho: int, origem: str | None = None
+    ) -> list[QueuedBattle]:
+        """
+        Retira até `tamanho` batalhas válidas, em ordem de prioridade.
+
+        Com `origem`, só entradas dessa origem saem; as demais continuam na fila.
+        """
+        lote = []
+        mantidas = []
+        with self._lock:
+            self._remover_expiradas()
+            while self._heap and len(lote) < tamanho:
+                item = heapq.heappop(self._heap)
+                batalha = item[2]
+                if origem is not None and batalha.origem != origem:
+                    mantidas.append(item)
+                elif self._por_url.pop(batalha.url, None) is not None:
+                    lote.append(batalha)
+            for item in mantidas:
+                heapq.heappush(self._heap, item)
+        return lote
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._remover_expiradas()
+            return len(self._por_url)
+
+    def exportar(self) -> list[dict[str, Any]]:
+        """Exporta as entradas para o checkpoint."""
+        with self._lock:
+            return [asdict(item[2]) for item in sorted(self._heap)]
+
+    def restaurar(self, entradas: list[dict[str, Any]]) -> None:
+        """Restaura entradas salvas no checkpoint (as expiradas são ignoradas)."""
+        with self._lock:
+            for dados in entradas:
+                batalha = QueuedBattle(**dados)
+                if batalha.expirada or batalha.url in self._por_url:
+                    continue
+                self._por_url[batalha.url] = batalha
+                heapq.heappush(
+                    self._heap, (batalha.prioridade, next(self._sequencia), batalha)
+                )
+
+    def status(self) -> str:
+        """Resumo textual da fila."""
+        with self._lock:
+            self._remover_expiradas()
+            por_origem: dict[str, int] = {}
+            for batalha in self._por_url.values():
+                por_origem[batalha.origem] = por_origem.get(batalha.origem, 0) + 1
+        if not por_origem:
+            return "Fila de batalhas vazia"
+        detalhes = ", ".join(f"{origem}: {qtd}" for origem, qtd in por_origem.items())
+        return f"{sum(por_origem.values())} batalha(s) na fila ({detalhes})"
@@ -10,17 +10,40 @@ Features:
 """
 
 from collections.abc import Callable
+import time
 import tkinter as tk
 from typing import Any
 
 from selenium.webdriver.common.by import By
 
-from core import captcha, context, fight, gather, healing, step
-from driver.actions import janela_valida, url_comeca_com
+from core import (
+    arena,
+    captcha,
+    checkpoint,
+    context,
+    fight,
+    gather,
+    healing,
+    planejador,
+    politica,
+    quest,
+    router,
+    step,
+)
+from driver.actions import (
+    aguardar_mudanca_pagina,
+    janela_valida,
+    obter_fingerprint_pagina,
+    url_comeca_com,
+)
 from driver.manager import finalizar_driver, get_driver, iniciar_driver
 from utils.logger import inserir_log
 from utils.timing import sleep_interrompivel, tempo_aleatorio
 
+# Tempo máximo confiando no fingerprint antes de forçar nova detecção
+MAX_IDADE_FINGERPRINT = 30.0
+TIMEOUT_MUDANCA_PAGINA = 5.0
+
 
 def bot_loop(
     log_fn: Callable[[str], None] = print,
@@ -51,9 +74,24 @@ def bot_loop(
 
     log_fn("✅ Bot iniciado.")
 
+    # Retomar sessão anterior a partir do checkpoint
+    atividade = checkpoint.restaurar_checkpoint()
+    if atividade:
+        retomar_atividade(atividade, log_box)
+
     # Loop principal
     erros_consecutivos = 0
 
+    # Fingerprint da página na última decisão (short-circuit de detecção)
+    ultimo_fingerprint: str | None = None
+    momento_fingerprint = 0.0
+
+    # Após um step a próxima detecção sai sem pausa (o motor já respeita o cooldown)
+    apos_step = False
+
+    # Desfecho do último step lido da resposta de rede (dispensa o DOM)
+    desfecho_step: step.StepOutcome | None = None
+
     while True:
         # Verificar se a interface sinalizou o fim
         if context.obter_configuracao("finalizar_bot"):
@@ -61,7 +99,12 @@ def bot_loop(
             break
 
         # Pausa para reduzir uso de CPU
-        sleep_interrompivel(tempo_aleatorio(1.0, 0.5))
+        if not apos_step:
+            sleep_interrompivel(tempo_aleatorio(1.0, 0.5))
+        apos_step = False
+
+        # Checkpoint periódico do estado da sessão
+        checkpoint.salvar_periodico()
 
         # Verificar janela válida
         if not janela_valida():
@@ -82,6 +125,7 @@ def bot_loop(
             # RESOURCE MONITORING
             # ========================================
             # Verifica se o player tem recursos suficientes
+            energia_atual = None
             driver = get_driver()
             if driver:
                 try:
@@ -91,6 +135,7 @@ def bot_loop(
                             By.CSS_SELECTOR, "span.energy-text"
                         )
                         current_energy = int(energy_element.text.strip())
+                        energia_atual = current_energy
 
                         # Verifica se deve pausar por falta de recursos
                         if current_energy <= 10:
@@ -112,7 +157,7 @@ def bot_loop(
                 continue
 
             # Verificação de cura
-            if not healing.verificar_e_curar_hp():
+            if not healing.verificar_e_curar_hp(log_box):
                 # Sem HP suficiente e não conseguiu curar
                 inserir_log(log_box, "⚠️ HP baixo, tentando curar...", "warning")
                 sleep_interrompivel(tempo_aleatorio(10.0, 5.0))
@@ -120,31 +165,96 @@ def bot_loop(
 
             # Vamos verificar se estamos na URL do travel
             if not url_comeca_com("https://web.simple-mmo.com/travel"):
-                # Se não estivermos na página correta, navegar para travel
-                step.navegar_para_travel(log_box)
+                # Fora do travel: concluir a página no lugar ou navegar
+                router.rotear_pagina(log_box)
+                ultimo_fingerprint = None
+                continue
+
+            # Plano da sessão: ordem das atividades pelo valor por segundo
+            plano = (
+                planejador.plano_atual(energia_atual, log_box)
+                if context.obter_configuracao("planejador_ativo")
+                else None
+            )
+            ordem = plano.ordem if plano else list(planejador.ORDEM_FIXA)
+
+            # =========== QUESTS ==========
+            # Quest points perto do máximo: gastar em lote e voltar ao travel
+            if (
+                context.obter_configuracao("modo_quest_ativo")
+                and (plano is None or plano.permite("quest"))
+                and quest.verificar_e_executar_quests(log_box)
+            ):
+                desfecho_step = None
+                ultimo_fingerprint = None
+                continue
+
+            # =========== ARENA ==========
+            # Rodada periódica de arena: oponentes em sequência, depois o travel
+            if (
+                context.obter_configuracao("modo_arena_ativo")
+                and (plano is None or plano.permite("arena"))
+                and arena.verificar_e_executar_arena(log_box)
+            ):
+                desfecho_step = None
+                ultimo_fingerprint = None
                 continue
 
-            # =========== FIGHT ==========
-            modo_attack = context.obter_configuracao("modo_attack_ativo")
-            if modo_attack:
-                botao_attack = fight.localizar_botao_ataque()
-                if botao_attack and fight.processar_ataque(botao_attack, log_box):
-                    # Incrementar contador interno (não usando mais sistema de estatísticas)
-                    sleep_interrompivel(tempo_aleatorio(2.0, 1.0))
+            # Desfecho do último step conhecido pela rede: decide sem consultar o DOM
+            desfecho, desfecho_step = desfecho_step, None
+            npc_decidido = False
+            if desfecho is not None:
+                if desfecho.sem_acao:
+                    ultimo_fingerprint = None
+                    tentativa = step.executar_step(log_box)
+                    if tentativa.deu_passo:
+                        apos_step = True
+                        desfecho_step = tentativa.desfecho
                     continue
+                if desfecho.tipo == "npc" and desfecho.url_acao:
+                    if (
+                        plano is None or plano.permite("luta")
+                    ) and processar_desfecho_npc(desfecho, log_box, plano):
+                        continue
+                    # Encontro já decidido pela rede: o DOM não o avalia de novo
+                    npc_decidido = True
+
+            # Página idêntica à da última decisão: pular detecção e aguardar mudança
+            fingerprint = obter_fingerprint_pagina()
+            if (
+                fingerprint
+                and fingerprint == ultimo_fingerprint
+                and time.time() - momento_fingerprint < MAX_IDADE_FINGERPRINT
+            ):
+                inserir_log(
+                    log_box, "⏸️ Página inalterada, aguardando mudança...", debug=True
+                )
+                aguardar_mudanca_pagina(fingerprint, TIMEOUT_MUDANCA_PAGINA)
+                continue
 
-            # =========== GATHER ==========
-            modo_coleta = context.obter_configuracao("modo_coleta_ativo")
-            if modo_coleta and gather.processar_coleta(log_box):
-                # Incrementar contador interno (não usando mais sistema de estatísticas)
-                sleep_interrompivel(tempo_aleatorio(2.0, 1.0))
+            # Detecção completa roda agora: o fingerprint volta a valer por inteiro
+            momento_fingerprint = time.time()
+            ultimo_fingerprint = fingerprint
+
+            # =========== FIGHT / GATHER ==========
+            # Na ordem do plano; atividades depois do step não valem o tempo
+            agiu = False
+            for atividade in ordem[: ordem.index("step")]:
+                if atividade == "luta" and not npc_decidido:
+                    agiu = executar_luta_travel(log_box, plano)
+                elif atividade == "coleta":
+                    agiu = executar_coleta_travel(log_box)
+                if agiu:
+                    break
+            if agiu:
                 continue
 
             # =========== STEPS ==========
             # Se não encontrou nada para fazer, dar um step
-            if step.dar_step(log_box):
-                # Incrementar contador interno (não usando mais sistema de estatísticas)
-                sleep_interrompivel(tempo_aleatorio(1.0, 0.5))
+            tentativa = step.executar_step(log_box)
+            if tentativa.deu_passo:
+                apos_step = True
+                desfecho_step = tentativa.desfecho
                 continue
             else:
                 # Se falhou no step, aguardar um pouco
@@ -171,9 +281,120 @@ def bot_loop(
             sleep_interrompivel(tempo_aleatorio(5.0, 3.0))
 
     # Cleanup
+    checkpoint.salvar_checkpoint()
     finalizar_driver()
 
 
+def retomar_atividade(atividade: str, log_box=None) -> bool:
+    """Retoma diretamente a atividade salva no checkpoint, se a página permitir.
+
+    Args:
+        atividade: Atividade registrada no checkpoint (fight, gather, quest)
+        log_box: Caixa de log
+
+    Returns:
+        bool: True se alguma atividade foi retomada
+    """
+    if atividade == "fight" and url_comeca_com(
+        "https://web.simple-mmo.com/npcs/attack/"
+    ):
+        inserir_log(log_box, "♻️ Retomando combate do checkpoint...")
+        fight.atacar_inimigo(log_box)
+        return True
+
+    driver = get_driver()
+    if atividade == "gather" and driver and gather.pode_retomar(driver.current_url):
+        inserir_log(log_box, "♻️ Retomando coleta do checkpoint...")
+        gather.executar_coleta_completa(log_box, retomar=True)
+        return True
+
+    if atividade == "quest" and url_comeca_com(quest.PREFIXO_QUEST):
+        inserir_log(log_box, "♻️ Retomando quests do checkpoint...")
+        quest.executar_lote_quests(log_box)
+        return True
+
+    return False
+
+
+def executar_luta_travel(log_box=None, plano: planejador.Plano | None = None) -> bool:
+    """Processa a fila de batalhas ou o encontro visível no travel.
+
+    Args:
+        log_box: Caixa de log
+        plano: Plano da sessão (o step define o valor mínimo do encontro)
+
+    Returns:
+        bool: True se alguma luta foi realizada
+    """
+    if not context.obter_configuracao("modo_attack_ativo"):
+        return False
+
+    # Batalhas pendentes são executadas em lote, sem voltar ao travel
+    if fight.has_queued_fights() and fight.process_queued_fight(log_box):
+        return True
+
+    botao_attack = fight.localizar_botao_ataque()
+    if botao_attack:
+        encontro = politica.ler_encontro(botao_attack)
+        minimo = plano.custo_oportunidade if plano else None
+        if not politica.avaliar_encontro(botao_attack, log_box, encontro, minimo).lutar:
+            # Encontro não compensa: seguir para coleta/step
+            return False
+        if encontro.url and fight.queue_fight_from_travel(
+            encontro.nome, encontro.url, log_box
+        ):
+            lutou = fight.process_queued_fight(log_box)
+            sleep_interrompivel(tempo_aleatorio(2.0, 1.0))
+            return lutou
+    if botao_attack and fight.processar_ataque(botao_attack, log_box):
+        sleep_interrompivel(tempo_aleatorio(2.0, 1.0))
+        return True
+    return False
+
+
+def executar_coleta_travel(log_box=None) -> bool:
+    """Coleta o melhor alvo visível no travel, se a coleta estiver ativa.
+
+    Returns:
+        bool: True se alguma coleta foi realizada
+    """
+    if context.obter_configuracao("modo_coleta_ativo") and gather.processar_coleta(
+        log_box
+    ):
+        sleep_interrompivel(tempo_aleatorio(2.0, 1.0))
+        return True
+    return False
+
+
+def processar_desfecho_npc(
+    desfecho: step.StepOutcome, log_box=None, plano: planejador.Plano | None = None
+) -> bool:
+    """Luta contra o NPC informado pela resposta do step, sem ler o DOM.
+
+    Args:
+        desfecho: Desfecho do step com a URL de ataque do NPC
+        log_box: Caixa de log
+        plano: Plano da sessão (o step define o valor mínimo do encontro)
+
+    Returns:
+        bool: True se a luta foi enfileirada e processada
+    """
+    if not desfecho.url_acao or not context.obter_configuracao("modo_attack_ativo"):
+        return False
+
+    encontro = politica.Encontro(
+        nome=desfecho.nome or "Desconhecido",
+        nivel=desfecho.nivel,
+        url=desfecho.url_acao,
+    )
+    minimo = plano.custo_oportunidade if plano else None
+    if not politica.avaliar_encontro(None, log_box, encontro, minimo).lutar:
+        return False
+    if not fight.queue_fight_from_travel(encontro.nome, encontro.url, log_box):
+        return False
+    return fight.process_queued_fight(log_box)
+
+
 def executar_navegacao_otimizada(log_box, wave_ativo=False):
     """Executa a navegação otimizada na tela do travel.
 
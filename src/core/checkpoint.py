@@ -0,0 +1,129 @@
+"""
+Sistema de Checkpoint SimpleMMO Bot
+
+Este módulo salva periodicamente o estado da sessão (atividade atual,
+progresso da coleta, contadores e parâmetros aprendidos) em disco, de
+forma atômica, para que o bot retome direto no handler certo após um
+reinício em vez de redescobrir tudo.
+"""
+
+from collections.abc import Callable
+import threading
+import time
+from typing import Any
+
+from core import context
+from utils.persistencia import caminho_dados, carregar_json, salvar_json_atomico
+
+ARQUIVO_CHECKPOINT = "checkpoint.json"
+VERSAO_CHECKPOINT = 1
+
+# Intervalo mínimo entre salvamentos periódicos (segundos)
+INTERVALO_CHECKPOINT = 15.0
+
+# Checkpoints mais antigos que isso não são usados para retomar atividade
+VALIDADE_ATIVIDADE = 10 * 60
+
+# Provedores de estado: nome -> (exportar, restaurar)
+_provedores: dict[str, tuple[Callable[[], Any], Callable[[Any], None]]] = {}
+_ultimo_salvamento = 0.0
+_lock = threading.Lock()
+
+
+def registrar_provedor(
+    nome: str, exportar: Callable[[], Any], restaurar: Callable[[Any], None]
+) -> None:
+    """
+    Registra um provedor de estado a ser incluído no checkpoint.
+
+    Args:
+        nome: Chave do estado dentro do checkpoint
+        exportar: Função que retorna o estado serializável em JSON
+        restaurar: Função que recebe o estado salvo e o aplica
+    """
+    with _lock:
+        _provedores[nome] = (exportar, restaurar)
+
+
+def _montar_checkpoint() -> dict[str, Any]:
+    """Monta o dicionário do checkpoint a partir dos provedores."""
+    with _lock:
+        provedores = dict(_provedores)
+
+    estados = {}
+    for nome, (exportar, _) in provedores.items():
+        try:
+            estados[nome] = exportar()
+        except Exception:
+            # Um provedor com erro não impede o restante do checkpoint
+            continue
+
+    return {
+        "versao": VERSAO_CHECKPOINT,
+        "timestamp": time.time(),
+        "atividade": context.obter_atividade(),
+        "contexto": context.exportar_estado(),
+        "estados": estados,
+    }
+
+
+def salvar_checkpoint() -> bool:
+    """Salva o checkpoint imediatamente."""
+    global _ultimo_salvamento
+
+    try:
+        salvar_json_atomico(caminho_dados(ARQUIVO_CHECKPOINT), _montar_checkpoint())
+        _ultimo_salvamento = time.time()
+        return True
+    except Exception:
+        return False
+
+
+def salvar_periodico() -> bool:
+    """Salva o checkpoint apenas se o intervalo mínimo já passou."""
+    if time.time() - _ultimo_salvamento < INTERVALO_CHECKPOINT:
+        return False
+    return salvar_checkpoint()
+
+
+def carregar_checkpoint() -> dict[str, Any] | None:
+    """Carrega o último checkpoint salvo (None se ausente ou incompatível)."""
+    dados = carregar_json(caminho_dados(ARQUIVO_CHECKPOINT))
+    if not isinstance(dados, dict) or dados.get("versao") != VERSAO_CHECKPOINT:
+        return None
+    return dados
+
+
+def restaurar_checkpoint() -> str | None:
+    """
+    Restaura o estado salvo em todos os provedores registrados.
+
+    Returns:
+        A atividade em andamento no momento do checkpoint, se ainda for
+        recente o bastante para ser retomada, ou None
+    """
+    dados = carregar_checkpoint()
+    if not dados:
+        return None
+
+    try:
+        context.restaurar_estado(dados.get("contexto") or {})
+    except Exception:
+        pass
+
+    with _lock:
+        provedores = dict(_provedores)
+
+    estados = dados.get("estados") or {}
+    for nome, (_, restaurar) in provedores.items():
+        if nome not in estados:
+            continue
+        try:
+            restaurar(estados[nome])
+        except Exception:
+            continue
+
+    idade = time.time() - float(dados.get("timestamp", 0))
+    if idade > VALIDADE_ATIVIDADE:
+        return None
+    return dados.get("atividade")
@@ -1,4 +1,5 @@
 import threading
+from typing import Any
 
 # Estados globais do bot
 rodando = False
@@ -8,8 +9,27 @@ thread_bot_iniciada = False
 
 # Configurações dinâmicas do bot (atualizáveis em tempo real)
 configuracoes_bot = {
+    "conta": "padrao",
     "modo_attack_ativo": True,
     "modo_coleta_ativo": True,
+    "modo_combate_pagina": False,
+    "modo_coleta_pagina": False,
+    "modo_quest_ativo": False,
+    "limite_quest": 0.8,
+    "modo_arena_ativo": False,
+    "intervalo_arena": 600.0,
+    "max_lutas_arena": 5,
+    "planejador_ativo": False,
+    "fracao_maxima_arena": 0.25,
+    "pesos_coleta": {},
+    "valor_materiais": {},
+    "intervalo_minimo_ataque": 0.5,
+    "intervalo_minimo_step": 0.5,
+    "captura_rede_step": True,
+    "objetivo": "xp",
+    "valor_minimo_encontro": 0.0,
+    "limite_cura": 80,
+    "intervalo_cura_falha": 300.0,
     "finalizar_bot": False,
 }
 
@@ -17,6 +37,9 @@ configuracoes_bot = {
 cliques = 0
 _em_get_user_gold = False
 
+# Atividade em andamento (fight, gather, step...) usada pelo checkpoint
+atividade_atual: str | None = None
+
 # Threading
 lock = threading.Lock()
 
@@ -52,13 +75,44 @@ def incrementar_cliques() -> None:
         cliques += 1
 
 
-def atualizar_configuracao(chave: str, valor: bool) -> None:
+def definir_atividade(atividade: str | None) -> None:
+    """Define a atividade em andamento (None quando ocioso)."""
+    global atividade_atual
+    with lock:
+        atividade_atual = atividade
+
+
+def obter_atividade() -> str | None:
+    """Retorna a atividade em andamento."""
+    with lock:
+        return atividade_atual
+
+
+def exportar_estado() -> dict:
+    """Exporta contadores e histórico para o checkpoint."""
+    with lock:
+        return {
+            "cliques": cliques,
+            "historico_acoes": [list(item) for item in historico_acoes],
+        }
+
+
+def restaurar_estado(estado: dict) -> None:
+    """Restaura contadores e histórico salvos no checkpoint."""
+    global cliques
+    with lock:
+        cliques = int(estado.get("cliques", cliques))
+        historico = estado.get("historico_acoes") or []
+        historico_acoes[:] = [tuple(item) for item in historico[-50:]]
+
+
+def atualizar_configuracao(chave: str, valor: Any) -> None:
     """Atualiza uma configuração do bot em tempo real."""
     with lock:
         configuracoes_bot[chave] = valor
 
 
-def obter_configuracao(chave: str) -> bool:
+def obter_configuracao(chave: str) -> Any:
     """Obtém uma configuração do bot de forma thread-safe."""
     with lock:
         return configuracoes_bot.get(chave, True)
@@ -0,0 +1,550 @@
+"""
+Estatísticas SimpleMMO Bot
+
+Este módulo registra o histórico das atividades do bot em arquivos JSON
+Lines locais (uma linha por evento, apenas anexando) e oferece consultas
+agregadas sobre esse histórico. Em memória fica apenas a janela de retenção
+recente; os agregados por chave (NPC, tipo de coleta) cobrem o histórico
+inteiro e são atualizados a cada evento.
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable
+import re
+import threading
+import time
+from typing import Any
+
+from utils.persistencia import anexar_jsonl, caminho_dados, ler_jsonl
+
+# Eventos mantidos em memória para consultas (o arquivo guarda o histórico todo)
+RETENCAO_CACHE = 7 * 24 * 3600.0
+
+# Intervalo entre podas do cache (segundos)
+INTERVALO_PODA = 600.0
+
+
+def _momento(evento: dict[str, Any]) -> float:
+    """Timestamp do evento (0 se ausente)."""
+    return evento.get("timestamp", 0)
+
+
+class AgregadoPorChave:
+    """Eventos e somas por chave, atualizados a cada evento sem reler o histórico."""
+
+    def __init__(self, chave: Callable[[dict[str, Any]], str], campos: tuple[str, ...]):
+        self._chave = chave
+        self._campos = campos
+        self._totais: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, evento: dict[str, Any]) -> None:
+        """Soma o evento ao total da sua chave (campos ausentes não contam)."""
+        with self._lock:
+            total = self._totais.setdefault(self._chave(evento), {"eventos": 0})
+            total["eventos"] += 1
+            for campo in self._campos:
+                valor = evento.get(campo)
+                if valor is not None:
+                    total[campo] = total.get(campo, 0.0) + valor
+                    total[f"n_{campo}"] = total.get(f"n_{campo}", 0) + 1
+
+    def totais(self) -> dict[str, dict[str, float]]:
+        """Cópia dos totais por chave."""
+        with self._lock:
+            return {chave: dict(total) for chave, total in self._totais.items()}
+
+
+class RegistroEventos:
+    """
+    Armazena eventos em JSON Lines com cache em memória para consultas.
+
+    O cache guarda, em ordem de timestamp, só os eventos dos últimos `retencao`
+    segundos; as consultas por `desde` recortam o cache por busca binária. Os
+    agregadores recebem cada evento uma vez: os do arquivo ao carregar e os
+    novos ao anexar.
+    """
+
+    def __init__(
+        self,
+        nome_arquivo: str,
+        agregadores: tuple[Callable[[dict[str, Any]], None], ...] = (),
+        retencao: float = RETENCAO_CACHE,
+    ):
+        self.nome_arquivo = nome_arquivo
+        self.retencao = retencao
+        self._agregadores = agregadores
+        self._cache: list[dict[str, Any]] | None = None
+        self._proxima_poda = 0.0
+        self._lock = threading.Lock()
+
+    def _carregar(self) -> list[dict[str, Any]]:
+        """Carrega o arquivo na primeira consulta."""
+        if self._cache is None:
+            self._cache = sorted(
+                ler_jsonl(caminho_dados(self.nome_arquivo)), key=_momento
+            )
+            for evento in self._cache:
+                for agregador in self._agregadores:
+                    agregador(evento)
+        self._podar()
+        return self._cache
+
+    def _podar(self) -> None:
+        """Descarta do cache os eventos fora da retenção (com o lock adquirido)."""
+        agora = time.time()
+        if agora < self._proxima_poda:
+            return
+        self._proxima_poda = agora + INTERVALO_PODA
+        antigos = bisect_left(self._cache, agora - self.retencao, key=_momento)
+        if antigos:
+            del self._cache[:antigos]
+
+    def carregar(self) -> None:
+        """Garante o histórico (e os agregados) carregados."""
+        with self._lock:
+            self._carregar()
+
+    def anexar(self, registro: dict[str, Any]) -> None:
+        """Anexa um evento (o timestamp é preenchido se ausente)."""
+        registro.setdefault("timestamp", time.time())
+        with self._lock:
+            # Carrega antes de gravar: o evento entra no cache e nos agregados
+            # mesmo que a escrita no arquivo falhe
+            self._carregar().append(registro)
+            for agregador in self._agregadores:
+                agregador(registro)
+            try:
+                anexar_jsonl(caminho_dados(self.nome_arquivo), registro)
+            except OSError:
+                pass
+
+    def registros(self, desde: float | None = None) -> list[dict[str, Any]]:
+        """Retorna os eventos retidos (opcionalmente apenas os posteriores a `desde`)."""
+        with self._lock:
+            eventos = self._carregar()
+            if desde is None:
+                return list(eventos)
+            return eventos[bisect_left(eventos, desde, key=_momento) :]
+
+    def __len__(self) -> int:
+        """Quantidade de eventos retidos em memória."""
+        with self._lock:
+            return len(self._carregar())
+
+
+def _media(valores: list[float]) -> float:
+    """Média simples (0 para lista vazia)."""
+    return sum(valores) / len(valores) if valores else 0.0
+
+
+def chave_npc(nome: str | None) -> str:
+    """
+    Nome do NPC normalizado, para que o nome lido no cartão do travel e o
+    da página de combate caiam no mesmo histórico.
+    """
+    texto = re.sub(r"(?:level|lvl)\.?\s*\d+", " ", (nome or "").lower())
+    texto = re.sub(r"[^\w]+", " ", texto)
+    return " ".join(texto.split()) or "desconhecido"
+
+
+# ===============================
+# LUTAS
+# ===============================
+
+
+def _agregado_npc() -> AgregadoPorChave:
+    """Totais de lutas por NPC (chave normalizada)."""
+    return AgregadoPorChave(
+        lambda luta: chave_npc(luta.get("npc")),
+        ("duracao", "ataques", "xp", "gold"),
+    )
+
+
+_lutas_por_npc = _agregado_npc()
+lutas = RegistroEventos("lutas.jsonl", agregadores=(_lutas_por_npc,))
+
+
+def registrar_luta(
+    npc: str,
+    ataques: int,
+    duracao: float,
+    resultado: str,
+    nivel: int | None = None,
+    hp_antes: int | None = None,
+    hp_depois: int | None = None,
+    xp: int | None = None,
+    gold: int | None = None,
+    origem: str = "travel",
+) -> None:
+    """
+    Registra uma luta concluída.
+
+    Args:
+        npc: Nome do NPC
+        ataques: Quantidade de ataques realizados
+        duracao: Duração da luta em segundos
+        resultado: vitoria, saiu, forcado ou erro
+        nivel: Nível do NPC, se visível
+        hp_antes: HP do jogador no início da luta
+        hp_depois: HP do jogador no fim da luta
+        xp: Experiência ganha, se exibida
+        gold: Gold ganho, se exibido
+        origem: travel, arena ou manual
+    """
+    lutas.anexar(
+        {
+            "npc": npc,
+            "nivel": nivel,
+            "ataques": ataques,
+            "duracao": round(duracao, 2),
+            "resultado": resultado,
+            "hp_antes": hp_antes,
+            "hp_depois": hp_depois,
+            "xp": xp,
+            "gold": gold,
+            "origem": origem,
+        }
+    )
+
+
+def tempo_medio_por_npc(
+    desde: float | None = None,
+) -> dict[str, dict[str, float | None]]:
+    """
+    Retorna lutas, duração média, ataques médios e recompensa média por NPC.
+
+    As chaves são normalizadas por chave_npc; lutas sem XP ou gold exibido
+    ficam fora da média correspondente (None se nenhuma o exibiu). Sem `desde`,
+    usa o agregado mantido a cada luta, sem percorrer o histórico.
+    """
+    if desde is None:
+        lutas.carregar()
+        totais = _lutas_por_npc.totais()
+    else:
+        agregado = _agregado_npc()
+        for luta in lutas.registros(desde):
+            agregado(luta)
+        totais = agregado.totais()
+
+    def media(total: dict[str, float], campo: str) -> float | None:
+        return total[campo] / total[f"n_{campo}"] if total.get(f"n_{campo}") else None
+
+    return {
+        npc: {
+            "lutas": total["eventos"],
+            "duracao_media": total.get("duracao", 0.0) / total["eventos"],
+            "ataques_medios": total.get("ataques", 0.0) / total["eventos"],
+            "xp_medio": media(total, "xp"),
+            "gold_medio": media(total, "gold"),
+        }
+        for npc, total in totais.items()
+    }
+
+
+def tempo_por_origem(desde: float | None = None) -> dict[str, dict[str, float]]:
+    """Lutas, tempo total e recompensa total por origem (travel, arena, manual)."""
+    resumo: dict[str, dict[str, float]] = {}
+    for luta in lutas.registros(desde):
+        total = resumo.setdefault(
+            luta.get("origem") or "travel",
+            {"lutas": 0, "duracao": 0.0, "xp": 0.0, "gold": 0.0},
+        )
+        total["lutas"] += 1
+        total["duracao"] += luta.get("duracao", 0)
+        total["xp"] += luta.get("xp") or 0
+        total["gold"] += luta.get("gold") or 0
+    return resumo
+
+
+def lutas_por_hora(janela_horas: float = 1.0) -> float:
+    """Taxa de lutas por hora dentro da janela informada."""
+    desde = time.time() - janela_horas * 3600
+    return len(lutas.registros(desde)) / janela_horas
+
+
+def danos_por_luta(npc: str | None = None, limite: int = 30) -> list[int]:
+    """Dano sofrido (HP antes - HP depois) nas lutas mais recentes."""
+    danos = []
+    chave = chave_npc(npc) if npc is not None else None
+    for luta in reversed(lutas.registros()):
+        if chave is not None and chave_npc(luta.get("npc")) != chave:
+            continue
+        antes, depois = luta.get("hp_antes"), luta.get("hp_depois")
+        if antes is None or depois is None:
+            continue
+        danos.append(max(0, antes - depois))
+        if len(danos) >= limite:
+            break
+    return danos
+
+
+# ===============================
+# CURAS
+# ===============================
+
+curas = RegistroEventos("curas.jsonl")
+
+
+def registrar_cura(motivo: str, duracao: float, sucesso: bool) -> None:
+    """Registra uma cura (motivo: morte ou preventiva) e o tempo gasto."""
+    curas.anexar({"motivo": motivo, "duracao": round(duracao, 2), "sucesso": sucesso})
+
+
+def tempo_perdido_cura(desde: float | None = None) -> dict[str, float]:
+    """Tempo total gasto em curas por motivo."""
+    total: dict[str, float] = {}
+    for cura in curas.registros(desde):
+        motivo = cura.get("motivo") or "desconhecido"
+        total[motivo] = total.get(motivo, 0.0) + cura.get("duracao", 0)
+    return total
+
+
+# ===============================
+# DECISÕES DE ENCONTRO
+# ===============================
+
+decisoes_encontro = RegistroEventos("decisoes_encontro.jsonl")
+
+
+def registrar_decisao_encontro(
+    npc: str, nivel: int | None, lutar: bool, valor_previsto: float | None, motivo: str
+) -> None:
+    """Registra a decisão da política de encontros e o valor previsto."""
+    decisoes_encontro.anexar(
+        {
+            "npc": npc,
+            "nivel": nivel,
+            "lutar": lutar,
+            "valor_previsto": valor_previsto,
+            "motivo": motivo,
+        }
+    )
+
+
+# ===============================
+# COLETAS
+# ===============================
+
+
+def _agregado_tipo_coleta() -> AgregadoPorChave:
+    """Totais de coletas por tipo."""
+    return AgregadoPorChave(
+        lambda coleta: coleta.get("tipo") or "desconhecido",
+        ("quantidade", "duracao", "espera"),
+    )
+
+
+_coletas_por_tipo = _agregado_tipo_coleta()
+coletas = RegistroEventos("coletas.jsonl", agregadores=(_coletas_por_tipo,))
+
+
+def registrar_coleta(
+    tipo: str | None,
+    material: str | None,
+    quantidade: int,
+    duracao: float,
+    espera: float,
+    modo: str = "python",
+) -> None:
+    """
+    Registra uma sessão de coleta (um nó do travel).
+
+    Args:
+        tipo: chop, mine, salvage ou catch
+        material: Nome do material, se visível no travel
+        quantidade: Materiais coletados na sessão
+        duracao: Duração total da sessão em segundos
+        espera: Tempo aguardando o botão gather ficar pronto
+        modo: python ou pagina
+    """
+    coletas.anexar(
+        {
+            "tipo": tipo,
+            "material": material,
+            "quantidade": quantidade,
+            "duracao": round(duracao, 2),
+            "espera": round(espera, 2),
+            "modo": modo,
+        }
+    )
+
+
+def materiais_por_hora(janela_horas: float = 1.0) -> dict[str, float]:
+    """Materiais coletados por hora, por tipo, dentro da janela informada."""
+    desde = time.time() - janela_horas * 3600
+    total: dict[str, float] = {}
+    for coleta in coletas.registros(desde):
+        tipo = coleta.get("tipo") or "desconhecido"
+        total[tipo] = total.get(tipo, 0.0) + coleta.get("quantidade", 0)
+    return {tipo: quantidade / janela_horas for tipo, quantidade in total.items()}
+
+
+def tempo_por_material(desde: float | None = None) -> dict[str, dict[str, float]]:
+    """
+    Retorna sessões, materiais, segundos por material e espera média por tipo.
+
+    Sem `desde`, usa o agregado mantido a cada coleta.
+    """
+    if desde is None:
+        coletas.carregar()
+        totais = _coletas_por_tipo.totais()
+    else:
+        agregado = _agregado_tipo_coleta()
+        for coleta in coletas.registros(desde):
+            agregado(coleta)
+        totais = agregado.totais()
+
+    resumo = {}
+    for tipo, total in totais.items():
+        materiais = total.get("quantidade", 0)
+        duracao = total.get("duracao", 0)
+        espera = total.get("espera", 0)
+        resumo[tipo] = {
+            "sessoes": total["eventos"],
+            "materiais": materiais,
+            "tempo_por_material": duracao / materiais if materiais else 0.0,
+            "espera_por_material": espera / materiais if materiais else 0.0,
+        }
+    return resumo
+
+
+# ===============================
+# PASSOS (STEPS)
+# ===============================
+
+passos = RegistroEventos("passos.jsonl")
+
+
+def registrar_passo(
+    tipo: str,
+    local: str | None = None,
+    xp: int | None = None,
+    gold: int | None = None,
+) -> None:
+    """Registra o desfecho de um step (nada, item, npc, material ou desconhecido)."""
+    registro: dict[str, Any] = {"tipo": tipo}
+    if local:
+        registro["local"] = local
+    if xp:
+        registro["xp"] = xp
+    if gold:
+        registro["gold"] = gold
+    passos.anexar(registro)
+
+
+def taxas_encontro(
+    desde: float | None = None, local: str | None = None
+) -> dict[str, Any]:
+    """
+    Fração de steps por desfecho e recompensa direta média por step.
+
+    Steps sem desfecho conhecido ficam fora das frações.
+    """
+    registros = [
+        p for p in passos.registros(desde) if local is None or p.get("local") == local
+    ]
+    conhecidos = [p for p in registros if p.get("tipo") != "desconhecido"]
+
+    contagem: dict[str, int] = {}
+    for passo in conhecidos:
+        contagem[passo["tipo"]] = contagem.get(passo["tipo"], 0) + 1
+
+    return {
+        "passos": len(registros),
+        "taxas": {tipo: qtd / len(conhecidos) for tipo, qtd in contagem.items()},
+        "xp_medio": _media([p.get("xp") or 0 for p in conhecidos]),
+        "gold_medio": _media([p.get("gold") or 0 for p in conhecidos]),
+    }
+
+
+def encontros_por_hora(janela_horas: float = 1.0) -> dict[str, float]:
+    """Steps por desfecho por hora dentro da janela informada."""
+    desde = time.time() - janela_horas * 3600
+    total: dict[str, float] = {}
+    for passo in passos.registros(desde):
+        tipo = passo.get("tipo") or "desconhecido"
+        total[tipo] = total.get(tipo, 0.0) + 1
+    return {tipo: qtd / janela_horas for tipo, qtd in total.items()}
+
+
+def taxas_por_local(desde: float | None = None) -> dict[str, dict[str, Any]]:
+    """Taxas de encontro separadas por local."""
+    locais = {p.get("local") for p in passos.registros(desde) if p.get("local")}
+    return {local: taxas_encontro(desde, local) for local in locais}
+
+
+# ===============================
+# NAVEGAÇÃO
+# ===============================
+
+navegacoes = RegistroEventos("navegacoes.jsonl")
+
+
+def registrar_navegacao(caminho: str, duracao: float, sucesso: bool) -> None:
+    """Registra uma volta ao travel (caminho: link, historico ou recarga)."""
+    navegacoes.anexar(
+        {"caminho": caminho, "duracao": round(duracao, 2), "sucesso": sucesso}
+    )
+
+
+def tempo_medio_navegacao(desde: float | None = None) -> dict[str, dict[str, float]]:
+    """Tentativas, taxa de sucesso e duração média por caminho de navegação."""
+    por_caminho: dict[str, list[dict[str, Any]]] = {}
+    for navegacao in navegacoes.registros(desde):
+        por_caminho.setdefault(navegacao.get("caminho") or "?", []).append(navegacao)
+
+    return {
+        caminho: {
+            "tentativas": len(registros),
+            "sucesso": _media([1.0 if r.get("sucesso") else 0.0 for r in registros]),
+            "duracao_media": _media(
+                [r.get("duracao", 0) for r in registros if r.get("sucesso")]
+            ),
+        }
+        for caminho, registros in por_caminho.items()
+    }
+
+
+# ===============================
+# QUESTS
+# ===============================
+
+quests = RegistroEventos("quests.jsonl")
+
+
+def registrar_lote_quests(
+    url: str | None, quantidade: int, xp: int, gold: int, duracao: float
+) -> None:
+    """Registra um lote de quests executadas em sequência."""
+    quests.anexar(
+        {
+            "url": url,
+            "quantidade": quantidade,
+            "xp": xp,
+            "gold": gold,
+            "duracao": round(duracao, 2),
+        }
+    )
+
+
+def xp_por_quest(desde: float | None = None) -> dict[str, float]:
+    """XP médio por quest executada, por URL de quest."""
+    total: dict[str, list[float]] = {}
+    for lote in quests.registros(desde):
+        if not lote.get("url") or not lote.get("quantidade"):
+            continue
+        acumulado = total.setdefault(lote["url"], [0.0, 0.0])
+        acumulado[0] += lote.get("xp", 0)
+        acumulado[1] += lote["quantidade"]
+    return {url: xp / qtd for url, (xp, qtd) in total.items() if qtd}
+
+
+def xp_por_hora_atividades(janela_horas: float = 1.0) -> dict[str, float]:
+    """XP obtido por hora em steps, lutas e quests dentro da janela informada."""
+    desde = time.time() - janela_horas * 3600
+    return {
+        "step": sum(p.get("xp") or 0 for p in passos.registros(desde)) / janela_horas,
+        "luta": sum(r.get("xp") or 0 for r in lutas.registros(desde)) / janela_horas,
+        "quest": sum(q.get("xp") or 0 for q in quests.registros(desde)) / janela_horas,
+    }
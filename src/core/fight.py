@@ -6,9 +6,12 @@ incluindo detecção de inimigos, processamento de ataques e
 gerenciamento da fila de batalha.
 """
 
+from collections import deque
+from dataclasses import dataclass
 import logging
 import random
 import time
+from typing import Any
 
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -19,8 +22,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from core.context import registrar_acao
-from driver.actions import clicar_elemento, url_comeca_com
+from core import checkpoint, estatisticas, healing
+from core.battle_queue import BattleQueue, QueuedBattle
+from core.context import definir_atividade, obter_configuracao, registrar_acao
+from driver.actions import (
+    clicar_elemento,
+    configurar_timeout_script,
+    url_comeca_com,
+)
 from driver.manager import get_driver
 from utils.logger import inserir_log
 from utils.timing import sleep_interrompivel
@@ -100,8 +109,318 @@ def aguardar_captcha_combate(log_box=None) -> None:
     inserir_log(log_box, "✅ CAPTCHA do combate resolvido.")
 
 
-def atacar_inimigo(log_box=None) -> bool:
+URL_COMBATE = "https://web.simple-mmo.com/npcs/attack/"
+
+# Seletores de HP na interface de combate (o primeiro visível vence)
+SELETORES_HP_INIMIGO = [
+    "[x-text*='opponent.current_hp']",
+    "[x-text*='npc.current_hp']",
+    "[x-text*='enemy.current_hp']",
+]
+SELETORES_HP_JOGADOR = [
+    "[x-text*='player.current_hp']",
+    "[x-text*='user.current_hp']",
+]
+SELETORES_NOME_NPC = [
+    "[x-text*='opponent.name']",
+    "[x-text*='npc.name']",
+    "[x-text*='enemy.name']",
+]
+SELETORES_NIVEL_NPC = [
+    "[x-text*='opponent.level']",
+    "[x-text*='npc.level']",
+    "[x-text*='enemy.level']",
+]
+
+# Sonda do estado de combate: tudo que o loop de ataque precisa em uma chamada
+SCRIPT_SONDA_COMBATE = """
+const [seletoresInimigo, seletoresJogador, seletoresNome, seletoresNivel] = arguments;
+const visivel = (el) => !!el && el.offsetParent !== null;
+const numero = (seletores) => {
+    for (const seletor of seletores) {
+        for (const el of document.querySelectorAll(seletor)) {
+            const m = el.textContent.replace(/[,.]/g, '').match(/\\d+/);
+            if (m) return parseInt(m[0], 10);
+        }
+    }
+    return null;
+};
+let attack = null, leave = null;
+for (const b of document.querySelectorAll('button')) {
+    const texto = b.textContent.trim();
+    if (!attack && texto === 'Attack') attack = b;
+    else if (!leave && texto.includes('Leave')) leave = b;
+}
+const texto = (seletores) => {
+    for (const seletor of seletores) {
+        const el = document.querySelector(seletor);
+        if (el && el.textContent.trim()) return el.textContent.trim();
+    }
+    return null;
+};
+// Cadência: mede o intervalo entre o clique em Attack e sua reabilitação
+let cad = window.__smmoBotCadencia;
+if (attack && (!cad || cad.botao !== attack)) {
+    const pendente = cad && cad.clique !== null && !attack.disabled ? cad.clique : null;
+    cad = window.__smmoBotCadencia = {botao: attack, clique: null, intervalos: []};
+    if (pendente !== null) cad.intervalos.push(performance.now() - pendente);
+    attack.addEventListener('click', () => { cad.clique = performance.now(); });
+    new MutationObserver(() => {
+        if (!attack.disabled && cad.clique !== null) {
+            cad.intervalos.push(performance.now() - cad.clique);
+            cad.clique = null;
+        }
+    }).observe(attack, {attributes: true, attributeFilter: ['disabled']});
+}
+const captcha = Array.from(document.querySelectorAll("a[href='/i-am-not-a-bot']"))
+    .some((a) => a.textContent.includes('Press here to verify') && visivel(a));
+return {
+    url: window.location.href,
+    captcha: captcha,
+    attack: attack && visivel(attack) && !attack.disabled ? attack : null,
+    leave: leave && visivel(leave) && !leave.disabled ? leave : null,
+    hp_inimigo: numero(seletoresInimigo),
+    hp_jogador: numero(seletoresJogador),
+    nome_npc: texto(seletoresNome),
+    nivel_npc: numero(seletoresNivel),
+    intervalos: cad ? cad.intervalos.splice(0) : [],
+};
+"""
+
+
+@dataclass
+class EstadoCombate:
+    """Resultado da sonda de combate."""
+
+    url: str = ""
+    captcha: bool = False
+    botao_attack: Any = None
+    botao_leave: Any = None
+    hp_inimigo: int | None = None
+    hp_jogador: int | None = None
+    nome_npc: str | None = None
+    nivel_npc: int | None = None
+
+    @property
+    def em_combate(self) -> bool:
+        """Indica se a página atual é a interface de combate."""
+        return self.url.startswith(URL_COMBATE)
+
+    @property
+    def acionavel(self) -> bool:
+        """Indica se o loop de ataque tem algo a fazer com este estado."""
+        return (
+            self.captcha
+            or not self.em_combate
+            or self.botao_leave is not None
+            or self.botao_attack is not None
+        )
+
+    def descricao_hp(self) -> str:
+        """Texto curto com o HP conhecido, para os logs."""
+        if self.hp_inimigo is None and self.hp_jogador is None:
+            return ""
+        return f" (HP inimigo: {self.hp_inimigo}, HP jogador: {self.hp_jogador})"
+
+
+# ========================================
+# CADÊNCIA DE ATAQUE
+# ========================================
+
+
+class CadenciaAtaque:
+    """Distribuição móvel do intervalo entre o clique em Attack e a reabilitação."""
+
+    def __init__(self, tamanho: int = 50, percentil: float = 0.75, padrao: float = 1.0):
+        self.intervalos: deque[float] = deque(maxlen=tamanho)
+        self.percentil = percentil
+        self.padrao = padrao
+
+    def registrar(self, intervalos_ms: list[float]) -> None:
+        """Adiciona intervalos observados (em ms) à distribuição."""
+        for intervalo in intervalos_ms:
+            if 0 < intervalo < 30000:
+                self.intervalos.append(intervalo / 1000)
+
+    def estimativa(self) -> float | None:
+        """Percentil configurado da distribuição (None com poucas amostras)."""
+        if len(self.intervalos) < 3:
+            return None
+        ordenados = sorted(self.intervalos)
+        indice = min(len(ordenados) - 1, int(len(ordenados) * self.percentil))
+        return ordenados[indice]
+
+    def proximo_atraso(self, piso: float) -> float:
+        """Tempo até o próximo clique, para cair logo na reabilitação do botão."""
+        estimativa = self.estimativa()
+        return max(piso, estimativa if estimativa is not None else self.padrao)
+
+    def exportar(self) -> list[float]:
+        """Exporta as amostras para o checkpoint."""
+        return [round(v, 3) for v in self.intervalos]
+
+    def restaurar(self, amostras: list[float]) -> None:
+        """Restaura amostras salvas no checkpoint."""
+        self.intervalos.clear()
+        self.intervalos.extend(float(v) for v in amostras)
+
+
+_cadencia = CadenciaAtaque()
+checkpoint.registrar_provedor(
+    "cadencia_ataque", _cadencia.exportar, _cadencia.restaurar
+)
+
+
+@dataclass
+class LutaAtual:
+    """Dados da luta em andamento, registrados nas estatísticas ao final."""
+
+    ataques: int = 0
+    resultado: str | None = None
+    hp_jogador: int | None = None
+    xp: int | None = None
+    gold: int | None = None
+
+
+_luta_atual = LutaAtual()
+
+
+# Recompensa exibida ao fim da luta ("You have gained 120 EXP and 45 gold")
+SCRIPT_RECOMPENSA_COMBATE = """
+const texto = (document.body.innerText || '').replace(/,/g, '');
+const xp = texto.match(/(\\d+)\\s*(?:exp|xp)\\b/i);
+const gold = texto.match(/(\\d+)\\s*gold\\b/i);
+return {xp: xp ? parseInt(xp[1], 10) : null, gold: gold ? parseInt(gold[1], 10) : null};
+"""
+
+
+def _capturar_recompensa(driver) -> None:
+    """Lê XP e gold ganhos na tela final da luta."""
+    try:
+        dados = driver.execute_script(SCRIPT_RECOMPENSA_COMBATE) or {}
+    except Exception:
+        return
+    _luta_atual.xp = dados.get("xp")
+    _luta_atual.gold = dados.get("gold")
+
+
+def _registrar_ataque() -> None:
+    """Contabiliza um ataque da luta atual."""
+    _luta_atual.ataques += 1
+    registrar_acao("Ataque")
+    checkpoint.salvar_periodico()
+
+
+def resumo_duracao_por_npc() -> dict[str, dict[str, float]]:
+    """Retorna lutas, duração média e ataques médios por NPC."""
+    return estatisticas.tempo_medio_por_npc()
+
+
+def sondar_estado_combate() -> EstadoCombate | None:
+    """Lê captcha, URL, botões Leave/Attack e HP em uma única chamada."""
+    driver = get_driver()
+    if not driver:
+        return None
+
+    try:
+        dados = driver.execute_script(
+            SCRIPT_SONDA_COMBATE,
+            SELETORES_HP_INIMIGO,
+            SELETORES_HP_JOGADOR,
+            SELETORES_NOME_NPC,
+            SELETORES_NIVEL_NPC,
+        )
+    except Exception:
+        return None
+
+    if not dados:
+        return None
+
+    # Intervalos clique -> reabilitação observados desde a última sonda
+    _cadencia.registrar(dados.get("intervalos") or [])
+    if dados.get("hp_jogador") is not None:
+        _luta_atual.hp_jogador = dados["hp_jogador"]
+        healing.registrar_hp(dados["hp_jogador"])
+
+    return EstadoCombate(
+        url=dados.get("url") or "",
+        captcha=bool(dados.get("captcha")),
+        botao_attack=dados.get("attack"),
+        botao_leave=dados.get("leave"),
+        hp_inimigo=dados.get("hp_inimigo"),
+        hp_jogador=dados.get("hp_jogador"),
+        nome_npc=dados.get("nome_npc"),
+        nivel_npc=dados.get("nivel_npc"),
+    )
+
+
+def aguardar_estado_acionavel(
+    timeout: float = 5.0, intervalo: float = 0.25
+) -> EstadoCombate | None:
+    """Repete a sonda até haver algo a fazer (ou o timeout). Retorna o último estado."""
+    inicio = time.time()
+    estado = sondar_estado_combate()
+    while (estado is None or not estado.acionavel) and time.time() - inicio < timeout:
+        sleep_interrompivel(intervalo)
+        estado = sondar_estado_combate()
+    return estado
+
+
+def atacar_inimigo(log_box=None, origem: str = "travel") -> bool:
     """Versão modular para atacar inimigos - CONTAGEM CORRETA."""
+    global _luta_atual
+
+    definir_atividade("fight")
+    _luta_atual = LutaAtual()
+    inicio = time.time()
+    estado_inicial = sondar_estado_combate()
+    nome_npc = (estado_inicial and estado_inicial.nome_npc) or "Desconhecido"
+    nivel_npc = estado_inicial.nivel_npc if estado_inicial else None
+    hp_antes = estado_inicial.hp_jogador if estado_inicial else None
+    sucesso = False
+    try:
+        if obter_configuracao("modo_combate_pagina"):
+            sucesso = _atacar_inimigo_pagina(log_box)
+        else:
+            sucesso = _atacar_inimigo(log_box)
+        return sucesso
+    finally:
+        definir_atividade(None)
+        checkpoint.salvar_checkpoint()
+
+        duracao = time.time() - inicio
+        estatisticas.registrar_luta(
+            npc=nome_npc,
+            ataques=_luta_atual.ataques,
+            duracao=duracao,
+            resultado=_luta_atual.resultado or ("vitoria" if sucesso else "erro"),
+            nivel=nivel_npc,
+            hp_antes=hp_antes,
+            hp_depois=_luta_atual.hp_jogador,
+            xp=_luta_atual.xp,
+            gold=_luta_atual.gold,
+            origem=origem,
+        )
+        resumo = resumo_duracao_por_npc().get(estatisticas.chave_npc(nome_npc))
+        media = f"{resumo['duracao_media']:.1f}s" if resumo else "?"
+        inserir_log(
+            log_box,
+            f"⏱️ Luta contra {nome_npc}: {_luta_atual.ataques} ataques em "
+            f"{duracao:.1f}s (média {media}, cadência "
+            f"{_cadencia.proximo_atraso(_piso_ataque()):.2f}s)",
+        )
+
+
+def _piso_ataque() -> float:
+    """Intervalo mínimo configurado entre ataques (segundos)."""
+    try:
+        return float(obter_configuracao("intervalo_minimo_ataque"))
+    except (TypeError, ValueError):
+        return 0.5
+
+
+def _atacar_inimigo(log_box=None) -> bool:
+    """Implementação de atacar_inimigo."""
     driver = get_driver()
     if not driver:
         inserir_log(log_box, "❌ Driver não iniciado para atacar inimigo.")
@@ -120,69 +439,58 @@ def atacar_inimigo(log_box=None) -> bool:
             and timeout_sem_botao < max_timeout_sem_botao
         ):
             try:
+                # Uma única sonda por iteração: captcha, URL, Leave, Attack e HP
+                estado = aguardar_estado_acionavel(timeout=5)
+
+                if estado is None:
+                    timeout_sem_botao += 1
+                    sleep_interrompivel(0.5)
+                    continue
+
                 # VERIFICA CAPTCHA PRIMEIRO
-                if verificar_captcha_combate():
+                if estado.captcha:
                     aguardar_captcha_combate(log_box)
                     continue
 
                 # Verifica se ainda está na interface de combate
-                if not url_comeca_com("https://web.simple-mmo.com/npcs/attack/"):
+                if not estado.em_combate:
                     inserir_log(
                         log_box, "🔄 Saiu da interface de combate automaticamente"
                     )
+                    _luta_atual.resultado = "saiu"
                     # RETORNA TRUE INDICANDO QUE O COMBATE FOI CONCLUÍDO
                     return True
 
                 # Verifica se há botão Leave disponível ANTES de tentar atacar
-                try:
-                    leave_btn = driver.find_element(
-                        By.XPATH, "//button[contains(text(), 'Leave')]"
-                    )
-                    if leave_btn.is_displayed() and leave_btn.is_enabled():
-                        inserir_log(log_box, "🏁 Combate finalizado, saindo...")
-                        leave_btn.click()
-                        sleep_interrompivel(2)
-                        # RETORNA TRUE INDICANDO QUE VENCEU O COMBATE
-                        return True
-                except NoSuchElementException:
-                    pass
-
-                # Aguarda explicitamente o botão de ataque ficar clicável
-                try:
-                    botao_ataque = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable(
-                            (
-                                By.XPATH,
-                                "//button[normalize-space(text())='Attack' and not(@disabled)]",
-                            )
-                        )
-                    )
-
-                    timeout_sem_botao = 0
-                    botao_ataque.click()
-                    ataques_realizados += 1
-                    inserir_log(log_box, f"⚔️ Ataque {ataques_realizados} executado")
-                    registrar_acao("Ataque")
-
-                    tempo_espera = random.uniform(1.0, 1.8)
-                    sleep_interrompivel(tempo_espera)
+                if estado.botao_leave is not None:
+                    inserir_log(log_box, "🏁 Combate finalizado, saindo...")
+                    _capturar_recompensa(driver)
+                    estado.botao_leave.click()
+                    sleep_interrompivel(2)
+                    # RETORNA TRUE INDICANDO QUE VENCEU O COMBATE
+                    return True
 
-                except TimeoutException:
+                if estado.botao_attack is None:
                     timeout_sem_botao += 1
                     inserir_log(
                         log_box,
                         f"⏰ Timeout aguardando botão ({timeout_sem_botao}/{max_timeout_sem_botao})",
                     )
-
-                    if not url_comeca_com("https://web.simple-mmo.com/npcs/attack/"):
-                        inserir_log(
-                            log_box, "🔄 Saiu da interface de combate (timeout)"
-                        )
-                        return True
-
                     sleep_interrompivel(0.5)
                     continue
 
+                timeout_sem_botao = 0
+                estado.botao_attack.click()
+                ataques_realizados += 1
+                inserir_log(
+                    log_box,
+                    f"⚔️ Ataque {ataques_realizados} executado{estado.descricao_hp()}",
+                )
+                _registrar_ataque()
+
+                # Próximo clique agendado para a reabilitação observada do botão
+                sleep_interrompivel(_cadencia.proximo_atraso(_piso_ataque()))
+
             except StaleElementReferenceException:
                 inserir_log(log_box, "🔄 Elemento obsoleto, recarregando...")
                 sleep_interrompivel(0.5)
@@ -191,37 +499,234 @@ def atacar_inimigo(log_box=None) -> bool:
                 inserir_log(log_box, f"⚠️ Erro durante ataque: {e}")
                 break
 
-        # Tenta sair da luta
-        try:
-            leave_btn = WebDriverWait(driver, 3).until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, "//button[contains(text(), 'Leave')]")
-                )
+        return _sair_da_luta(driver, ataques_realizados, log_box)
+
+    except Exception as e:
+        inserir_log(log_box, f"❌ Erro geral no combate: {e}", "error")
+        return False
+
+
+def _sair_da_luta(driver, ataques_realizados: int, log_box=None) -> bool:
+    """Tenta sair da luta pelo Leave; se não aparecer, força navegação ao travel."""
+    try:
+        leave_btn = WebDriverWait(driver, 3).until(
+            EC.element_to_be_clickable(
+                (By.XPATH, "//button[contains(text(), 'Leave')]")
             )
-            leave_btn.click()
-            inserir_log(log_box, f"🚪 Saiu da luta após {ataques_realizados} ataques")
-            sleep_interrompivel(1.5)
-            # RETORNA TRUE APENAS SE CONSEGUIU SAIR NORMALMENTE (VITÓRIA)
-            return True
-        except TimeoutException:
-            inserir_log(log_box, "🔄 Forçando navegação para travel...")
-            try:
-                driver.get("https://web.simple-mmo.com/travel")
-                sleep_interrompivel(2)
-                inserir_log(log_box, "✅ Retornou à página de travel")
-                # RETORNA FALSE POIS TEVE QUE FORÇAR SAÍDA (POSSIVELMENTE PERDEU)
-                return False
-            except Exception as e:
-                inserir_log(log_box, f"❌ Erro ao forçar navegação: {e}")
-                return False
+        )
+        _capturar_recompensa(driver)
+        leave_btn.click()
+        inserir_log(log_box, f"🚪 Saiu da luta após {ataques_realizados} ataques")
+        sleep_interrompivel(1.5)
+        # RETORNA TRUE APENAS SE CONSEGUIU SAIR NORMALMENTE (VITÓRIA)
+        return True
+    except TimeoutException:
+        inserir_log(log_box, "🔄 Forçando navegação para travel...")
+        _luta_atual.resultado = "forcado"
+        try:
+            driver.get("https://web.simple-mmo.com/travel")
+            sleep_interrompivel(2)
+            inserir_log(log_box, "✅ Retornou à página de travel")
+            # RETORNA FALSE POIS TEVE QUE FORÇAR SAÍDA (POSSIVELMENTE PERDEU)
+            return False
         except Exception as e:
-            inserir_log(log_box, f"⚠️ Erro ao sair da luta: {e}")
+            inserir_log(log_box, f"❌ Erro ao forçar navegação: {e}")
             return False
-
     except Exception as e:
-        inserir_log(log_box, f"❌ Erro geral no combate: {e}", "error")
+        inserir_log(log_box, f"⚠️ Erro ao sair da luta: {e}")
+        return False
+
+
+# ========================================
+# MODO DE COMBATE NA PÁGINA (page-side)
+# ========================================
+
+# Intervalo mínimo entre cliques da rotina na página (ms) e variação aleatória
+INTERVALO_MINIMO_PAGINA_MS = 600
+VARIACAO_PAGINA_MS = 400
+
+# Limites de supervisão do lado Python
+TIMEOUT_COMBATE_PAGINA = 180.0
+LONG_POLL_COMBATE_PAGINA = 3.0
+INTERVALO_SUPERVISAO = 1.0
+MAX_REINJECOES = 3
+
+# Rotina injetada: clica Attack assim que reabilita e para em Leave, captcha
+# ou limite. O progresso fica em window.__smmoBotCombate para leitura barata.
+SCRIPT_COMBATE_PAGINA = """
+const [maxAtaques, intervaloMinimo, variacao] = arguments;
+const anterior = window.__smmoBotCombate;
+if (anterior && anterior.timer) clearInterval(anterior.timer);
+const visivel = (el) => !!el && el.offsetParent !== null;
+const estado = {
+    status: 'rodando', ataques: 0, inicio: Date.now(), ultimoClique: 0,
+    proximoAtraso: 0, timer: null,
+};
+const botao = (teste) => {
+    for (const b of document.querySelectorAll('button')) {
+        if (teste(b.textContent.trim()) && visivel(b) && !b.disabled) return b;
+    }
+    return null;
+};
+const parar = (status) => { estado.status = status; clearInterval(estado.timer); };
+estado.timer = setInterval(() => {
+    if (estado.status !== 'rodando') return;
+    const captcha = Array.from(document.querySelectorAll("a[href='/i-am-not-a-bot']"))
+        .some((a) => a.textContent.includes('Press here to verify') && visivel(a));
+    if (captcha) return parar('captcha');
+    if (botao((t) => t.includes('Leave'))) return parar('leave');
+    if (estado.ataques >= maxAtaques) return parar('limite');
+    const attack = botao((t) => t === 'Attack');
+    const agora = Date.now();
+    if (attack && agora - estado.ultimoClique >= estado.proximoAtraso) {
+        attack.click();
+        estado.ataques += 1;
+        estado.ultimoClique = agora;
+        estado.proximoAtraso = intervaloMinimo + Math.random() * variacao;
+    }
+}, 100);
+window.__smmoBotCombate = estado;
+return true;
+"""
+
+# Long-poll: resolve quando os ataques ou o status mudam (ou no timeout)
+SCRIPT_AGUARDAR_COMBATE_PAGINA = """
+const [timeoutMs, seletoresJogador, ataquesVistos, statusVisto] = arguments;
+const callback = arguments[arguments.length - 1];
+const ler = () => {
+    const e = window.__smmoBotCombate;
+    let hp = null;
+    for (const seletor of seletoresJogador) {
+        const el = document.querySelector(seletor);
+        const m = el && el.textContent.replace(/[,.]/g, '').match(/\\d+/);
+        if (m) { hp = parseInt(m[0], 10); break; }
+    }
+    return {
+        url: window.location.href,
+        estado: e ? {status: e.status, ataques: e.ataques} : null,
+        hp_jogador: hp,
+    };
+};
+const inicio = Date.now();
+const timer = setInterval(() => {
+    const leitura = ler();
+    const e = leitura.estado;
+    if (!e || e.ataques !== ataquesVistos || e.status !== statusVisto
+            || Date.now() - inicio >= timeoutMs) {
+        clearInterval(timer);
+        callback(leitura);
+    }
+}, 100);
+"""
+
+SCRIPT_PARAR_COMBATE_PAGINA = """
+const e = window.__smmoBotCombate;
+if (e) { clearInterval(e.timer); e.status = 'parado'; }
+"""
+
+
+def _injetar_combate_pagina(driver, max_ataques: int) -> bool:
+    """Injeta a rotina de ataque na página."""
+    try:
+        return bool(
+            driver.execute_script(
+                SCRIPT_COMBATE_PAGINA,
+                max_ataques,
+                max(INTERVALO_MINIMO_PAGINA_MS, _piso_ataque() * 1000),
+                VARIACAO_PAGINA_MS,
+            )
+        )
+    except Exception:
+        return False
+
+
+def _atacar_inimigo_pagina(log_box=None) -> bool:
+    """Combate conduzido por uma rotina na página, supervisionada pelo Python."""
+    driver = get_driver()
+    if not driver:
+        inserir_log(log_box, "❌ Driver não iniciado para atacar inimigo.")
         return False
 
+    max_ataques = 100
+    ataques_realizados = 0
+    ataques_injecao = 0
+    status_visto = "rodando"
+    reinjecoes = 0
+
+    inserir_log(log_box, "⚔️ Iniciando combate na página...", forcar=True)
+    if not _injetar_combate_pagina(driver, max_ataques):
+        inserir_log(log_box, "⚠️ Falha ao injetar rotina, usando combate padrão")
+        return _atacar_inimigo(log_box)
+
+    inicio = time.time()
+    try:
+        while time.time() - inicio < TIMEOUT_COMBATE_PAGINA:
+            try:
+                configurar_timeout_script(driver)
+                leitura = driver.execute_async_script(
+                    SCRIPT_AGUARDAR_COMBATE_PAGINA,
+                    int(LONG_POLL_COMBATE_PAGINA * 1000),
+                    SELETORES_HP_JOGADOR,
+                    ataques_injecao,
+                    status_visto,
+                )
+            except Exception:
+                # Navegação durante o long-poll: a próxima leitura decide
+                sleep_interrompivel(INTERVALO_SUPERVISAO)
+                continue
+            if not leitura:
+                continue
+
+            # HP do jogador acompanha a luta (hp_depois e histórico de dano)
+            if leitura.get("hp_jogador") is not None:
+                _luta_atual.hp_jogador = leitura["hp_jogador"]
+                healing.registrar_hp(leitura["hp_jogador"])
+
+            if not (leitura.get("url") or "").startswith(URL_COMBATE):
+                inserir_log(log_box, "🔄 Saiu da interface de combate automaticamente")
+                _luta_atual.resultado = "saiu"
+                return True
+
+            estado = leitura.get("estado")
+            if estado is None:
+                # Página recarregou: a rotina se perdeu, injeta de novo
+                reinjecoes += 1
+                if reinjecoes > MAX_REINJECOES:
+                    break
+                ataques_injecao = 0
+                status_visto = "rodando"
+                _injetar_combate_pagina(driver, max_ataques - ataques_realizados)
+                continue
+
+            # Contabiliza ataques novos desde a última leitura
+            novos = int(estado.get("ataques", 0)) - ataques_injecao
+            if novos > 0:
+                ataques_injecao += novos
+                ataques_realizados += novos
+                for _ in range(novos):
+                    _registrar_ataque()
+                inserir_log(log_box, f"⚔️ {ataques_realizados} ataques executados")
+
+            status = status_visto = estado.get("status")
+            if status == "captcha":
+                aguardar_captcha_combate(log_box)
+                ataques_injecao = 0
+                status_visto = "rodando"
+                _injetar_combate_pagina(driver, max_ataques - ataques_realizados)
+            elif status in ("leave", "limite"):
+                inserir_log(log_box, "🏁 Combate finalizado, saindo...")
+                break
+
+        if time.time() - inicio >= TIMEOUT_COMBATE_PAGINA:
+            inserir_log(log_box, "⏰ Tempo limite do combate na página atingido")
+    finally:
+        try:
+            driver.execute_script(SCRIPT_PARAR_COMBATE_PAGINA)
+        except Exception:
+            pass
+
+    return _sair_da_luta(driver, ataques_realizados, log_box)
+
 
 def verificar_attack_disponivel_pagina_principal():
     """Verifica se há botão de ataque disponível na página principal."""
@@ -292,10 +797,18 @@ def localizar_botao_ataque():
 # BATTLE QUEUE INTEGRATION (Inspirado no JavaScript Bot)
 # ========================================
 
+# Batalhas executadas em sequência por lote (sem voltar ao travel entre elas)
+TAMANHO_LOTE_BATALHAS = 5
+
+_fila_batalhas = BattleQueue()
+checkpoint.registrar_provedor(
+    "fila_batalhas", _fila_batalhas.exportar, _fila_batalhas.restaurar
+)
+
 
 def queue_fight_from_travel(enemy_name: str, url: str, log_box=None) -> bool:
     """
-    Executa batalha encontrada durante travel diretamente (sem fila)
+    Enfileira uma batalha encontrada durante o travel
 
     Args:
         enemy_name: Nome do inimigo
@@ -303,31 +816,17 @@ def queue_fight_from_travel(enemy_name: str, url: str, log_box=None) -> bool:
         log_box: Widget de log
 
     Returns:
-        True se executou a batalha
+        True se a batalha entrou na fila
     """
-    try:
-        inserir_log(log_box, f"⚔️ Iniciando batalha: {enemy_name}")
-
-        # Navegar para a URL da batalha
-        driver = get_driver()
-        if not driver:
-            inserir_log(log_box, "❌ Driver não disponível para batalha", "error")
-            return False
-
-        driver.get(url)
-        sleep_interrompivel(2.0)
-
-        # Executar batalha
-        return atacar_inimigo(log_box)
-
-    except Exception as e:
-        inserir_log(log_box, f"❌ Erro na batalha: {e}", "error")
-        return False
+    adicionada = _fila_batalhas.adicionar(url, enemy_name, "travel")
+    if adicionada:
+        inserir_log(log_box, f"📥 Batalha enfileirada: {enemy_name}")
+    return adicionada
 
 
 def queue_arena_fight(enemy_name: str, url: str, log_box=None) -> bool:
     """
-    Executa batalha de arena diretamente (sem fila)
+    Enfileira uma batalha de arena
 
     Args:
         enemy_name: Nome do inimigo
@@ -335,52 +834,93 @@ def queue_arena_fight(enemy_name: str, url: str, log_box=None) -> bool:
         log_box: Widget de log
 
     Returns:
-        True se executou a batalha
+        True se a batalha entrou na fila
     """
-    try:
-        inserir_log(log_box, f"⚔️ Iniciando batalha de arena: {enemy_name}")
+    adicionada = _fila_batalhas.adicionar(url, enemy_name, "arena")
+    if adicionada:
+        inserir_log(log_box, f"📥 Batalha de arena enfileirada: {enemy_name}")
+    return adicionada
 
-        # Navegar para a URL da batalha
-        driver = get_driver()
-        if not driver:
-            inserir_log(log_box, "❌ Driver não disponível para batalha", "error")
-            return False
 
-        driver.get(url)
-        sleep_interrompivel(2.0)
+def queue_manual_fight(url: str, enemy_name: str = "Manual", log_box=None) -> bool:
+    """
+    Enfileira uma batalha adicionada manualmente pela URL
 
-        # Executar batalha
-        return atacar_inimigo(log_box)
+    Returns:
+        True se a batalha entrou na fila
+    """
+    adicionada = _fila_batalhas.adicionar(url, enemy_name, "manual")
+    if adicionada:
+        inserir_log(log_box, f"📥 Batalha manual enfileirada: {url}")
+    return adicionada
 
-    except Exception as e:
-        inserir_log(log_box, f"❌ Erro na batalha de arena: {e}", "error")
+
+def _executar_batalha_url(batalha: QueuedBattle, log_box=None) -> bool:
+    """Navega direto para a URL da batalha e luta."""
+    driver = get_driver()
+    if not driver:
+        inserir_log(log_box, "❌ Driver não disponível para batalha", "error")
         return False
 
+    inserir_log(
+        log_box, f"⚔️ Iniciando batalha ({batalha.origem}): {batalha.enemy_name}"
+    )
+    driver.get(batalha.url)
+
+    estado = aguardar_estado_acionavel(timeout=10)
+    if estado is None or not estado.em_combate:
+        inserir_log(log_box, f"⚠️ Batalha indisponível: {batalha.enemy_name}")
+        return False
 
-def process_queued_fight(log_box=None) -> bool:
+    return atacar_inimigo(log_box, batalha.origem)
+
+
+def process_queued_fight(
+    log_box=None, tamanho_lote: int = TAMANHO_LOTE_BATALHAS
+) -> bool:
     """
-    Função mantida para compatibilidade - agora apenas processa ataques diretos
+    Processa um lote de batalhas da fila, uma após a outra
 
     Returns:
-        True se processou um ataque
+        True se ao menos uma batalha do lote foi de fato lutada
     """
-    try:
-        # Verificar se há botão de attack disponível na página atual
-        botao_attack = verificar_attack_disponivel_pagina_principal()
-        if botao_attack:
-            return processar_ataque(botao_attack, log_box)
-        return False
+    _, lutadas = executar_lote_batalhas(log_box, tamanho_lote)
+    return lutadas > 0
 
-    except Exception as e:
-        inserir_log(log_box, f"❌ Erro ao processar ataque: {e}", "error")
-        return False
+
+def executar_lote_batalhas(
+    log_box=None, tamanho_lote: int = TAMANHO_LOTE_BATALHAS, origem: str | None = None
+) -> tuple[int, int]:
+    """
+    Retira um lote da fila (opcionalmente só de uma origem) e executa as batalhas
+
+    Returns:
+        Tupla (batalhas processadas sem erro, lutas efetivamente travadas)
+    """
+    lote = _fila_batalhas.retirar_lote(tamanho_lote, origem)
+    if not lote:
+        return 0, 0
+
+    inserir_log(log_box, f"📤 Processando lote de {len(lote)} batalha(s)")
+    processadas = lutadas = 0
+    for batalha in lote:
+        if verificar_captcha_combate():
+            aguardar_captcha_combate(log_box)
+        try:
+            if _executar_batalha_url(batalha, log_box):
+                lutadas += 1
+            processadas += 1
+        except Exception as e:
+            inserir_log(log_box, f"❌ Erro na batalha: {e}", "error")
+
+    return processadas, lutadas
 
 
 def has_queued_fights() -> bool:
-    """Função mantida para compatibilidade - sempre retorna False (sem fila)"""
-    return False
+    """Indica se há batalhas válidas na fila."""
+    return len(_fila_batalhas) > 0
 
 
 def get_battle_queue_status() -> str:
-    """Função mantida para compatibilidade - sem fila"""
-    return "Sistema de fila removido - batalhas executadas diretamente"
+    """Resumo textual da fila de batalhas."""
+    return _fila_batalhas.status()
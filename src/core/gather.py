@@ -3,6 +3,7 @@ Módulo de coleta otimizado para SimpleMMO.
 Versão melhorada com separação de responsabilidades e melhor performance.
 """
 
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 import random
@@ -18,10 +19,22 @@ from selenium.common.exceptions import (
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 
-from core.context import registrar_acao
-from driver.actions import buscar_botao_por_texto, clicar_elemento, url_comeca_com
+from core import checkpoint, estatisticas
+from core.context import (
+    definir_atividade,
+    obter_atividade,
+    obter_configuracao,
+    registrar_acao,
+)
+from driver.actions import (
+    buscar_botao_por_texto,
+    clicar_elemento,
+    configurar_timeout_script,
+    url_comeca_com,
+)
 from driver.manager import get_driver
 from utils.logger import inserir_log
+from utils.persistencia import caminho_dados, carregar_json, salvar_json_atomico
 from utils.timing import sleep_interrompivel
 
 # ===============================
@@ -63,6 +76,10 @@ class GatherState:
     status: GatherStatus = GatherStatus.SUCCESS
     is_gathering: bool = False
     last_gather_time: float = 0.0
+    material: str | None = None
+    tipo: str | None = None
+    tempo_espera: float = 0.0
+    url: str | None = None
 
 
 @dataclass
@@ -70,9 +87,14 @@ class GatherConfig:
     """Configuração de coleta."""
 
     cooldown_time: float = 0.5
-    max_wait_time: int = 6
+    max_wait_time: float = 7.0  # Entrada na interface após o clique no travel
+    # Orçamento de tentativas, não um tempo: fica fora do ajuste automático
     max_consecutive_failures: int = 3
     check_interval: float = 0.3
+    ready_timeout: float = 15.0
+    close_wait_time: float = 8.0
+    retry_delay: float = 2.0
+    post_click_delay: float = 1.5
 
 
 # ===============================
@@ -82,10 +104,209 @@ class GatherConfig:
 _gather_state = GatherState()
 _gather_config = GatherConfig()
 
+# URL da coleta interrompida cujo progresso veio do checkpoint
+_url_retomada: str | None = None
+
+
+def _exportar_estado_coleta() -> dict[str, Any]:
+    """Exporta o progresso da coleta para o checkpoint."""
+    return {
+        "materials_available": _gather_state.materials_available,
+        "materials_collected": _gather_state.materials_collected,
+        "material": _gather_state.material,
+        "tipo": _gather_state.tipo,
+        "url": _gather_state.url,
+        "em_andamento": obter_atividade() == "gather",
+    }
+
+
+def _restaurar_estado_coleta(estado: dict[str, Any]) -> None:
+    """Restaura o progresso da coleta salvo no checkpoint."""
+    global _url_retomada
+
+    _gather_state.materials_available = estado.get("materials_available")
+    _gather_state.materials_collected = int(estado.get("materials_collected", 0))
+    _gather_state.material = estado.get("material")
+    _gather_state.tipo = estado.get("tipo")
+    _gather_state.url = estado.get("url")
+    _url_retomada = estado.get("url") if estado.get("em_andamento") else None
+
+
+def pode_retomar(url: str | None) -> bool:
+    """Indica se o progresso restaurado do checkpoint é o da coleta nesta URL."""
+    return bool(url) and url == _url_retomada
+
+
+def reiniciar_estado_coleta() -> None:
+    """Descarta o progresso de uma coleta anterior antes de iniciar outra."""
+    global _url_retomada
+
+    _url_retomada = None
+    _gather_state.materials_available = None
+    _gather_state.materials_collected = 0
+    _gather_state.material = None
+    _gather_state.tipo = None
+    _gather_state.url = None
+
+
+checkpoint.registrar_provedor(
+    "gather", _exportar_estado_coleta, _restaurar_estado_coleta
+)
+
+# ===============================
+# AJUSTE AUTOMÁTICO DA CONFIGURAÇÃO
+# ===============================
+
+# Limites de segurança de cada parâmetro ajustado (segundos)
+LIMITES_AJUSTE = {
+    "cooldown_time": (0.3, 1.0),
+    "check_interval": (0.1, 0.5),
+    "ready_timeout": (4.0, 20.0),
+    "close_wait_time": (2.0, 8.0),
+    "retry_delay": (0.5, 2.0),
+    "post_click_delay": (0.3, 2.5),
+    "max_wait_time": (3.0, 10.0),
+}
+
+MIN_AMOSTRAS_AJUSTE = 10
+MARGEM_AJUSTE = 1.5
+
+# Mudança relativa mínima para aplicar e relatar um novo valor
+VARIACAO_MINIMA_AJUSTE = 0.05
+
+
+def _percentil(valores: list[float], percentil: float) -> float:
+    """Percentil simples de uma lista não vazia."""
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * percentil))]
+
+
+class AjusteColeta:
+    """
+    Aprende os tempos da GatherConfig a partir das esperas observadas.
+
+    Amostras: tempo do clique até o botão gather voltar a ficar pronto,
+    tempo do último clique até o botão close aparecer e tempo do clique no
+    travel até a interface de coleta abrir. Os parâmetros e as amostras são
+    persistidos por conta.
+    """
+
+    def __init__(self, config: GatherConfig, tamanho: int = 200):
+        self.config = config
+        self.pronto: deque[float] = deque(maxlen=tamanho)
+        self.close: deque[float] = deque(maxlen=tamanho)
+        self.entrada: deque[float] = deque(maxlen=tamanho)
+        self.conta: str | None = None
+
+    def _arquivo(self) -> str:
+        conta = re.sub(r"[^\w-]", "_", self.conta or "padrao")
+        return f"ajuste_coleta_{conta}.json"
+
+    def carregar_conta(self) -> None:
+        """Carrega parâmetros e amostras da conta configurada (se mudou)."""
+        conta = obter_configuracao("conta")
+        conta = conta if isinstance(conta, str) and conta else "padrao"
+        if conta == self.conta:
+            return
+
+        self.conta = conta
+        dados = carregar_json(caminho_dados(self._arquivo()), {})
+        self.pronto.clear()
+        self.pronto.extend(float(v) for v in dados.get("pronto", []))
+        self.close.clear()
+        self.close.extend(float(v) for v in dados.get("close", []))
+        self.entrada.clear()
+        self.entrada.extend(float(v) for v in dados.get("entrada", []))
+
+        padrao = GatherConfig()
+        for campo, (minimo, maximo) in LIMITES_AJUSTE.items():
+            valor = dados.get("config", {}).get(campo, getattr(padrao, campo))
+            setattr(self.config, campo, min(maximo, max(minimo, float(valor))))
+
+    def registrar_pronto(self, segundos: float) -> None:
+        """Tempo do clique até o botão gather voltar a ficar pronto."""
+        if 0 < segundos < 60:
+            self.pronto.append(segundos)
+
+    def registrar_close(self, segundos: float) -> None:
+        """Tempo do último clique até o botão close aparecer."""
+        if 0 < segundos < 60:
+            self.close.append(segundos)
+
+    def registrar_entrada(self, segundos: float) -> None:
+        """Tempo do clique no travel até a interface de coleta abrir."""
+        if 0 < segundos < 60:
+            self.entrada.append(segundos)
+
+    def _propostas(self) -> dict[str, float]:
+        """Novos valores estimados das distribuições observadas."""
+        propostas = {}
+        if len(self.pronto) >= MIN_AMOSTRAS_AJUSTE:
+            pronto = list(self.pronto)
+            mediana = _percentil(pronto, 0.5)
+            propostas["ready_timeout"] = _percentil(pronto, 0.99) * MARGEM_AJUSTE
+            propostas["post_click_delay"] = _percentil(pronto, 0.1) * 0.8
+            propostas["cooldown_time"] = min(pronto) * 0.8
+            propostas["retry_delay"] = mediana
+            propostas["check_interval"] = mediana / 10
+        if len(self.close) >= MIN_AMOSTRAS_AJUSTE:
+            propostas["close_wait_time"] = (
+                _percentil(list(self.close), 0.99) * MARGEM_AJUSTE
+            )
+        if len(self.entrada) >= MIN_AMOSTRAS_AJUSTE:
+            propostas["max_wait_time"] = (
+                _percentil(list(self.entrada), 0.99) * MARGEM_AJUSTE
+            )
+        return propostas
+
+    def ajustar(self, log_box: tk.Text | None = None) -> dict[str, tuple[float, float]]:
+        """
+        Aplica os novos valores (dentro dos limites), relata e persiste.
+
+        Returns:
+            Parâmetro -> (valor antigo, valor novo) para os que mudaram
+        """
+        mudancas = {}
+        for campo, valor in self._propostas().items():
+            minimo, maximo = LIMITES_AJUSTE[campo]
+            novo = round(min(maximo, max(minimo, valor)), 2)
+            antigo = getattr(self.config, campo)
+            if abs(novo - antigo) > antigo * VARIACAO_MINIMA_AJUSTE:
+                setattr(self.config, campo, novo)
+                mudancas[campo] = (antigo, novo)
+
+        if mudancas:
+            detalhes = ", ".join(
+                f"{campo} {antigo:.2f}s → {novo:.2f}s"
+                for campo, (antigo, novo) in mudancas.items()
+            )
+            inserir_log(log_box, f"🔧 Tempos de coleta ajustados: {detalhes}")
+
+        self.salvar()
+        return mudancas
+
+    def salvar(self) -> None:
+        """Persiste parâmetros e amostras da conta atual."""
+        dados = {
+            "config": {campo: getattr(self.config, campo) for campo in LIMITES_AJUSTE},
+            "pronto": [round(v, 3) for v in self.pronto],
+            "close": [round(v, 3) for v in self.close],
+            "entrada": [round(v, 3) for v in self.entrada],
+        }
+        try:
+            salvar_json_atomico(caminho_dados(self._arquivo()), dados)
+        except OSError:
+            pass
+
+
+_ajuste_coleta = AjusteColeta(_gather_config)
+
 # ===============================
 # SELETORES XPATH CENTRALIZADOS
 # ===============================
 
+URL_COLETA = "https://web.simple-mmo.com/crafting/material/gather/"
+
 
 class XPathSelectors:
     """Centralizador de seletores XPath."""
@@ -99,6 +320,169 @@ class XPathSelectors:
     LEGACY_GATHER_BUTTON = "//button[.//span[contains(text(),'Press here to gather')]]"
 
 
+# ===============================
+# MEMO DE NÍVEL INSUFICIENTE
+# ===============================
+
+ARQUIVO_MEMO_NIVEL = "memo_nivel_coleta.json"
+
+# Entradas sem confirmação de level-up expiram após este tempo
+VALIDADE_MEMO_NIVEL = 24 * 3600
+
+# Nível exigido na mensagem de nível insuficiente e level-up exibido na coleta
+SCRIPT_NIVEIS_COLETA = """
+const texto = document.body.innerText || '';
+const insuficiente = texto.match(/skill level isn.t[^\\n]*?(\\d+)/i);
+const levelUp = texto.match(/(?:levell?ed up|reached level)[^\\d\\n]*(\\d+)?/i);
+return {
+    nivel_requerido: insuficiente ? parseInt(insuficiente[1], 10) : null,
+    level_up: !!levelUp,
+    nivel_skill: levelUp && levelUp[1] ? parseInt(levelUp[1], 10) : null,
+};
+"""
+
+
+class MemoNivelColeta:
+    """Memo persistente de material -> nível exigido e níveis atuais das skills."""
+
+    def __init__(self, nome_arquivo: str = ARQUIVO_MEMO_NIVEL):
+        self.nome_arquivo = nome_arquivo
+        self._dados: dict[str, Any] | None = None
+
+    def _carregar(self) -> dict[str, Any]:
+        if self._dados is None:
+            dados = carregar_json(caminho_dados(self.nome_arquivo), {})
+            self._dados = {
+                "materiais": dados.get("materiais", {}),
+                "skills": dados.get("skills", {}),
+            }
+        return self._dados
+
+    def _salvar(self) -> None:
+        try:
+            salvar_json_atomico(caminho_dados(self.nome_arquivo), self._carregar())
+        except OSError:
+            pass
+
+    def registrar_insuficiente(
+        self, material: str, tipo: str | None, nivel_requerido: int | None
+    ) -> None:
+        """Memoriza que o material não pode ser coletado no nível atual."""
+        dados = self._carregar()
+        dados["materiais"][material] = {
+            "tipo": tipo,
+            "nivel_requerido": nivel_requerido,
+            "nivel_skill": dados["skills"].get(tipo) if tipo else None,
+            "momento": time.time(),
+        }
+        self._salvar()
+
+    def deve_pular(self, material: str | None) -> bool:
+        """Indica se o material é conhecido como não coletável."""
+        if not material:
+            return False
+        dados = self._carregar()
+        entrada = dados["materiais"].get(material)
+        if not entrada:
+            return False
+
+        if time.time() - entrada.get("momento", 0) > VALIDADE_MEMO_NIVEL:
+            del dados["materiais"][material]
+            self._salvar()
+            return False
+
+        nivel_skill = dados["skills"].get(entrada.get("tipo"))
+        requerido = entrada.get("nivel_requerido")
+        if nivel_skill is not None and requerido is not None:
+            return nivel_skill < requerido
+        return True
+
+    def nivel_skill(self, tipo: str) -> int | None:
+        """Último nível conhecido da skill (None se nunca lido)."""
+        return self._carregar()["skills"].get(tipo)
+
+    def acima_do_nivel(self, tipo: str, nivel_requerido: int | None) -> bool:
+        """Indica se o nível exigido supera o nível conhecido da skill."""
+        nivel = self.nivel_skill(tipo)
+        if nivel is None or nivel_requerido is None:
+            return False
+        return nivel_requerido > nivel
+
+    def registrar_level_up(self, tipo: str, nivel: int | None) -> int:
+        """
+        Atualiza o nível da skill e invalida as entradas afetadas.
+
+        Returns:
+            Quantidade de entradas invalidadas
+        """
+        dados = self._carregar()
+        if nivel is not None:
+            dados["skills"][tipo] = nivel
+        else:
+            dados["skills"].pop(tipo, None)
+
+        invalidadas = [
+            material
+            for material, entrada in dados["materiais"].items()
+            if entrada.get("tipo") == tipo
+            and (
+                nivel is None
+                or entrada.get("nivel_requerido") is None
+                or entrada["nivel_requerido"] <= nivel
+            )
+        ]
+        for material in invalidadas:
+            del dados["materiais"][material]
+        self._salvar()
+        return len(invalidadas)
+
+
+_memo_nivel = MemoNivelColeta()
+
+
+def ler_niveis_coleta() -> dict[str, Any]:
+    """Lê nível exigido e level-up exibidos na interface de coleta."""
+    driver = get_driver()
+    if not driver:
+        return {}
+
+    try:
+        return driver.execute_script(SCRIPT_NIVEIS_COLETA) or {}
+    except Exception:
+        return {}
+
+
+def _registrar_nivel_insuficiente(log_box: tk.Text | None = None) -> None:
+    """Memoriza o material atual como não coletável."""
+    if not _gather_state.material:
+        return
+    nivel_requerido = ler_niveis_coleta().get("nivel_requerido")
+    _memo_nivel.registrar_insuficiente(
+        _gather_state.material, _gather_state.tipo, nivel_requerido
+    )
+    inserir_log(
+        log_box,
+        f"📝 {_gather_state.material} memorizado como não coletável"
+        + (f" (nível {nivel_requerido})" if nivel_requerido else ""),
+    )
+
+
+def _verificar_level_up(log_box: tk.Text | None = None) -> None:
+    """Detecta level-up na interface de coleta e invalida o memo da skill."""
+    if not _gather_state.tipo:
+        return
+    niveis = ler_niveis_coleta()
+    if not niveis.get("level_up"):
+        return
+    invalidadas = _memo_nivel.registrar_level_up(
+        _gather_state.tipo, niveis.get("nivel_skill")
+    )
+    inserir_log(
+        log_box,
+        f"🆙 Level-up em {_gather_state.tipo} - {invalidadas} material(is) liberado(s)",
+    )
+
+
 # ===============================
 # FUNÇÕES DE VERIFICAÇÃO OTIMIZADAS
 # ===============================
@@ -184,18 +568,170 @@ def verificar_botao_close_disponivel() -> bool:
         return False
 
 
+# ===============================
+# SONDA FUNDIDA DA INTERFACE DE COLETA
+# ===============================
+
+# Lê botão gather, quantidade, botão close e nível insuficiente de uma só vez
+_JS_LER_ESTADO_COLETA = """
+const xpaths = arguments[0];
+function achar(xpath) {
+    return document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+}
+function visivel(el) {
+    return !!el && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden';
+}
+function lerEstado() {
+    const botao = achar(xpaths.gather);
+    let pronto = false, motivo = 'Botão não encontrado';
+    if (botao) {
+        if (!visivel(botao)) motivo = 'Botão não visível';
+        else if ((botao.getAttribute('style') || '').includes('display: none'))
+            motivo = 'Botão oculto (display: none)';
+        else if (botao.disabled) motivo = 'Botão desabilitado';
+        else { pronto = true; motivo = 'Pronto'; }
+    }
+    const close = achar(xpaths.close);
+    const quantidadeEl = achar(xpaths.quantidade);
+    const numeros = quantidadeEl ? (quantidadeEl.textContent.match(/\\d+/) || []) : [];
+    return {
+        pronto: pronto,
+        motivo: motivo,
+        quantidade: numeros.length ? parseInt(numeros[0], 10) : null,
+        close: visivel(close) && !close.disabled,
+        nivel_insuficiente: visivel(achar(xpaths.nivel)),
+    };
+}
+"""
+
+SCRIPT_ESTADO_COLETA = _JS_LER_ESTADO_COLETA + "return lerEstado();"
+
+# Long-poll: resolve assim que o estado difere do último visto (ou no timeout)
+SCRIPT_AGUARDAR_ESTADO_COLETA = (
+    _JS_LER_ESTADO_COLETA
+    + """
+const timeoutMs = arguments[1];
+const anterior = arguments[2];
+const callback = arguments[arguments.length - 1];
+const campos = ['pronto', 'motivo', 'quantidade', 'close', 'nivel_insuficiente'];
+const igual = (a, b) => campos.every((c) => a[c] === b[c]);
+const inicial = anterior || lerEstado();
+const atual = lerEstado();
+if (!igual(atual, inicial)) {
+    callback(atual);
+} else {
+    let feito = false, timer = null;
+    const observador = new MutationObserver(() => {
+        const estado = lerEstado();
+        if (!igual(estado, inicial)) terminar(estado);
+    });
+    function terminar(estado) {
+        if (feito) return;
+        feito = true;
+        observador.disconnect();
+        clearTimeout(timer);
+        callback(estado);
+    }
+    observador.observe(document.body, {
+        subtree: true, childList: true, attributes: true, characterData: true,
+    });
+    timer = setTimeout(() => terminar(lerEstado()), timeoutMs);
+}
+"""
+)
+
+# Espera máxima de cada long-poll (mantém o loop interrompível)
+TIMEOUT_LONG_POLL_COLETA = 1.0
+
+
+@dataclass
+class EstadoInterfaceColeta:
+    """Resultado da sonda fundida da interface de coleta."""
+
+    pronto: bool = False
+    motivo: str = "Driver não disponível"
+    quantidade: int | None = None
+    close: bool = False
+    nivel_insuficiente: bool = False
+
+    @classmethod
+    def de_dict(cls, dados: dict[str, Any]) -> "EstadoInterfaceColeta":
+        return cls(
+            pronto=bool(dados.get("pronto")),
+            motivo=dados.get("motivo") or "Desconhecido",
+            quantidade=dados.get("quantidade"),
+            close=bool(dados.get("close")),
+            nivel_insuficiente=bool(dados.get("nivel_insuficiente")),
+        )
+
+
+_XPATHS_SONDA = {
+    "gather": XPathSelectors.GATHER_BUTTON,
+    "close": XPathSelectors.CLOSE_BUTTON,
+    "quantidade": XPathSelectors.AVAILABLE_AMOUNT,
+    "nivel": XPathSelectors.INSUFFICIENT_LEVEL,
+}
+
+
+def sondar_interface_coleta() -> EstadoInterfaceColeta:
+    """Lê todo o estado da interface de coleta em um único execute_script."""
+    driver = get_driver()
+    if not driver:
+        return EstadoInterfaceColeta()
+
+    try:
+        dados = driver.execute_script(SCRIPT_ESTADO_COLETA, _XPATHS_SONDA) or {}
+    except Exception as e:
+        return EstadoInterfaceColeta(motivo=f"Erro: {type(e).__name__}")
+    return EstadoInterfaceColeta.de_dict(dados)
+
+
+def aguardar_mudanca_coleta(
+    anterior: EstadoInterfaceColeta | None,
+    timeout: float = TIMEOUT_LONG_POLL_COLETA,
+) -> EstadoInterfaceColeta:
+    """
+    Aguarda o estado da interface mudar em relação a `anterior`.
+
+    Usa um MutationObserver na página (execute_async_script); se o long-poll
+    falhar, volta ao polling simples com o intervalo configurado.
+    """
+    driver = get_driver()
+    if not driver:
+        return EstadoInterfaceColeta()
+
+    try:
+        configurar_timeout_script(driver)
+        dados = driver.execute_async_script(
+            SCRIPT_AGUARDAR_ESTADO_COLETA,
+            _XPATHS_SONDA,
+            int(timeout * 1000),
+            anterior.__dict__ if anterior else None,
+        )
+        return EstadoInterfaceColeta.de_dict(dados or {})
+    except Exception:
+        sleep_interrompivel(_gather_config.check_interval)
+        return sondar_interface_coleta()
+
+
 # ===============================
 # FUNÇÕES DE ESPERA OTIMIZADAS
 # ===============================
 
 
 def aguardar_botao_ficar_pronto(
-    log_box: tk.Text | None = None, timeout_max: int | None = None
+    log_box: tk.Text | None = None, timeout_max: float | None = None
 ) -> tuple[bool, str]:
     """
     Aguarda o botão gather ficar pronto com verificações otimizadas.
     Aguarda pacientemente até o botão voltar a ficar disponível.
 
+    Cada verificação é uma única sonda da interface, e a espera entre elas
+    é feita por notificação de mudança na página em vez de sleep fixo.
+
     Returns:
         Tuple[bool, str]: (success, reason)
     """
@@ -203,8 +739,18 @@ def aguardar_botao_ficar_pronto(
         timeout_max = 20  # Aumentar timeout padrão para dar mais tempo
 
     inicio = time.time()
+    try:
+        return _aguardar_botao_ficar_pronto(log_box, timeout_max, inicio)
+    finally:
+        _gather_state.tempo_espera += time.time() - inicio
+
+
+def _aguardar_botao_ficar_pronto(
+    log_box: tk.Text | None, timeout_max: float, inicio: float
+) -> tuple[bool, str]:
+    """Implementação de aguardar_botao_ficar_pronto."""
     tentativas = 0
-    ultima_razao = ""
+    inicio_quantidade_zero: float | None = None
 
     inserir_log(
         log_box,
@@ -212,15 +758,16 @@ def aguardar_botao_ficar_pronto(
         debug=True,
     )
 
-    while (time.time() - inicio) < timeout_max:
+    estado = sondar_interface_coleta()
+    while True:
         tentativas += 1
 
-        # Verificação principal do botão gather PRIMEIRO
-        is_ready, reason = verificar_estado_botao_gather()
-        ultima_razao = reason
-
-        if is_ready:
+        if estado.pronto:
             tempo_decorrido = time.time() - inicio
+            if _gather_state.last_gather_time > inicio - 60:
+                _ajuste_coleta.registrar_pronto(
+                    time.time() - _gather_state.last_gather_time
+                )
             inserir_log(
                 log_box,
                 f"✅ Botão gather disponível após {tentativas} verificações ({tempo_decorrido:.1f}s)",
@@ -228,41 +775,57 @@ def aguardar_botao_ficar_pronto(
             )
             return True, "Pronto"
 
-        # Se botão desapareceu completamente, aguardar mais um pouco
-        if "não encontrado" in reason:
-            inserir_log(
-                log_box,
-                "🔍 Botão gather não encontrado - aguardando reaparecer...",
-                debug=True,
-            )
-            sleep_interrompivel(1.0)
-            continue
+        if estado.nivel_insuficiente:
+            return False, "Nível insuficiente"
 
-        # Verificação de materiais esgotados - APENAS após tentativas significativas
-        if tentativas > 10:  # Só verificar após várias tentativas
-            quantidade = obter_quantidade_disponivel()
-            if quantidade is not None and quantidade == 0:
+        # Verificação se coleta foi finalizada (botão close apareceu)
+        if estado.close:
+            _registrar_amostra_close()
+            if estado.quantidade == 0:
+                return False, "Materiais esgotados"
+            return False, "Coleta finalizada"
+
+        # Quantidade zerada: dá até close_wait_time (aprendido) para o close aparecer
+        if estado.quantidade == 0:
+            if inicio_quantidade_zero is None:
+                inicio_quantidade_zero = time.time()
                 inserir_log(
                     log_box,
                     "📦 Quantidade detectada como 0 - aguardando botão close...",
                     debug=True,
                 )
-                # Aguardar mais tempo para botão close aparecer
-                for i in range(5):  # 5 tentativas de 1 segundo
-                    sleep_interrompivel(1.0)
-                    if verificar_botao_close_disponivel():
-                        return False, "Materiais esgotados"
-                    inserir_log(
-                        log_box, f"   Aguardando botão close... ({i + 1}/5)", debug=True
-                    )
+            elif time.time() - inicio_quantidade_zero > _gather_config.close_wait_time:
+                return False, "Materiais esgotados"
 
-        # Verificação se coleta foi finalizada (botão close apareceu) - ÚLTIMO
-        if verificar_botao_close_disponivel():
-            return False, "Coleta finalizada"
+        restante = timeout_max - (time.time() - inicio)
+        if restante <= 0:
+            break
+        estado = aguardar_mudanca_coleta(
+            estado, min(restante, TIMEOUT_LONG_POLL_COLETA)
+        )
+
+    return False, f"Timeout após {timeout_max:.1f}s - última razão: {estado.motivo}"
 
-        sleep_interrompivel(_gather_config.check_interval)
 
-    return False, f"Timeout após {timeout_max}s - última razão: {ultima_razao}"
+def _registrar_amostra_close() -> None:
+    """Amostra do tempo entre o último clique e o aparecimento do close."""
+    if _gather_state.last_gather_time > 0:
+        _ajuste_coleta.registrar_close(time.time() - _gather_state.last_gather_time)
+
+
+def aguardar_botao_close(segundos: float) -> bool:
+    """Aguarda o botão close aparecer por até `segundos` (notificação de mudança)."""
+    limite = time.time() + segundos
+    estado = sondar_interface_coleta()
+    while not estado.close:
+        restante = limite - time.time()
+        if restante <= 0:
+            return False
+        estado = aguardar_mudanca_coleta(
+            estado, min(restante, TIMEOUT_LONG_POLL_COLETA)
+        )
+    _registrar_amostra_close()
+    return True
 
 
 # ===============================
@@ -318,8 +881,10 @@ def executar_coleta_unica(
             inserir_log(log_box, "✅ Clique no botão gather executado")
             registrar_acao("Coleta")
 
-            # Aguarda processamento da coleta
-            sleep_interrompivel(random.uniform(1.5, 2.5))
+            # Aguarda processamento da coleta (abaixo do menor tempo observado)
+            sleep_interrompivel(
+                _gather_config.post_click_delay * random.uniform(1.0, 1.3)
+            )
 
             return True, GatherStatus.SUCCESS
 
@@ -334,29 +899,76 @@ def executar_coleta_unica(
         _gather_state.is_gathering = False
 
 
-def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
+def executar_coleta_completa(
+    log_box: tk.Text | None = None, retomar: bool = False
+) -> dict[str, Any]:
     """
     Executa coleta completa de todos os materiais disponíveis.
     Aguarda o botão ficar disponível após cada coleta e só para quando aparece 'Press here to close'.
 
+    Args:
+        log_box: Widget de log opcional
+        retomar: Mantém o progresso restaurado do checkpoint em vez de zerar
+
     Returns:
         Dict com resultados da coleta
     """
+    global _url_retomada
+
+    _url_retomada = None
+    driver = get_driver()
+    if driver:
+        try:
+            _gather_state.url = driver.current_url
+        except Exception:
+            _gather_state.url = None
+    definir_atividade("gather")
+    _ajuste_coleta.carregar_conta()
+    inicio = time.time()
+    coletados_antes = _gather_state.materials_collected if retomar else 0
+    _gather_state.tempo_espera = 0.0
+    modo = "pagina" if obter_configuracao("modo_coleta_pagina") else "python"
+    try:
+        return _executar_coleta_completa(log_box, retomar)
+    finally:
+        definir_atividade(None)
+        checkpoint.salvar_checkpoint()
+        estatisticas.registrar_coleta(
+            _gather_state.tipo,
+            _gather_state.material,
+            _gather_state.materials_collected - coletados_antes,
+            time.time() - inicio,
+            _gather_state.tempo_espera,
+            modo,
+        )
+        _ajuste_coleta.ajustar(log_box)
+
+
+def _executar_coleta_completa(log_box: tk.Text | None, retomar: bool) -> dict[str, Any]:
+    """Implementação de executar_coleta_completa."""
     global _gather_state
 
     driver = get_driver()
     if not driver:
         return {"success": False, "materials_collected": 0, "status": "driver_error"}
 
-    # Reset do estado
-    _gather_state.materials_collected = 0
+    # Reset do estado (ou continuação do checkpoint)
+    if retomar:
+        inserir_log(
+            log_box,
+            f"♻️ Retomando coleta ({_gather_state.materials_collected} já coletados)",
+        )
+    else:
+        _gather_state.materials_collected = 0
     _gather_state.materials_available = obter_quantidade_disponivel()
 
     if _gather_state.materials_available is not None:
         inserir_log(
             log_box, f"📦 {_gather_state.materials_available} materiais disponíveis"
         )
-        max_coletas = _gather_state.materials_available + 5  # Margem de segurança
+        max_coletas = (
+            _gather_state.materials_collected + _gather_state.materials_available + 5
+        )  # Margem de segurança
     else:
         inserir_log(
             log_box, "⚠️ Quantidade não detectada, coletando até botão close aparecer"
@@ -367,6 +979,48 @@ def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
         log_box, "🔄 Iniciando coleta contínua - aguardando botão close aparecer"
     )
 
+    if not (
+        obter_configuracao("modo_coleta_pagina")
+        and _coletar_na_pagina(driver, log_box, max_coletas)
+    ):
+        _coletar_pelo_python(log_box, max_coletas)
+
+    # Verificação final do botão close antes de finalizar
+    inserir_log(log_box, "🔍 Verificação final do botão close...")
+    if aguardar_botao_close(_gather_config.close_wait_time):
+        inserir_log(log_box, "🚪 Botão close confirmado na verificação final!")
+
+    # Finalização
+    inserir_log(
+        log_box,
+        f"🔚 Finalizando coleta ({_gather_state.materials_collected} materiais)",
+    )
+    sleep_interrompivel(1)
+
+    _verificar_level_up(log_box)
+    interface_fechada = fechar_interface_coleta()
+
+    resultado = {
+        "success": _gather_state.materials_collected > 0,
+        "materials_collected": _gather_state.materials_collected,
+        "materials_available": _gather_state.materials_available,
+        "interface_closed": interface_fechada,
+        "status": "completed",
+    }
+
+    if interface_fechada:
+        inserir_log(
+            log_box,
+            f"🚪 Interface fechada após {_gather_state.materials_collected} coletas",
+        )
+    else:
+        inserir_log(log_box, "⚠️ Falha ao fechar interface")
+
+    return resultado
+
+
+def _coletar_pelo_python(log_box: tk.Text | None, max_coletas: int) -> None:
+    """Loop de coleta conduzido pelo Python, um clique por vez."""
     # Loop de coleta aprimorado
     falhas_consecutivas = 0
     verificacoes_close_sem_sucesso = 0
@@ -380,16 +1034,8 @@ def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
                 f"⚠️ Limite máximo de coletas atingido ({max_coletas}) - verificando botão close final",
             )
             # Aguardar mais tempo para o botão close aparecer
-            for i in range(8):  # 8 segundos de espera
-                sleep_interrompivel(1.0)
-                if verificar_botao_close_disponivel():
-                    inserir_log(log_box, "🚪 Botão close encontrado após limite!")
-                    break
-                inserir_log(
-                    log_box,
-                    f"   Aguardando botão close após limite... ({i + 1}/8)",
-                    debug=True,
-                )
+            if aguardar_botao_close(_gather_config.close_wait_time):
+                inserir_log(log_box, "🚪 Botão close encontrado após limite!")
             break
 
         # Aguardar botão gather ficar disponível
@@ -397,12 +1043,18 @@ def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
             log_box,
             f"⏳ Aguardando botão gather ficar disponível (coleta {_gather_state.materials_collected + 1})...",
         )
-        ready, reason = aguardar_botao_ficar_pronto(log_box, timeout_max=15)
+        ready, reason = aguardar_botao_ficar_pronto(
+            log_box, timeout_max=_gather_config.ready_timeout
+        )
 
         if not ready:
             if "Coleta finalizada" in reason or "Materiais esgotados" in reason:
                 inserir_log(log_box, f"✅ {reason} - finalizando")
                 break
+            if reason == "Nível insuficiente":
+                inserir_log(log_box, "❌ Nível insuficiente - parando coleta")
+                _registrar_nivel_insuficiente(log_box)
+                break
             else:
                 falhas_consecutivas += 1
                 inserir_log(
@@ -415,23 +1067,15 @@ def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
                     inserir_log(
                         log_box, "🔍 Verificação extra do botão close após falhas..."
                     )
-                    for i in range(3):
-                        sleep_interrompivel(1.5)
-                        if verificar_botao_close_disponivel():
-                            inserir_log(
-                                log_box,
-                                "🚪 Botão close encontrado após verificação extra!",
-                            )
-                            falhas_consecutivas = 999  # Forçar saída do loop
-                            break
+                    if aguardar_botao_close(_gather_config.close_wait_time):
                         inserir_log(
                             log_box,
-                            f"   Verificação extra close... ({i + 1}/3)",
-                            debug=True,
+                            "🚪 Botão close encontrado após verificação extra!",
                         )
+                        falhas_consecutivas = 999  # Forçar saída do loop
 
                 if falhas_consecutivas < _gather_config.max_consecutive_failures:
-                    sleep_interrompivel(2.0)
+                    sleep_interrompivel(_gather_config.retry_delay)
                 continue
 
         # Executar uma coleta
@@ -441,14 +1085,12 @@ def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
             _gather_state.materials_collected += 1
             falhas_consecutivas = 0
             verificacoes_close_sem_sucesso = 0
+            checkpoint.salvar_periodico()
             inserir_log(
                 log_box,
                 f"📦 Material {_gather_state.materials_collected} coletado com sucesso",
             )
 
-            # Aguardar um pouco após coleta bem-sucedida
-            sleep_interrompivel(random.uniform(1.0, 1.5))
-
             # Verificação especial: se coletou muitos materiais, verificar se close apareceu
             if (
                 _gather_state.materials_collected > 0
@@ -468,6 +1110,7 @@ def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
 
             if status == GatherStatus.INSUFFICIENT_LEVEL:
                 inserir_log(log_box, "❌ Nível insuficiente - parando coleta")
+                _registrar_nivel_insuficiente(log_box)
                 break
             elif status == GatherStatus.COMPLETED:
                 inserir_log(log_box, "✅ Coleta completada automaticamente")
@@ -477,20 +1120,12 @@ def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
                 verificacoes_close_sem_sucesso += 1
 
                 # Aguardar mais tempo quando detectar "sem materiais"
-                for i in range(6):  # 6 segundos de espera
-                    sleep_interrompivel(1.0)
-                    if verificar_botao_close_disponivel():
-                        inserir_log(
-                            log_box,
-                            "🚪 Botão close encontrado após detectar sem materiais!",
-                        )
-                        falhas_consecutivas = 999  # Forçar saída
-                        break
+                if aguardar_botao_close(_gather_config.close_wait_time):
                     inserir_log(
                         log_box,
-                        f"   Aguardando close após sem materiais... ({i + 1}/6)",
-                        debug=True,
+                        "🚪 Botão close encontrado após detectar sem materiais!",
                     )
+                    falhas_consecutivas = 999  # Forçar saída
 
                 if verificacoes_close_sem_sucesso >= max_verificacoes_close:
                     inserir_log(
@@ -503,43 +1138,215 @@ def executar_coleta_completa(log_box: tk.Text | None = None) -> dict[str, Any]:
                 log_box,
                 f"⚠️ Falha na coleta: {status} ({falhas_consecutivas}/{_gather_config.max_consecutive_failures})",
             )
-            sleep_interrompivel(1.5)
+            sleep_interrompivel(_gather_config.retry_delay)
 
-    # Verificação final do botão close antes de finalizar
-    inserir_log(log_box, "🔍 Verificação final do botão close...")
-    for i in range(5):
-        if verificar_botao_close_disponivel():
-            inserir_log(log_box, "🚪 Botão close confirmado na verificação final!")
-            break
-        sleep_interrompivel(1.0)
-        inserir_log(log_box, f"   Verificação final... ({i + 1}/5)", debug=True)
 
-    # Finalização
-    inserir_log(
-        log_box,
-        f"🔚 Finalizando coleta ({_gather_state.materials_collected} materiais)",
-    )
-    sleep_interrompivel(1)
+# ===============================
+# MODO DE COLETA NA PÁGINA (page-side)
+# ===============================
 
-    interface_fechada = fechar_interface_coleta()
+# Intervalo mínimo entre cliques da rotina na página (ms) e variação aleatória
+INTERVALO_MINIMO_COLETA_PAGINA_MS = 600
+VARIACAO_COLETA_PAGINA_MS = 400
+
+# Limites de supervisão do lado Python
+TIMEOUT_COLETA_PAGINA = 300.0
+LONG_POLL_COLETA_PAGINA = 3.0
+MAX_REINJECOES_COLETA = 3
+
+# Rotina injetada: clica gather assim que o botão fica pronto e para no
+# botão close, nível insuficiente ou limite. Com captcha visível apenas pausa.
+SCRIPT_COLETA_PAGINA = (
+    _JS_LER_ESTADO_COLETA
+    + """
+const [, maxColetas, intervaloMinimo, variacao] = arguments;
+const anterior = window.__smmoBotColeta;
+if (anterior && anterior.timer) clearInterval(anterior.timer);
+const estado = {
+    status: 'rodando', coletas: 0, inicio: Date.now(), ultimoClique: 0,
+    proximoAtraso: 0, espera: 0, ultimoTick: Date.now(), timer: null,
+};
+const parar = (status) => { estado.status = status; clearInterval(estado.timer); };
+estado.timer = setInterval(() => {
+    if (estado.status !== 'rodando' && estado.status !== 'captcha') return;
+    const tick = Date.now();
+    const decorrido = tick - estado.ultimoTick;
+    estado.ultimoTick = tick;
+    const captcha = Array.from(document.querySelectorAll("a[href='/i-am-not-a-bot']"))
+        .some((a) => a.textContent.includes('Press here to verify') && visivel(a));
+    estado.status = captcha ? 'captcha' : 'rodando';
+    if (captcha) return;
+    const atual = lerEstado();
+    if (!atual.pronto) estado.espera += decorrido;
+    if (atual.close) return parar('close');
+    if (atual.nivel_insuficiente) return parar('nivel');
+    if (estado.coletas >= maxColetas) return parar('limite');
+    const agora = Date.now();
+    if (atual.pronto && agora - estado.ultimoClique >= estado.proximoAtraso) {
+        achar(xpaths.gather).click();
+        estado.coletas += 1;
+        estado.ultimoClique = agora;
+        estado.proximoAtraso = intervaloMinimo + Math.random() * variacao;
+    }
+}, 100);
+window.__smmoBotColeta = estado;
+return true;
+"""
+)
 
-    resultado = {
-        "success": _gather_state.materials_collected > 0,
-        "materials_collected": _gather_state.materials_collected,
-        "materials_available": _gather_state.materials_available,
-        "interface_closed": interface_fechada,
-        "status": "completed",
+# Long-poll: resolve quando a contagem ou o status mudam (ou no timeout)
+SCRIPT_AGUARDAR_COLETA_PAGINA = """
+const [timeoutMs, coletasVistas, statusVisto] = arguments;
+const callback = arguments[arguments.length - 1];
+const ler = () => {
+    const e = window.__smmoBotColeta;
+    return {
+        url: window.location.href,
+        estado: e ? {status: e.status, coletas: e.coletas, espera: e.espera} : null,
+    };
+};
+const inicio = Date.now();
+const timer = setInterval(() => {
+    const leitura = ler();
+    const e = leitura.estado;
+    if (!e || e.coletas !== coletasVistas || e.status !== statusVisto
+            || Date.now() - inicio >= timeoutMs) {
+        clearInterval(timer);
+        callback(leitura);
     }
+}, 100);
+"""
 
-    if interface_fechada:
-        inserir_log(
-            log_box,
-            f"🚪 Interface fechada após {_gather_state.materials_collected} coletas",
+SCRIPT_PARAR_COLETA_PAGINA = """
+const e = window.__smmoBotColeta;
+if (e) { clearInterval(e.timer); e.status = 'parado'; }
+"""
+
+
+def _injetar_coleta_pagina(driver, max_coletas: int) -> bool:
+    """Injeta a rotina de coleta na página."""
+    try:
+        return bool(
+            driver.execute_script(
+                SCRIPT_COLETA_PAGINA,
+                _XPATHS_SONDA,
+                max_coletas,
+                max(
+                    INTERVALO_MINIMO_COLETA_PAGINA_MS,
+                    _gather_config.cooldown_time * 1000,
+                ),
+                VARIACAO_COLETA_PAGINA_MS,
+            )
         )
-    else:
-        inserir_log(log_box, "⚠️ Falha ao fechar interface")
+    except Exception:
+        return False
 
-    return resultado
+
+def _coletar_na_pagina(driver, log_box: tk.Text | None, max_coletas: int) -> bool:
+    """
+    Coleta conduzida por uma rotina na página, supervisionada pelo Python.
+
+    Returns:
+        False se a rotina não pôde ser injetada (usar o loop do Python)
+    """
+    restantes = max_coletas - _gather_state.materials_collected
+    inserir_log(log_box, "🔄 Iniciando coleta na página...")
+    if not _injetar_coleta_pagina(driver, restantes):
+        inserir_log(log_box, "⚠️ Falha ao injetar rotina, usando coleta padrão")
+        return False
+
+    coletas_injecao = 0
+    espera_injecao = 0.0
+    status_visto = "rodando"
+    reinjecoes = 0
+    captcha_notificado = False
+
+    inicio = time.time()
+    try:
+        while time.time() - inicio < TIMEOUT_COLETA_PAGINA:
+            try:
+                configurar_timeout_script(driver)
+                leitura = driver.execute_async_script(
+                    SCRIPT_AGUARDAR_COLETA_PAGINA,
+                    int(LONG_POLL_COLETA_PAGINA * 1000),
+                    coletas_injecao,
+                    status_visto,
+                )
+            except Exception:
+                # Navegação durante o long-poll: a próxima leitura decide
+                sleep_interrompivel(_gather_config.check_interval)
+                continue
+            if not leitura:
+                continue
+
+            if not (leitura.get("url") or "").startswith(URL_COLETA):
+                inserir_log(log_box, "🔄 Saiu da interface de coleta")
+                break
+
+            estado = leitura.get("estado")
+            if estado is None:
+                # Página recarregou: a rotina se perdeu, injeta de novo
+                reinjecoes += 1
+                if reinjecoes > MAX_REINJECOES_COLETA:
+                    break
+                coletas_injecao = 0
+                espera_injecao = 0.0
+                status_visto = "rodando"
+                _injetar_coleta_pagina(
+                    driver, max_coletas - _gather_state.materials_collected
+                )
+                continue
+
+            # Tempo aguardando o botão, medido pela rotina (ms)
+            espera = float(estado.get("espera") or 0) / 1000
+            _gather_state.tempo_espera += max(0.0, espera - espera_injecao)
+            espera_injecao = espera
+
+            # Contabiliza coletas novas desde a última leitura
+            novas = int(estado.get("coletas", 0)) - coletas_injecao
+            if novas > 0:
+                coletas_injecao += novas
+                _gather_state.materials_collected += novas
+                _gather_state.last_gather_time = time.time()
+                for _ in range(novas):
+                    registrar_acao("Coleta")
+                checkpoint.salvar_periodico()
+                inserir_log(
+                    log_box,
+                    f"📦 Material {_gather_state.materials_collected} coletado com sucesso",
+                )
+
+            status_visto = estado.get("status") or "rodando"
+            if status_visto == "captcha":
+                if not captcha_notificado:
+                    from utils.notifier import notificar
+
+                    notificar(
+                        "CAPTCHA detectado na coleta! O bot está aguardando sua ação.",
+                        "CAPTCHA",
+                    )
+                    inserir_log(log_box, "⚠️ CAPTCHA na coleta. Aguardando resolução...")
+                    captcha_notificado = True
+                continue
+            captcha_notificado = False
+
+            if status_visto == "nivel":
+                inserir_log(log_box, "❌ Nível insuficiente - parando coleta")
+                _registrar_nivel_insuficiente(log_box)
+                break
+            if status_visto in ("close", "limite", "parado"):
+                inserir_log(log_box, "✅ Coleta na página finalizada")
+                break
+
+        if time.time() - inicio >= TIMEOUT_COLETA_PAGINA:
+            inserir_log(log_box, "⏰ Tempo limite da coleta na página atingido")
+    finally:
+        try:
+            driver.execute_script(SCRIPT_PARAR_COLETA_PAGINA)
+        except Exception:
+            pass
+
+    return True
 
 
 # ===============================
@@ -621,40 +1428,174 @@ def fechar_interface_coleta() -> bool:
 # ===============================
 
 
-def verificar_gather_disponivel_pagina_principal():
-    """Verifica se há botões de gather disponíveis na página principal."""
-    from driver.actions import buscar_botao_por_texto
-    from driver.manager import get_driver
+# Descobre todos os botões de coleta do travel e o material de cada cartão
+SCRIPT_ALVOS_COLETA = """
+const nomes = arguments[0];
+const visivel = (el) => !!el && el.getClientRects().length > 0;
+const alvos = [];
+for (const el of document.querySelectorAll('button, a')) {
+    if (!visivel(el) || el.disabled) continue;
+    const textoProprio = Array.from(el.childNodes)
+        .filter((n) => n.nodeType === Node.TEXT_NODE)
+        .map((n) => n.textContent).join(' ');
+    const nome = nomes.find((n) => textoProprio.includes(n));
+    if (!nome) continue;
+    const textoBotao = el.textContent.trim();
+    let cartao = el;
+    for (let i = 0; i < 4 && cartao.parentElement; i++) {
+        cartao = cartao.parentElement;
+        if ((cartao.innerText || '').split('\\n').length >= 2) break;
+    }
+    const linhas = (cartao.innerText || '').split('\\n')
+        .map((l) => l.trim()).filter(Boolean);
+    let material = null, nivel = null;
+    for (const linha of linhas) {
+        const m = linha.match(/(?:level|lvl)\\.?\\s*(\\d+)/i);
+        if (m && nivel === null) { nivel = parseInt(m[1], 10); continue; }
+        if (material === null && linha !== textoBotao) material = linha;
+    }
+    alvos.push({elemento: el, nome: nome, material: material, nivel: nivel});
+}
+return alvos;
+"""
+
+BOTOES_GATHER = ["Chop", "Mine", "Salvage", "Catch"]
 
+# Segundos por material assumidos para tipos ainda sem histórico
+TEMPO_PADRAO_POR_MATERIAL = 3.0
+
+
+@dataclass
+class AlvoColeta:
+    """Botão de coleta encontrado no travel e seu valor estimado."""
+
+    nome_botao: str
+    elemento: Any
+    material: str | None = None
+    nivel: int | None = None
+    valor: float = 0.0
+
+    @property
+    def tipo(self) -> str:
+        return self.nome_botao.lower()
+
+
+def _config_dict(chave: str) -> dict[str, float]:
+    """Lê um dicionário numérico da configuração (vazio se inválido)."""
+    valor = obter_configuracao(chave)
+    return valor if isinstance(valor, dict) else {}
+
+
+def valor_alvo_coleta(
+    alvo: AlvoColeta, tempos: dict[str, dict[str, float]] | None = None
+) -> float:
+    """
+    Valor por segundo de um alvo de coleta.
+
+    Combina o peso configurado do tipo (necessidade de XP da skill), o valor
+    configurado do material e o custo histórico em segundos por material.
+    """
+    if tempos is None:
+        tempos = estatisticas.tempo_por_material()
+
+    peso = float(_config_dict("pesos_coleta").get(alvo.tipo, 1.0))
+    valor_material = float(_config_dict("valor_materiais").get(alvo.material, 1.0))
+    historico = tempos.get(alvo.tipo, {})
+    custo = historico.get("tempo_por_material") or TEMPO_PADRAO_POR_MATERIAL
+    return peso * valor_material / custo
+
+
+def descobrir_alvos_coleta() -> list[AlvoColeta]:
+    """
+    Descobre os alvos de coleta do travel em uma única consulta.
+
+    Alvos cujo nível exigido (lido no cartão) supera o nível conhecido da
+    skill, ou memorizados como acima do nível atual, são descartados antes do
+    primeiro clique; os demais vêm ordenados do maior para o menor valor.
+    """
     driver = get_driver()
     if not driver:
-        return None
-
-    # Lista de botões de gather possíveis
-    botoes_gather = ["Chop", "Mine", "Salvage", "Catch"]
+        return []
 
     try:
-        for nome_botao in botoes_gather:
-            botao = buscar_botao_por_texto(nome_botao)
-            if botao:
-                return nome_botao, botao
-        return None
+        encontrados = driver.execute_script(SCRIPT_ALVOS_COLETA, BOTOES_GATHER) or []
     except Exception:
+        return []
+
+    tempos = estatisticas.tempo_por_material()
+    alvos = []
+    for dados in encontrados:
+        alvo = AlvoColeta(
+            nome_botao=dados.get("nome"),
+            elemento=dados.get("elemento"),
+            material=dados.get("material"),
+            nivel=dados.get("nivel"),
+        )
+        acima = _memo_nivel.acima_do_nivel(alvo.tipo, alvo.nivel)
+        if acima or _memo_nivel.deve_pular(alvo.material):
+            inserir_log(
+                None,
+                f"⏭️ {alvo.material or alvo.nome_botao} exige nível maior, pulando",
+                debug=True,
+            )
+            continue
+        alvo.valor = valor_alvo_coleta(alvo, tempos)
+        alvos.append(alvo)
+
+    alvos.sort(key=lambda a: a.valor, reverse=True)
+    return alvos
+
+
+def verificar_gather_disponivel_pagina_principal():
+    """Retorna o botão de coleta de maior valor na página principal."""
+    alvos = descobrir_alvos_coleta()
+    if not alvos:
         return None
 
+    melhor = alvos[0]
+    if len(alvos) > 1:
+        inserir_log(
+            None,
+            f"🎯 {len(alvos)} alvos de coleta, escolhido {melhor.nome_botao}"
+            f" ({melhor.material or '?'}, valor {melhor.valor:.2f})",
+            debug=True,
+        )
+    _gather_state.material = melhor.material
+    _gather_state.tipo = melhor.tipo
+    return melhor.nome_botao, melhor.elemento
+
 
 # ===============================
 # FUNÇÃO PRINCIPAL OTIMIZADA
 # ===============================
 
 
-def processar_botao_de_coleta(nome_botao: str, log_box: tk.Text | None = None) -> bool:
+def _mostrar_resumo_tipo(tipo: str, log_box: tk.Text | None = None) -> None:
+    """Mostra a taxa recente de materiais por hora e o tempo por material."""
+    if tipo not in [t.value for t in GatherType]:
+        return
+    por_hora = estatisticas.materiais_por_hora().get(tipo, 0.0)
+    resumo = estatisticas.tempo_por_material(time.time() - 24 * 3600).get(tipo)
+    if not resumo:
+        return
+    inserir_log(
+        log_box,
+        f"📈 {tipo}: {por_hora:.0f} materiais/h, "
+        f"{resumo['tempo_por_material']:.1f}s por material "
+        f"({resumo['espera_por_material']:.1f}s aguardando)",
+    )
+
+
+def processar_botao_de_coleta(
+    nome_botao: str, log_box: tk.Text | None = None, botao=None
+) -> bool:
     """
     Processa um botão de coleta específico com otimizações.
 
     Args:
         nome_botao: Nome do botão de coleta (Chop, Mine, Salvage, Catch)
         log_box: Widget de log opcional
+        botao: Elemento já localizado (evita nova busca por texto)
 
     Returns:
         bool: True se processou com sucesso
@@ -669,7 +1610,8 @@ def processar_botao_de_coleta(nome_botao: str, log_box: tk.Text | None = None) -
 
     try:
         # 1. Busca e clica no botão
-        botao = buscar_botao_por_texto(nome_botao)
+        if botao is None:
+            botao = buscar_botao_por_texto(nome_botao)
         if not botao:
             return False
 
@@ -681,13 +1623,16 @@ def processar_botao_de_coleta(nome_botao: str, log_box: tk.Text | None = None) -
             inserir_log(log_box, f"❌ Falha ao clicar em {nome_botao}")
             return False
 
-        # 2. Aguarda entrada na interface com WebDriverWait
+        # 2. Aguarda entrada na interface (limite aprendido em max_wait_time)
+        _ajuste_coleta.carregar_conta()
+        momento_clique = time.time()
         try:
-            WebDriverWait(driver, 7).until(
+            WebDriverWait(driver, _gather_config.max_wait_time).until(
                 lambda d: url_comeca_com(
                     "https://web.simple-mmo.com/crafting/material/gather/"
                 )
             )
+            _ajuste_coleta.registrar_entrada(time.time() - momento_clique)
         except Exception:
             inserir_log(log_box, f"❌ Timeout: não entrou na interface de {nome_botao}")
             return False
@@ -698,22 +1643,20 @@ def processar_botao_de_coleta(nome_botao: str, log_box: tk.Text | None = None) -
         # 4. Verificação de nível
         if verificar_nivel_insuficiente():
             inserir_log(log_box, f"❌ Nível insuficiente para {nome_botao}")
+            _registrar_nivel_insuficiente(log_box)
             fechar_interface_coleta()
             return True
 
         # 5. Executa coleta completa
         resultado = executar_coleta_completa(log_box)
 
-        # 6. Atualiza estatísticas
+        # 6. Resume estatísticas do tipo
         if resultado["success"]:
-            nome_lower = nome_botao.lower()
-            if nome_lower in [t.value for t in GatherType]:
-                # Estatística removida temporariamente
-                pass
             inserir_log(
                 log_box,
                 f"✅ Coleta de {nome_botao} concluída ({resultado['materials_collected']} materiais)",
             )
+            _mostrar_resumo_tipo(nome_botao.lower(), log_box)
 
         return True
 
@@ -752,7 +1695,7 @@ def processar_coleta(log_box: tk.Text | None = None) -> bool:
     gather_info = verificar_gather_disponivel_pagina_principal()
     if gather_info:
         nome_botao, botao = gather_info
-        return processar_botao_de_coleta(nome_botao, log_box)
+        return processar_botao_de_coleta(nome_botao, log_box, botao)
 
     return False
 
@@ -5,13 +5,20 @@ Este módulo contém funções relacionadas ao sistema de cura,
 incluindo verificação de HP e execução de curas.
 """
 
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
 import time
+from typing import Any
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from core.context import registrar_acao
+from core import estatisticas
+from core.context import obter_configuracao, registrar_acao
 from driver.manager import get_driver
 from utils.logger import inserir_log
 from utils.timing import sleep_interrompivel
@@ -33,6 +40,115 @@ def verificar_personagem_morto() -> bool:
         return False
 
 
+# ===============================
+# RASTREAMENTO DE HP
+# ===============================
+
+# HP exibido no travel (o popup de stats é Alpine, então o texto existe mesmo oculto)
+SCRIPT_HP_PAGINA = """
+const numero = (seletor) => {
+    const el = document.querySelector(seletor);
+    if (!el) return null;
+    const m = el.textContent.replace(/[,.]/g, '').match(/\\d+/);
+    return m ? parseInt(m[0], 10) : null;
+};
+const morto = Array.from(document.querySelectorAll('a'))
+    .some((a) => a.textContent.includes('How do I heal?') && a.offsetParent !== null);
+return {
+    hp: numero("[x-text*='user.current_hp']"),
+    hp_max: numero("[x-text='user.max_hp']"),
+    morto: morto,
+};
+"""
+
+# Leituras mais antigas que isso são refeitas na página
+VALIDADE_LEITURA_HP = 15.0
+
+# Amostras de dano necessárias para prever a próxima luta
+MIN_AMOSTRAS_DANO = 3
+PERCENTIL_DANO = 0.9
+
+
+@dataclass
+class EstadoHP:
+    """Último HP conhecido do jogador."""
+
+    atual: int | None = None
+    maximo: int | None = None
+    momento: float = 0.0
+
+
+_hp = EstadoHP()
+
+
+def registrar_hp(atual: int | None, maximo: int | None = None) -> None:
+    """Atualiza o HP conhecido (a partir do combate ou do travel)."""
+    if atual is None:
+        return
+    _hp.atual = atual
+    if maximo:
+        _hp.maximo = maximo
+    _hp.momento = time.time()
+
+
+def obter_hp() -> EstadoHP:
+    """Retorna o último HP conhecido."""
+    return _hp
+
+
+def ler_hp_pagina() -> dict | None:
+    """Lê HP, HP máximo e estado de morte da página atual em uma chamada."""
+    driver = get_driver()
+    if not driver:
+        return None
+
+    try:
+        dados = driver.execute_script(SCRIPT_HP_PAGINA)
+    except Exception:
+        return None
+
+    if dados:
+        registrar_hp(dados.get("hp"), dados.get("hp_max"))
+    return dados
+
+
+def limite_cura() -> float:
+    """Percentual de HP previsto abaixo do qual o bot cura (healing_threshold)."""
+    try:
+        return float(obter_configuracao("limite_cura"))
+    except (TypeError, ValueError):
+        return 80.0
+
+
+def prever_dano(npc: str | None = None) -> int | None:
+    """Dano esperado na próxima luta (percentil alto do histórico)."""
+    danos = estatisticas.danos_por_luta(npc)
+    if len(danos) < MIN_AMOSTRAS_DANO and npc is not None:
+        danos = estatisticas.danos_por_luta()
+    if len(danos) < MIN_AMOSTRAS_DANO:
+        return None
+
+    ordenados = sorted(danos)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * PERCENTIL_DANO))]
+
+
+def risco_proxima_luta(npc: str | None = None) -> bool:
+    """Indica se a próxima luta deve deixar o HP abaixo do limite de cura."""
+    if _hp.atual is None:
+        return False
+
+    dano = prever_dano(npc)
+    if dano is None:
+        return False
+
+    hp_previsto = _hp.atual - dano
+    if hp_previsto <= 0:
+        return True
+    if _hp.maximo:
+        return (hp_previsto / _hp.maximo) * 100 < limite_cura()
+    return False
+
+
 def verificar_e_curar(log_box=None) -> bool:
     """Verifica se o personagem está morto e cura automaticamente."""
     from utils.notifier import notificar
@@ -50,62 +166,207 @@ def verificar_e_curar(log_box=None) -> bool:
     return curar_personagem(log_box)
 
 
-def curar_personagem(log_box=None) -> bool:
-    """Cura o personagem morto."""
+# ===============================
+# PIPELINE DE CURA
+# ===============================
+
+URL_HEALER = "https://web.simple-mmo.com/healer?new_page_refresh=true"
+URL_TRAVEL = "https://web.simple-mmo.com/travel"
+XPATH_BOTAO_CURA = "//button[contains(text(), 'Heal Character')]"
+
+# Confirmação: botão de cura sumiu/desabilitou ou a página anunciou a cura
+SCRIPT_CURA_CONFIRMADA = """
+const botao = Array.from(document.querySelectorAll('button'))
+    .find((b) => b.textContent.includes('Heal Character'));
+const texto = (document.body.innerText || '').toLowerCase();
+return !botao || botao.disabled || botao.offsetParent === null
+    || texto.includes('you have been healed') || texto.includes('fully healed');
+"""
+
+
+@dataclass
+class EtapaCura:
+    """Etapa da cura: ação opcional seguida de uma condição com prazo próprio."""
+
+    nome: str
+    acao: Callable[[Any, dict], None] | None
+    condicao: Callable[[Any, dict], Any]
+    prazo: float
+
+
+def _clicar_botao_cura(driver, ctx: dict) -> None:
+    ctx["pronto"].click()
+
+
+ETAPAS_CURA = [
+    EtapaCura(
+        "navegar",
+        lambda d, ctx: d.get(URL_HEALER),
+        lambda d, ctx: d.current_url.startswith("https://web.simple-mmo.com/healer"),
+        15.0,
+    ),
+    EtapaCura(
+        "pronto",
+        None,
+        lambda d, ctx: EC.element_to_be_clickable((By.XPATH, XPATH_BOTAO_CURA))(d),
+        10.0,
+    ),
+    EtapaCura(
+        "clicar",
+        _clicar_botao_cura,
+        lambda d, ctx: d.execute_script(SCRIPT_CURA_CONFIRMADA),
+        8.0,
+    ),
+    EtapaCura(
+        "retornar",
+        lambda d, ctx: d.get(URL_TRAVEL),
+        lambda d, ctx: d.current_url.startswith(URL_TRAVEL),
+        15.0,
+    ),
+]
+
+# Espera padrão após uma cura preventiva falhar (segundos)
+INTERVALO_CURA_FALHA = 300.0
+
+_ultima_falha_cura = 0.0
+
+# Latências recentes por etapa (segundos)
+_latencias_cura: dict[str, deque[float]] = {
+    etapa.nome: deque(maxlen=50) for etapa in ETAPAS_CURA
+}
+
+
+def latencias_etapas_cura() -> dict[str, float]:
+    """Latência média recente de cada etapa da cura."""
+    return {
+        nome: sum(amostras) / len(amostras)
+        for nome, amostras in _latencias_cura.items()
+        if amostras
+    }
+
+
+def executar_pipeline_cura(driver, log_fn: Callable[[str], None]) -> bool:
+    """Executa as etapas da cura, cada uma aguardando sua condição até o prazo."""
+    ctx: dict[str, Any] = {}
+    for etapa in ETAPAS_CURA:
+        inicio = time.time()
+        try:
+            if etapa.acao:
+                etapa.acao(driver, ctx)
+            ctx[etapa.nome] = WebDriverWait(
+                driver, etapa.prazo, poll_frequency=0.2
+            ).until(lambda d, etapa=etapa: etapa.condicao(d, ctx))
+        except TimeoutException:
+            log_fn(f"⚠️ Falha ao curar: etapa '{etapa.nome}' excedeu {etapa.prazo:.0f}s")
+            return False
+        except Exception as e:
+            log_fn(f"⚠️ Falha ao curar na etapa '{etapa.nome}': {e}")
+            return False
+
+        latencia = time.time() - inicio
+        _latencias_cura[etapa.nome].append(latencia)
+        logging.debug(f"Etapa de cura '{etapa.nome}' concluída em {latencia:.2f}s")
+
+    return True
+
+
+def curar_personagem(log_box=None, motivo: str = "morte") -> bool:
+    """Cura o personagem (após a morte ou de forma preventiva)."""
+    inicio = time.time()
+    sucesso = _curar_personagem(log_box, motivo)
+    estatisticas.registrar_cura(motivo, time.time() - inicio, sucesso)
+    if sucesso:
+        _marcar_hp_cheio()
+
+    perdido = estatisticas.tempo_perdido_cura(time.time() - 24 * 3600)
+    resumo = ", ".join(f"{m}: {t:.0f}s" for m, t in perdido.items())
+    inserir_log(log_box, f"⏱️ Tempo em curas nas últimas 24h - {resumo}", debug=True)
+    return sucesso
+
+
+def _marcar_hp_cheio() -> None:
+    """Marca o HP como cheio após a cura (sem máximo conhecido, força nova leitura)."""
+    if _hp.maximo:
+        registrar_hp(_hp.maximo)
+        return
+    # HP desconhecido não indica risco até a próxima leitura da página
+    _hp.atual = None
+    _hp.momento = 0.0
+
+
+def _curar_personagem(log_box=None, motivo: str = "morte") -> bool:
+    """Implementação de curar_personagem."""
     driver = get_driver()
     if not driver:
         inserir_log(log_box, "❌ Driver não iniciado para curar personagem.")
         return False
 
-    try:
+    if motivo == "morte":
         inserir_log(log_box, "💀 Personagem morto. Curando...")
-        driver.get("https://web.simple-mmo.com/healer?new_page_refresh=true")
-        time.sleep(3)
+    else:
+        inserir_log(log_box, "🩹 Cura preventiva antes do próximo encontro...")
 
-        botao = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "//button[contains(text(), 'Heal Character')]")
-            )
-        )
-        botao.click()
-        time.sleep(3)
-        driver.get("https://web.simple-mmo.com/travel")
-        time.sleep(3)
+    if not executar_pipeline_cura(driver, lambda msg: inserir_log(log_box, msg)):
+        return False
 
-        inserir_log(log_box, "💊 Cura realizada.")
-        return True
+    registrar_acao("Heal")
+    inserir_log(log_box, "💊 Cura realizada.")
+    return True
 
-    except Exception as e:
-        inserir_log(log_box, f"⚠️ Falha ao curar: {e}")
-        return False
+
+def _intervalo_cura_falha() -> float:
+    """Espera configurada entre uma cura preventiva falha e a próxima tentativa."""
+    try:
+        return max(0.0, float(obter_configuracao("intervalo_cura_falha")))
+    except (TypeError, ValueError):
+        return INTERVALO_CURA_FALHA
 
 
-def verificar_e_curar_hp() -> bool:
-    """Verifica HP e cura se necessário."""
-    # Simplificado - sempre retorna True na versão sem monitoramento de HP
+def verificar_e_curar_hp(log_box=None) -> bool:
+    """
+    Verifica HP e cura se necessário.
+
+    Cura após a morte e, com o modo attack ativo, de forma preventiva quando
+    o histórico de dano indica que a próxima luta deixaria o HP abaixo do
+    limite de cura. Se a cura preventiva falhar, as lutas são evitadas pela
+    política de encontros (risco_proxima_luta), as demais atividades seguem e
+    a próxima tentativa aguarda `intervalo_cura_falha` segundos.
+
+    Returns:
+        False se o personagem está morto e não foi possível curar
+    """
+    global _ultima_falha_cura
+
+    if time.time() - _hp.momento > VALIDADE_LEITURA_HP:
+        dados = ler_hp_pagina()
+        if dados and dados.get("morto"):
+            return verificar_e_curar(log_box)
+
+    if not obter_configuracao("modo_attack_ativo") or not risco_proxima_luta():
+        return True
+    if time.time() - _ultima_falha_cura < _intervalo_cura_falha():
+        return True
+
+    inserir_log(
+        log_box,
+        f"🩺 HP {_hp.atual}/{_hp.maximo or '?'} com dano previsto de "
+        f"{prever_dano()} - curando antes do próximo encontro",
+        "warning",
+    )
+    if not curar_personagem(log_box, motivo="preventiva"):
+        _ultima_falha_cura = time.time()
+        inserir_log(
+            log_box, "⚠️ Cura preventiva falhou, evitando lutas por enquanto", "warning"
+        )
     return True
 
 
 # Função original mantida para compatibilidade com o bot_loop atual
 def curar(driver, log_fn=print) -> bool:
     """Função original mantida para compatibilidade."""
-    try:
-        log_fn("💀 Personagem morto. Curando...")
-        driver.get("https://web.simple-mmo.com/healer?new_page_refresh=true")
-        time.sleep(3)
-
-        botao = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "//button[contains(text(), 'Heal Character')]")
-            )
-        )
-        botao.click()
-        time.sleep(3)
-        driver.get("https://web.simple-mmo.com/travel")
-        time.sleep(3)
-
-        log_fn("💊 Cura realizada.")
-        return True
-    except Exception as e:
-        log_fn(f"⚠️ Falha ao curar: {e}")
+    log_fn("💀 Personagem morto. Curando...")
+    if not executar_pipeline_cura(driver, log_fn):
         return False
+
+    log_fn("💊 Cura realizada.")
+    return True
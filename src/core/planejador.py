@@ -0,0 +1,505 @@
+"""
+Planejador de Sessão SimpleMMO Bot
+
+Este módulo define a ordem das atividades (quest, arena, luta, coleta e
+step) pelo valor marginal por segundo de cada uma, medido no histórico
+local segundo o objetivo configurado (XP ou gold), e pelos recursos atuais
+(energia, quest points e HP). O plano é refeito quando os recursos mudam ou
+as medições são renovadas.
+
+Os mesmos cálculos rodam offline sobre sessões gravadas, simulando a
+sessão sob políticas diferentes para compará-las.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import random
+import time
+
+from core import estatisticas, healing, politica, quest, step
+from core.context import obter_configuracao
+from utils.logger import inserir_log
+
+# Ordem fixa anterior ao planejador: quest e arena, luta, coleta, step
+ORDEM_FIXA = ("quest", "arena", "luta", "coleta", "step")
+
+# Intervalo mínimo entre replanejamentos (segundos)
+INTERVALO_REPLANEJAMENTO = 10.0
+
+# Intervalo entre medições do histórico (segundos): cada uma percorre a janela
+INTERVALO_MEDICAO = 300.0
+
+# Janela de histórico usada nas medições ao vivo (horas)
+JANELA_MEDICOES_HORAS = 24.0
+
+# Energia mínima para uma rodada de arena
+ENERGIA_MINIMA_ARENA = 1
+
+# Ritmo do motor abaixo disso ainda não é uma medição confiável (steps/hora)
+MIN_PASSOS_HORA_MEDIDOS = 60.0
+
+# Intervalos entre steps acima disso são pausas, não duração de step (segundos)
+MAX_INTERVALO_PASSO = 60.0
+
+
+@dataclass
+class Recursos:
+    """Recursos atuais do jogador que limitam as atividades."""
+
+    energia: int | None = None
+    pontos_quest: int | None = None
+    maximo_quest: int | None = None
+    risco_hp: bool = False
+    fracao_arena: float = 0.0  # Fração do tempo recente gasto na arena
+
+
+@dataclass
+class Amostras:
+    """Custo (segundos) e recompensa de cada atividade no histórico gravado."""
+
+    passos: list[tuple[str, float]] = field(default_factory=list)
+    duracao_passo: float | None = None
+    lutas: dict[str, list[tuple[float, float]]] = field(default_factory=dict)
+    coletas: dict[str, list[tuple[float, float]]] = field(default_factory=dict)
+    quests: list[tuple[float, float]] = field(default_factory=list)
+    quests_por_hora: float = 0.0
+    maximo_quest: int = 0
+
+
+@dataclass
+class Plano:
+    """Ordem das atividades e o valor por segundo que a justificou."""
+
+    ordem: list[str]
+    valores: dict[str, float | None]
+    criado_em: float = field(default_factory=time.time)
+
+    @property
+    def custo_oportunidade(self) -> float | None:
+        """Valor por segundo de seguir dando steps."""
+        return self.valores.get("step")
+
+    def permite(self, atividade: str) -> bool:
+        """Indica se a atividade vem antes do step no plano."""
+        if atividade not in self.ordem:
+            return False
+        return self.ordem.index(atividade) < self.ordem.index("step")
+
+    def descricao(self) -> str:
+        """Ordem do plano com o valor de cada atividade."""
+        partes = []
+        for atividade in self.ordem:
+            valor = self.valores.get(atividade)
+            partes.append(
+                f"{atividade} {valor:.2f}/s" if valor is not None else f"{atividade} ?"
+            )
+        return " > ".join(partes)
+
+
+# ===============================
+# MEDIÇÕES
+# ===============================
+
+
+def _recompensa(registro: dict, objetivo: str) -> float:
+    """Recompensa do registro segundo o objetivo."""
+    return float(registro.get(objetivo) or 0)
+
+
+def _valor_coleta(tipo: str, material: str | None, quantidade: float) -> float | None:
+    """
+    Valor de uma coleta na unidade do objetivo.
+
+    O valor configurado do material (valor_materiais) é ponderado pelo peso do
+    tipo (pesos_coleta), como em gather.valor_alvo_coleta. Sem valor
+    configurado para o material, a coleta não tem valor comparável (None).
+    """
+    valores = obter_configuracao("valor_materiais")
+    if not material or not isinstance(valores, dict) or material not in valores:
+        return None
+    pesos = obter_configuracao("pesos_coleta")
+    peso = pesos.get(tipo, 1.0) if isinstance(pesos, dict) else 1.0
+    return float(peso) * float(valores[material]) * quantidade
+
+
+def _duracao_passo(passos: list[dict]) -> float | None:
+    """Mediana do intervalo entre steps consecutivos, sem contar pausas."""
+    momentos = sorted(p.get("timestamp", 0) for p in passos)
+    intervalos = sorted(
+        b - a
+        for a, b in zip(momentos, momentos[1:])
+        if 0 < b - a <= MAX_INTERVALO_PASSO
+    )
+    return intervalos[len(intervalos) // 2] if intervalos else None
+
+
+def carregar_amostras(
+    objetivo: str | None = None, desde: float | None = None, ate: float | None = None
+) -> Amostras:
+    """Monta as amostras de custo e recompensa a partir dos registros gravados."""
+    objetivo = objetivo or politica.objetivo_atual()
+
+    def janela(registro: estatisticas.RegistroEventos) -> list[dict]:
+        eventos = registro.registros(desde)
+        return [e for e in eventos if ate is None or e.get("timestamp", 0) <= ate]
+
+    amostras = Amostras()
+
+    passos = janela(estatisticas.passos)
+    amostras.passos = [
+        (p.get("tipo") or "desconhecido", _recompensa(p, objetivo)) for p in passos
+    ]
+    amostras.duracao_passo = _duracao_passo(passos)
+
+    for luta in janela(estatisticas.lutas):
+        custo = luta.get("duracao", 0) + politica.OVERHEAD_LUTA
+        amostras.lutas.setdefault(luta.get("origem") or "travel", []).append(
+            (custo, _recompensa(luta, objetivo))
+        )
+
+    for coleta in janela(estatisticas.coletas):
+        tipo = coleta.get("tipo") or "desconhecido"
+        valor = _valor_coleta(tipo, coleta.get("material"), coleta.get("quantidade", 0))
+        if valor is None:
+            continue
+        amostras.coletas.setdefault(tipo, []).append((coleta.get("duracao", 0), valor))
+
+    lotes = janela(estatisticas.quests)
+    for lote in lotes:
+        quantidade = lote.get("quantidade") or 0
+        if quantidade:
+            por_quest = (
+                lote.get("duracao", 0) / quantidade,
+                _recompensa(lote, objetivo) / quantidade,
+            )
+            amostras.quests.extend([por_quest] * quantidade)
+            amostras.maximo_quest = max(amostras.maximo_quest, quantidade)
+    if len(lotes) >= 2:
+        horas = (lotes[-1]["timestamp"] - lotes[0]["timestamp"]) / 3600
+        if horas > 0:
+            # Os pontos do primeiro lote foram acumulados antes da janela
+            amostras.quests_por_hora = (
+                sum(lote.get("quantidade", 0) for lote in lotes[1:]) / horas
+            )
+
+    return amostras
+
+
+def _por_segundo(amostras: list[tuple[float, float]]) -> float | None:
+    """Recompensa total dividida pelo tempo total (None sem amostras)."""
+    duracao = sum(d for d, _ in amostras)
+    return sum(r for _, r in amostras) / duracao if duracao > 0 else None
+
+
+def medir(
+    amostras: Amostras, passos_hora: float | None = None
+) -> dict[str, float | None]:
+    """
+    Valor por segundo de cada atividade.
+
+    O step vale apenas a recompensa direta média dos steps com desfecho
+    conhecido: a luta encontrada é avaliada à parte. `passos_hora` (ritmo
+    atual do motor) substitui a duração gravada.
+    """
+    duracao_passo = 3600 / passos_hora if passos_hora else amostras.duracao_passo
+    conhecidos = [r for tipo, r in amostras.passos if tipo != "desconhecido"]
+    valores: dict[str, float | None] = {
+        "step": (
+            sum(conhecidos) / len(conhecidos) / duracao_passo
+            if conhecidos and duracao_passo
+            else None
+        ),
+        "luta": _por_segundo(amostras.lutas.get("travel", [])),
+        "arena": _por_segundo(amostras.lutas.get("arena", [])),
+        "quest": _por_segundo(amostras.quests),
+    }
+
+    coletas = {tipo: _por_segundo(lista) for tipo, lista in amostras.coletas.items()}
+    for tipo, valor in coletas.items():
+        valores[f"coleta:{tipo}"] = valor
+    conhecidas = [v for v in coletas.values() if v is not None]
+    # A coleta escolhe o melhor alvo visível; o plano usa o melhor tipo medido
+    valores["coleta"] = max(conhecidas) if conhecidas else None
+    return valores
+
+
+# ===============================
+# DECISÃO
+# ===============================
+
+
+def _fracao_maxima_arena() -> float:
+    """Fração máxima do tempo da sessão reservada à arena."""
+    try:
+        return float(obter_configuracao("fracao_maxima_arena"))
+    except (TypeError, ValueError):
+        return 0.25
+
+
+def viaveis(recursos: Recursos) -> set[str]:
+    """Atividades que os recursos atuais permitem."""
+    atividades = {"step", "coleta"}
+    if not recursos.risco_hp:
+        atividades.add("luta")
+        if (
+            recursos.energia is None or recursos.energia >= ENERGIA_MINIMA_ARENA
+        ) and recursos.fracao_arena < _fracao_maxima_arena():
+            atividades.add("arena")
+    if recursos.pontos_quest is None or recursos.pontos_quest > 0:
+        atividades.add("quest")
+    return atividades
+
+
+def decidir(valores: dict[str, float | None], recursos: Recursos) -> Plano:
+    """
+    Ordena as atividades viáveis pelo valor por segundo.
+
+    Atividades ainda sem medição empatam com o step e vêm antes dele, para
+    serem exploradas. Quest points no limite de lote passam à frente de tudo
+    (os pontos acima do máximo seriam perdidos).
+    """
+    custo = valores.get("step") or 0.0
+    candidatas = [a for a in ORDEM_FIXA if a in viaveis(recursos)]
+
+    def chave(atividade: str) -> tuple[float, int, int]:
+        valor = valores.get(atividade)
+        return (
+            -(valor if valor is not None else custo),
+            1 if atividade == "step" else 0,
+            ORDEM_FIXA.index(atividade),
+        )
+
+    ordem = sorted(candidatas, key=chave)
+    if (
+        "quest" in ordem
+        and recursos.pontos_quest
+        and recursos.maximo_quest
+        and recursos.pontos_quest >= recursos.maximo_quest * quest.limite_quest()
+    ):
+        ordem.remove("quest")
+        ordem.insert(0, "quest")
+    return Plano(ordem=ordem, valores=valores)
+
+
+# ===============================
+# PLANO AO VIVO
+# ===============================
+
+_plano: Plano | None = None
+_assinatura: tuple | None = None
+_valores: dict[str, float | None] | None = None
+_medido_em = 0.0
+
+
+def ler_recursos(energia: int | None = None) -> Recursos:
+    """Lê os recursos atuais (energia já lida pelo loop é repassada)."""
+    pontos, maximo = quest.ler_pontos_quest()
+    arena = estatisticas.tempo_por_origem(time.time() - 3600).get("arena", {})
+    return Recursos(
+        energia=energia,
+        pontos_quest=pontos,
+        maximo_quest=maximo,
+        risco_hp=healing.risco_proxima_luta(),
+        fracao_arena=arena.get("duracao", 0.0) / 3600,
+    )
+
+
+def plano_atual(energia: int | None = None, log_box=None) -> Plano:
+    """
+    Retorna o plano vigente, refeito quando os recursos mudam.
+
+    A verificação ocorre no máximo a cada INTERVALO_REPLANEJAMENTO segundos; as
+    medições do histórico são renovadas a cada INTERVALO_MEDICAO segundos.
+    """
+    global _plano, _assinatura, _valores, _medido_em
+
+    agora = time.time()
+    if _plano is not None and agora - _plano.criado_em < INTERVALO_REPLANEJAMENTO:
+        return _plano
+
+    recursos = ler_recursos(energia)
+    assinatura = (
+        recursos.pontos_quest,
+        recursos.risco_hp,
+        recursos.energia is not None and recursos.energia >= ENERGIA_MINIMA_ARENA,
+        recursos.fracao_arena >= _fracao_maxima_arena(),
+    )
+    remedir = _valores is None or agora - _medido_em >= INTERVALO_MEDICAO
+    if _plano is not None and not remedir and assinatura == _assinatura:
+        _plano.criado_em = agora
+        return _plano
+
+    if remedir:
+        amostras = carregar_amostras(desde=agora - JANELA_MEDICOES_HORAS * 3600)
+        passos_hora = step.metricas_step()["passos_hora"]
+        if passos_hora < MIN_PASSOS_HORA_MEDIDOS:
+            passos_hora = None
+        _valores, _medido_em = medir(amostras, passos_hora), agora
+
+    novo = decidir(_valores, recursos)
+    if _plano is None or novo.ordem != _plano.ordem:
+        inserir_log(log_box, f"🗺️ Plano: {novo.descricao()}")
+    _plano, _assinatura = novo, assinatura
+    return novo
+
+
+# ===============================
+# SIMULAÇÃO OFFLINE
+# ===============================
+
+# Política: recebe os valores medidos e os recursos e devolve a ordem das atividades
+PoliticaPlano = Callable[[dict[str, float | None], Recursos], list[str]]
+
+
+def politica_fixa(valores: dict[str, float | None], recursos: Recursos) -> list[str]:
+    """Ordem fixa anterior ao planejador."""
+    return list(ORDEM_FIXA)
+
+
+def politica_planejador(
+    valores: dict[str, float | None], recursos: Recursos
+) -> list[str]:
+    """Ordem pelo valor marginal por segundo."""
+    return decidir(valores, recursos).ordem
+
+
+POLITICAS: dict[str, PoliticaPlano] = {
+    "fixa": politica_fixa,
+    "planejador": politica_planejador,
+}
+
+
+@dataclass
+class ResultadoSimulacao:
+    """Resultado médio de uma política simulada sobre o histórico."""
+
+    politica: str
+    valor_hora: float
+    tempo_por_atividade: dict[str, float]
+
+
+def simular_sessao(
+    amostras: Amostras,
+    politica_plano: PoliticaPlano,
+    duracao: float = 3600.0,
+    semente: int = 0,
+) -> tuple[float, dict[str, float]]:
+    """
+    Simula uma sessão sorteando custo e recompensa das amostras gravadas.
+
+    Um step pode revelar um NPC (luta) ou um material (coleta), disponíveis
+    apenas na decisão seguinte; quest points se recuperam no ritmo gravado e
+    a arena respeita o intervalo configurado. A energia não é gravada e não
+    limita a simulação.
+
+    Returns:
+        Recompensa total e segundos gastos em cada atividade
+    """
+    if not amostras.passos or not amostras.duracao_passo:
+        return 0.0, {}
+
+    sorteio = random.Random(semente)
+    valores = medir(amostras)
+    try:
+        intervalo_arena = float(obter_configuracao("intervalo_arena"))
+    except (TypeError, ValueError):
+        intervalo_arena = 600.0
+
+    agora = total = 0.0
+    pontos = 0.0
+    ultima_arena = -intervalo_arena
+    pendente: str | None = None
+    tempos: dict[str, float] = {}
+
+    while agora < duracao:
+        recursos = Recursos(
+            pontos_quest=int(pontos),
+            maximo_quest=amostras.maximo_quest or None,
+            fracao_arena=tempos.get("arena", 0.0) / max(agora, 1.0),
+        )
+        disponiveis = {"step"}
+        if pendente:
+            disponiveis.add(pendente)
+        # Quests em lote a partir do limite configurado, como no loop
+        if amostras.quests and pontos >= max(
+            1, (amostras.maximo_quest or 0) * quest.limite_quest()
+        ):
+            disponiveis.add("quest")
+        if amostras.lutas.get("arena") and agora - ultima_arena >= intervalo_arena:
+            disponiveis.add("arena")
+
+        ordem = politica_plano(valores, recursos)
+        atividade = next((a for a in ordem if a in disponiveis), "step")
+        pendente = None
+
+        if atividade == "step":
+            tipo, recompensa = sorteio.choice(amostras.passos)
+            gasto = amostras.duracao_passo
+            if tipo == "npc" and amostras.lutas.get("travel"):
+                pendente = "luta"
+            elif tipo == "material" and amostras.coletas:
+                pendente = "coleta"
+        elif atividade == "luta":
+            gasto, recompensa = sorteio.choice(amostras.lutas["travel"])
+        elif atividade == "coleta":
+            tipo = sorteio.choice(list(amostras.coletas))
+            gasto, recompensa = sorteio.choice(amostras.coletas[tipo])
+        elif atividade == "arena":
+            gasto, recompensa = sorteio.choice(amostras.lutas["arena"])
+            ultima_arena = agora
+        else:
+            lote = [sorteio.choice(amostras.quests) for _ in range(int(pontos))]
+            gasto = sum(d for d, _ in lote)
+            recompensa = sum(r for _, r in lote)
+            pontos -= len(lote)
+
+        gasto = max(gasto, 0.1)
+        agora += gasto
+        total += recompensa
+        tempos[atividade] = tempos.get(atividade, 0.0) + gasto
+        pontos = min(
+            amostras.maximo_quest or float("inf"),
+            pontos + amostras.quests_por_hora * gasto / 3600,
+        )
+
+    return total, tempos
+
+
+def comparar_politicas(
+    desde: float | None = None,
+    ate: float | None = None,
+    duracao: float = 3600.0,
+    repeticoes: int = 20,
+    politicas: dict[str, PoliticaPlano] | None = None,
+) -> list[ResultadoSimulacao]:
+    """Compara políticas simulando sessões sobre o histórico gravado na janela."""
+    amostras = carregar_amostras(desde=desde, ate=ate)
+    resultados = []
+    for nome, politica_plano in (politicas or POLITICAS).items():
+        total = 0.0
+        tempos: dict[str, float] = {}
+        for semente in range(repeticoes):
+            valor, gastos = simular_sessao(amostras, politica_plano, duracao, semente)
+            total += valor
+            for atividade, segundos in gastos.items():
+                tempos[atividade] = tempos.get(atividade, 0.0) + segundos / repeticoes
+        resultados.append(
+            ResultadoSimulacao(
+                politica=nome,
+                valor_hora=total / repeticoes * 3600 / duracao,
+                tempo_por_atividade=tempos,
+            )
+        )
+    return sorted(resultados, key=lambda r: r.valor_hora, reverse=True)
+
+
+if __name__ == "__main__":
+    objetivo = politica.objetivo_atual()
+    for resultado in comparar_politicas():
+        tempos = ", ".join(
+            f"{atividade} {segundos:.0f}s"
+            for atividade, segundos in resultado.tempo_por_atividade.items()
+        )
+        print(
+            f"{resultado.politica}: {resultado.valor_hora:.1f} {objetivo}/h ({tempos})"
+        )
@@ -0,0 +1,155 @@
+"""
+Política de Encontros SimpleMMO Bot
+
+Este módulo decide, para cada NPC encontrado no travel, se vale a pena
+lutar ou seguir dando steps. A decisão usa o custo (duração) e a
+recompensa (XP ou gold) históricos da luta contra aquele NPC, segundo o
+objetivo configurado, e é sempre registrada com o valor previsto.
+"""
+
+from dataclasses import dataclass
+
+from core import estatisticas, healing
+from core.context import obter_configuracao
+from driver.manager import get_driver
+from utils.logger import inserir_log
+
+# Lutas necessárias antes de confiar no histórico de um NPC (exploração)
+MIN_LUTAS_HISTORICO = 3
+
+# Tempo fixo de entrar/sair da luta somado à duração média (segundos)
+OVERHEAD_LUTA = 4.0
+
+# Lê nome e nível do NPC no cartão do encontro em volta do botão Attack
+SCRIPT_INFO_ENCONTRO = """
+const botao = arguments[0];
+let cartao = botao;
+for (let i = 0; i < 4 && cartao.parentElement; i++) {
+    cartao = cartao.parentElement;
+    if ((cartao.innerText || '').split('\\n').length >= 3) break;
+}
+const linhas = (cartao.innerText || '').split('\\n').map((l) => l.trim()).filter(Boolean);
+let nivel = null, nome = null;
+for (const linha of linhas) {
+    const m = linha.match(/(?:level|lvl)\\.?\\s*(\\d+)/i);
+    if (m && nivel === null) { nivel = parseInt(m[1], 10); continue; }
+    if (nome === null && !/attack/i.test(linha)) nome = linha;
+}
+return {nome: nome, nivel: nivel, url: botao.href || null};
+"""
+
+
+@dataclass
+class Encontro:
+    """NPC encontrado na página de travel."""
+
+    nome: str = "Desconhecido"
+    nivel: int | None = None
+    url: str | None = None
+
+
+@dataclass
+class DecisaoEncontro:
+    """Resultado da política para um encontro."""
+
+    lutar: bool
+    valor_previsto: float | None
+    motivo: str
+
+
+def ler_encontro(botao_attack) -> Encontro:
+    """Extrai nome, nível e URL do encontro a partir do botão Attack."""
+    driver = get_driver()
+    if not driver:
+        return Encontro()
+
+    try:
+        dados = driver.execute_script(SCRIPT_INFO_ENCONTRO, botao_attack) or {}
+    except Exception:
+        return Encontro()
+
+    return Encontro(
+        nome=dados.get("nome") or "Desconhecido",
+        nivel=dados.get("nivel"),
+        url=dados.get("url"),
+    )
+
+
+def objetivo_atual() -> str:
+    """Objetivo configurado da sessão: 'xp' ou 'gold'."""
+    objetivo = obter_configuracao("objetivo")
+    return objetivo if objetivo in ("xp", "gold") else "xp"
+
+
+def valor_luta_por_segundo(npc: str, objetivo: str | None = None) -> float | None:
+    """Recompensa média por segundo de luta contra o NPC (None sem histórico)."""
+    objetivo = objetivo or objetivo_atual()
+    historico = estatisticas.tempo_medio_por_npc().get(estatisticas.chave_npc(npc))
+    if not historico or historico["lutas"] < MIN_LUTAS_HISTORICO:
+        return None
+
+    custo = historico["duracao_media"] + OVERHEAD_LUTA
+    recompensa = historico[f"{objetivo}_medio"]
+    if recompensa is None:
+        return None
+    return recompensa / custo if custo > 0 else None
+
+
+def decidir_encontro(
+    encontro: Encontro, minimo_extra: float | None = None
+) -> DecisaoEncontro:
+    """
+    Decide se luta contra o NPC conforme o objetivo e o valor mínimo.
+
+    `minimo_extra` (custo de oportunidade do planejador) eleva o mínimo
+    configurado.
+    """
+    objetivo = objetivo_atual()
+    valor = valor_luta_por_segundo(encontro.nome, objetivo)
+
+    if healing.risco_proxima_luta(encontro.nome):
+        return DecisaoEncontro(False, valor, "HP atual não suporta o dano previsto")
+
+    if valor is None:
+        return DecisaoEncontro(True, None, "histórico insuficiente (explorando)")
+
+    try:
+        minimo = float(obter_configuracao("valor_minimo_encontro"))
+    except (TypeError, ValueError):
+        minimo = 0.0
+    if minimo_extra is not None:
+        minimo = max(minimo, minimo_extra)
+
+    if valor >= minimo:
+        return DecisaoEncontro(
+            True, valor, f"{valor:.2f} {objetivo}/s >= mínimo {minimo:.2f}"
+        )
+    return DecisaoEncontro(
+        False, valor, f"{valor:.2f} {objetivo}/s < mínimo {minimo:.2f}"
+    )
+
+
+def avaliar_encontro(
+    botao_attack,
+    log_box=None,
+    encontro: Encontro | None = None,
+    minimo_extra: float | None = None,
+) -> DecisaoEncontro:
+    """Lê o encontro (se não informado), decide e registra a decisão."""
+    if encontro is None:
+        encontro = ler_encontro(botao_attack)
+    decisao = decidir_encontro(encontro, minimo_extra)
+
+    nivel = f" (nível {encontro.nivel})" if encontro.nivel is not None else ""
+    acao = "lutar" if decisao.lutar else "seguir em frente"
+    inserir_log(
+        log_box, f"🧠 Encontro com {encontro.nome}{nivel}: {acao} — {decisao.motivo}"
+    )
+    estatisticas.registrar_decisao_encontro(
+        encontro.nome,
+        encontro.nivel,
+        decisao.lutar,
+        decisao.valor_previsto,
+        decisao.motivo,
+    )
+    return decisao
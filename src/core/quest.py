@@ -0,0 +1,329 @@
+"""
+Quests SimpleMMO Bot
+
+Este módulo gasta quest points em lotes. Quando os pontos se aproximam do
+máximo, o bot navega uma única vez até a quest escolhida e a executa em
+sequência, clicando assim que o botão reabilita, até os pontos acabarem.
+A experiência obtida em cada lote é registrada nas estatísticas.
+"""
+
+import json
+import re
+import time
+from typing import Any
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from core import captcha, checkpoint, estatisticas, step
+from core.context import definir_atividade, obter_configuracao, registrar_acao
+from driver.manager import get_driver
+from driver.rede import (
+    ativar_captura_rede,
+    capturar_resposta,
+    descartar_eventos_rede,
+    drenar_eventos_rede,
+)
+from utils.logger import inserir_log
+
+URL_QUESTS = "https://web.simple-mmo.com/quests/viewall"
+PREFIXO_QUEST = "https://web.simple-mmo.com/quests/view/"
+
+# Requisição de execução da quest observada na rede (resposta lida via CDP)
+PADROES_URL_QUEST = ("/quests/perform", "/api/quest")
+
+# Intervalo entre leituras dos quest points no travel
+INTERVALO_VERIFICACAO_QUEST = 60.0
+
+TIMEOUT_BOTAO_QUEST = 10.0
+TIMEOUT_RESULTADO_QUEST = 8.0
+
+# Quest points, máximo e nível exibidos na barra do jogador
+SCRIPT_PONTOS_QUEST = """
+const ler = (seletor) => {
+    const el = document.querySelector(seletor);
+    if (!el) return null;
+    const n = parseInt((el.textContent || '').replace(/[^\\d]/g, ''), 10);
+    return isNaN(n) ? null : n;
+};
+return {
+    pontos: ler("[x-text='user.quest_points']"),
+    maximo: ler("[x-text='user.max_quest_points']"),
+    nivel: ler("[x-text='user.level']"),
+};
+"""
+
+# Quests listadas com nível exibido no cartão
+SCRIPT_LISTA_QUESTS = """
+const visivel = (el) => !!el && el.getClientRects().length > 0;
+const quests = [];
+for (const a of document.querySelectorAll("a[href*='/quests/view/']")) {
+    if (!visivel(a)) continue;
+    let cartao = a;
+    for (let i = 0; i < 3 && cartao.parentElement; i++) cartao = cartao.parentElement;
+    const texto = cartao.innerText || '';
+    const nivel = texto.match(/level\\s*(\\d+)/i);
+    quests.push({
+        url: a.href,
+        nome: (a.innerText || '').trim().split('\\n')[0],
+        nivel: nivel ? parseInt(nivel[1], 10) : null,
+    });
+}
+return quests;
+"""
+
+# Botão de executar a quest e quest points atuais em uma única leitura
+SCRIPT_ESTADO_QUEST = """
+const visivel = (el) => !!el && el.getClientRects().length > 0;
+const botao = Array.from(document.querySelectorAll('button, a'))
+    .find((el) => /perform|do quest/i.test(el.textContent || '') && visivel(el));
+const pontos = document.querySelector("[x-text='user.quest_points']");
+const n = pontos ? parseInt(pontos.textContent.replace(/[^\\d]/g, ''), 10) : NaN;
+return {
+    elemento: botao || null,
+    pronto: !!botao && !botao.disabled,
+    pontos: isNaN(n) ? null : n,
+};
+"""
+
+_ultima_verificacao = 0.0
+_url_quest: str | None = None
+_melhor_conhecida: str | None = None
+_falhas_captura = 0
+
+
+def _exportar_estado_quest() -> dict[str, Any]:
+    """Exporta a quest escolhida e a melhor do histórico para o checkpoint."""
+    return {"url_quest": _url_quest, "melhor_conhecida": _melhor_conhecida}
+
+
+def _restaurar_estado_quest(estado: dict[str, Any]) -> None:
+    """Restaura a quest escolhida salva no checkpoint."""
+    global _url_quest, _melhor_conhecida
+    _url_quest = estado.get("url_quest")
+    _melhor_conhecida = estado.get("melhor_conhecida")
+
+
+checkpoint.registrar_provedor("quest", _exportar_estado_quest, _restaurar_estado_quest)
+
+
+def ler_pontos_quest() -> tuple[int | None, int | None]:
+    """Lê quest points atuais e máximos da página."""
+    driver = get_driver()
+    if not driver:
+        return None, None
+
+    try:
+        dados = driver.execute_script(SCRIPT_PONTOS_QUEST) or {}
+    except Exception:
+        return None, None
+    return dados.get("pontos"), dados.get("maximo")
+
+
+def limite_quest() -> float:
+    """Fração do máximo de quest points que dispara um lote."""
+    try:
+        return min(1.0, max(0.0, float(obter_configuracao("limite_quest"))))
+    except (TypeError, ValueError):
+        return 0.8
+
+
+def deve_executar_quests(pontos: int | None, maximo: int | None) -> bool:
+    """Indica se os quest points estão perto o bastante do máximo."""
+    if not pontos or not maximo:
+        return False
+    return pontos >= maximo * limite_quest()
+
+
+def _escolher_quest(driver, historico: dict[str, float], log_box=None) -> str | None:
+    """
+    Escolhe a quest pela lista entre as liberadas para o nível do jogador.
+
+    A de maior XP por ponto no histórico vence; sem histórico, a primeira.
+    """
+    driver.get(URL_QUESTS)
+    try:
+        quests = WebDriverWait(driver, TIMEOUT_BOTAO_QUEST, 0.2).until(
+            lambda d: d.execute_script(SCRIPT_LISTA_QUESTS)
+        )
+    except Exception:
+        inserir_log(log_box, "⚠️ Nenhuma quest encontrada na lista")
+        return None
+
+    try:
+        nivel = (driver.execute_script(SCRIPT_PONTOS_QUEST) or {}).get("nivel")
+    except Exception:
+        nivel = None
+    liberadas = [
+        q
+        for q in quests
+        if nivel is None or q.get("nivel") is None or q["nivel"] <= nivel
+    ] or quests[:1]
+
+    # max devolve a primeira em caso de empate: sem histórico, a primeira da lista
+    melhor = max(liberadas, key=lambda q: historico.get(q["url"], 0.0))
+    inserir_log(log_box, f"📜 Quest escolhida: {melhor['nome']}")
+    return melhor["url"]
+
+
+def _aguardar_estado(driver, condicao, timeout: float) -> dict[str, Any] | None:
+    """Aguarda o estado da quest satisfazer a condição."""
+    try:
+        return WebDriverWait(driver, timeout, 0.1).until(
+            lambda d: (lambda e: e if e and condicao(e) else None)(
+                d.execute_script(SCRIPT_ESTADO_QUEST)
+            )
+        )
+    except Exception:
+        return None
+
+
+def _recompensa_resposta(resposta: dict[str, Any] | None) -> tuple[int, int]:
+    """XP e gold informados na resposta da execução da quest."""
+    if not resposta:
+        return 0, 0
+    try:
+        dados = json.loads(resposta.get("corpo") or "")
+    except ValueError:
+        return 0, 0
+    if not isinstance(dados, dict):
+        return 0, 0
+
+    def inteiro(valor: Any) -> int:
+        numeros = re.sub(r"[^\d]", "", str(valor or ""))
+        return int(numeros) if numeros else 0
+
+    return inteiro(dados.get("exp") or dados.get("xp")), inteiro(dados.get("gold"))
+
+
+def executar_lote_quests(log_box=None, pontos: int | None = None) -> int:
+    """
+    Executa quests em sequência até os quest points acabarem.
+
+    Returns:
+        Quantidade de quests executadas
+    """
+    global _url_quest, _melhor_conhecida, _falhas_captura
+
+    driver = get_driver()
+    if not driver:
+        return 0
+
+    definir_atividade("quest")
+    inicio = time.time()
+    feitas = xp_total = gold_total = 0
+    try:
+        # Reabre a lista só quando a melhor quest do histórico passa a ser outra
+        historico = estatisticas.xp_por_quest()
+        melhor = max(historico, key=historico.get) if historico else None
+        if _url_quest is None or melhor not in (_melhor_conhecida, _url_quest):
+            _url_quest = _escolher_quest(driver, historico, log_box)
+            if _url_quest is None:
+                return 0
+        _melhor_conhecida = melhor
+        if driver.current_url != _url_quest:
+            driver.get(_url_quest)
+
+        captura = (
+            obter_configuracao("captura_rede_step")
+            and _falhas_captura < step.MAX_FALHAS_CAPTURA
+            and ativar_captura_rede()
+        )
+        limite = pontos if pontos is not None else 1000
+        inserir_log(log_box, f"📜 Iniciando lote de quests ({limite} pontos)")
+
+        while feitas < limite:
+            if captcha.verificar_captcha():
+                captcha.aguardar_resolucao(lambda msg: inserir_log(log_box, msg))
+
+            estado = _aguardar_estado(
+                driver, lambda e: e["pronto"] or e["pontos"] == 0, TIMEOUT_BOTAO_QUEST
+            )
+            if estado is None or not estado["pronto"] or estado["pontos"] == 0:
+                break
+
+            pontos_antes = estado["pontos"]
+            if captura:
+                descartar_eventos_rede()
+            else:
+                drenar_eventos_rede()
+            estado["elemento"].click()
+            registrar_acao("Quest")
+            feitas += 1
+
+            resposta = (
+                capturar_resposta(PADROES_URL_QUEST, TIMEOUT_RESULTADO_QUEST)
+                if captura
+                else None
+            )
+            if captura:
+                if resposta and resposta.get("corpo"):
+                    _falhas_captura = 0
+                else:
+                    _falhas_captura += 1
+                    captura = _falhas_captura < step.MAX_FALHAS_CAPTURA
+                    if not captura:
+                        inserir_log(
+                            log_box,
+                            "⚠️ Resposta das quests não capturada, captura desativada",
+                        )
+            xp, gold = _recompensa_resposta(resposta)
+            xp_total += xp
+            gold_total += gold
+
+            # Confirma o consumo do ponto antes do próximo clique
+            if pontos_antes is not None:
+                _aguardar_estado(
+                    driver,
+                    lambda e: e["pontos"] is not None and e["pontos"] < pontos_antes,
+                    TIMEOUT_RESULTADO_QUEST,
+                )
+    except Exception as e:
+        inserir_log(log_box, f"❌ Erro no lote de quests: {e}", "error")
+    finally:
+        definir_atividade(None)
+        duracao = time.time() - inicio
+        if feitas:
+            estatisticas.registrar_lote_quests(
+                _url_quest, feitas, xp_total, gold_total, duracao
+            )
+            _logar_xp_por_hora(log_box, feitas, xp_total, duracao)
+
+    return feitas
+
+
+def _logar_xp_por_hora(log_box, feitas: int, xp: int, duracao: float) -> None:
+    """Resume o lote e a contribuição de XP/hora de cada atividade."""
+    contribuicao = estatisticas.xp_por_hora_atividades()
+    detalhes = ", ".join(
+        f"{atividade} {valor:.0f}" for atividade, valor in contribuicao.items()
+    )
+    inserir_log(
+        log_box,
+        f"📜 {feitas} quest(s) em {duracao:.0f}s (+{xp} XP) — XP/h: {detalhes}",
+    )
+
+
+def verificar_e_executar_quests(log_box=None) -> bool:
+    """
+    Verifica periodicamente os quest points e executa um lote perto do máximo.
+
+    Returns:
+        True se algum lote foi executado (a página deixou o travel)
+    """
+    global _ultima_verificacao
+
+    if time.time() - _ultima_verificacao < INTERVALO_VERIFICACAO_QUEST:
+        return False
+    _ultima_verificacao = time.time()
+
+    pontos, maximo = ler_pontos_quest()
+    if not deve_executar_quests(pontos, maximo):
+        return False
+
+    inserir_log(log_box, f"📜 Quest points em {pontos}/{maximo}, gastando em lote")
+    feitas = executar_lote_quests(log_box, pontos)
+    if not feitas:
+        # Nada executado: se a página mudou, o roteador do loop a resolve
+        return False
+    step.navegar_para_travel(log_box)
+    return True
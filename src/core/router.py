@@ -0,0 +1,167 @@
+"""
+Roteador de Páginas SimpleMMO Bot
+
+Este módulo classifica a página atual (padrão de URL + snapshot do DOM
+obtido em uma única chamada) e despacha para o handler capaz de concluí-la
+no próprio lugar. A navegação para o travel só acontece quando nenhum
+handler assume a página.
+"""
+
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+from core import fight, gather, healing, step
+from driver.manager import get_driver
+from utils.logger import inserir_log
+
+
+class TipoPagina(Enum):
+    """Tipos de página reconhecidos pelo roteador."""
+
+    TRAVEL = "travel"
+    COMBATE = "combate"
+    COLETA = "coleta"
+    CURANDEIRO = "curandeiro"
+    DESCONHECIDA = "desconhecida"
+
+
+# Prefixos de URL -> tipo de página (o primeiro que casar vence)
+PADROES_URL: list[tuple[str, TipoPagina]] = [
+    ("https://web.simple-mmo.com/travel", TipoPagina.TRAVEL),
+    ("https://web.simple-mmo.com/npcs/attack/", TipoPagina.COMBATE),
+    ("https://web.simple-mmo.com/crafting/material/gather/", TipoPagina.COLETA),
+    ("https://web.simple-mmo.com/healer", TipoPagina.CURANDEIRO),
+]
+
+# Snapshot da página em uma única ida ao navegador
+SCRIPT_SNAPSHOT = """
+const visivel = (el) => !!el && el.offsetParent !== null;
+const botao = (texto) => {
+    for (const el of document.querySelectorAll('button, a')) {
+        if (el.textContent.trim().includes(texto) && visivel(el)) {
+            return {habilitado: !el.disabled};
+        }
+    }
+    return null;
+};
+return {
+    url: window.location.href,
+    attack: botao('Attack'),
+    leave: botao('Leave'),
+    gather: botao('Press here to gather'),
+    close: botao('Press here to close'),
+    heal: botao('Heal Character'),
+    step: botao('Take a step'),
+};
+"""
+
+HandlerPagina = Callable[[Any, dict[str, Any]], bool]
+
+
+def capturar_snapshot() -> dict[str, Any] | None:
+    """Captura URL e estado dos botões relevantes em uma única chamada."""
+    driver = get_driver()
+    if not driver:
+        return None
+
+    try:
+        return driver.execute_script(SCRIPT_SNAPSHOT)
+    except Exception:
+        return None
+
+
+def classificar_pagina(snapshot: dict[str, Any] | None) -> TipoPagina:
+    """Classifica a página a partir do snapshot."""
+    if not snapshot:
+        return TipoPagina.DESCONHECIDA
+
+    url = snapshot.get("url") or ""
+    for prefixo, tipo in PADROES_URL:
+        if url.startswith(prefixo):
+            return tipo
+    return TipoPagina.DESCONHECIDA
+
+
+# ===============================
+# HANDLERS PADRÃO
+# ===============================
+
+
+def _handler_combate(log_box, snapshot: dict[str, Any]) -> bool:
+    """Conclui um combate em andamento se houver Attack ou Leave na tela."""
+    if not (snapshot.get("attack") or snapshot.get("leave")):
+        return False
+
+    inserir_log(log_box, "🧭 Página de combate detectada, concluindo no lugar...")
+    fight.atacar_inimigo(log_box)
+    return True
+
+
+def _handler_coleta(log_box, snapshot: dict[str, Any]) -> bool:
+    """Retoma uma coleta em andamento ou fecha a interface já finalizada."""
+    if snapshot.get("gather"):
+        if gather.pode_retomar(snapshot.get("url")):
+            inserir_log(log_box, "🧭 Página de coleta detectada, retomando coleta...")
+            gather.executar_coleta_completa(log_box, retomar=True)
+        else:
+            # Progresso em memória é de outra coleta: começar do zero
+            inserir_log(log_box, "🧭 Página de coleta detectada, iniciando coleta...")
+            gather.reiniciar_estado_coleta()
+            gather.executar_coleta_completa(log_box)
+        return True
+
+    if snapshot.get("close"):
+        inserir_log(log_box, "🧭 Coleta já finalizada, fechando interface...")
+        gather.fechar_interface_coleta()
+        return True
+
+    return False
+
+
+def _handler_curandeiro(log_box, snapshot: dict[str, Any]) -> bool:
+    """Conclui uma cura interrompida se o botão de cura estiver na tela."""
+    if not snapshot.get("heal"):
+        return False
+
+    inserir_log(log_box, "🧭 Página do curandeiro detectada, concluindo a cura...")
+    return healing.curar_personagem(log_box, motivo="preventiva")
+
+
+_handlers: dict[TipoPagina, HandlerPagina] = {
+    TipoPagina.COMBATE: _handler_combate,
+    TipoPagina.COLETA: _handler_coleta,
+    TipoPagina.CURANDEIRO: _handler_curandeiro,
+}
+
+
+def registrar_handler(tipo: TipoPagina, handler: HandlerPagina) -> None:
+    """Registra (ou substitui) o handler de um tipo de página."""
+    _handlers[tipo] = handler
+
+
+def rotear_pagina(log_box=None) -> TipoPagina:
+    """
+    Classifica a página atual e despacha para o handler adequado.
+
+    Navega para o travel apenas se nenhum handler assumir a página.
+
+    Returns:
+        O tipo de página classificado
+    """
+    snapshot = capturar_snapshot()
+    tipo = classificar_pagina(snapshot)
+
+    if tipo == TipoPagina.TRAVEL:
+        return tipo
+
+    handler = _handlers.get(tipo)
+    if handler and snapshot:
+        try:
+            if handler(log_box, snapshot):
+                return tipo
+        except Exception as e:
+            inserir_log(log_box, f"⚠️ Erro no handler de {tipo.value}: {e}")
+
+    step.navegar_para_travel(log_box)
+    return tipo
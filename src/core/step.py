@@ -1,192 +1,582 @@
 """Sistema de navegação SimpleMMO Bot - Passos (steps)"""
 
-import random
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+import json
+import re
+import threading
 import time
 import tkinter as tk
-
-from selenium.webdriver.common.by import By
-
-from core.context import registrar_acao
-from driver.actions import buscar_botao_por_texto, clicar_elemento
+from typing import Any
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from core import checkpoint, estatisticas
+from core.context import obter_configuracao, registrar_acao
+from driver.actions import (
+    buscar_botao_por_texto,
+    clicar_elemento,
+    configurar_timeout_script,
+)
 from driver.manager import get_driver
+from driver.rede import (
+    ativar_captura_rede,
+    capturar_resposta,
+    desativar_captura_rede,
+    descartar_eventos_rede,
+    drenar_eventos_rede,
+)
 from utils.logger import inserir_log
+from utils.timing import sleep_interrompivel
 
 # ===============================
-# FUNÇÕES DE PASSO (STEP)
+# MOTOR DE STEP
 # ===============================
 
-
-def tentar_passo(driver, log_fn=print) -> bool:
-    """Função original mantida para compatibilidade."""
+# Seletores conhecidos do botão de step (a ordem é aprendida pelo uso)
+SELETORES_STEP = [
+    "//button[contains(., 'Take a step')]",
+    "//a[contains(., 'Take a step')]",
+    "//button[text()='Take a step']",
+    "//input[(@type='submit' or @type='button') and contains(@value, 'Take a step')]",
+]
+
+# Resolve o alvo em uma única chamada: alvo em cache, seletores na ordem
+# aprendida e, por fim, varredura completa por texto
+SCRIPT_RESOLVER_STEP = """
+const [cache, xpaths] = arguments;
+const visivel = (el) => !!el && el.isConnected && el.getClientRects().length > 0;
+const ehStep = (el) => /take a step/i.test(el.textContent || el.value || '');
+const resultado = (el, fonte, indice) => {
+    const contagem = (el.textContent || '').match(/(\\d+(?:\\.\\d+)?)\\s*s(?:ec)?\\b/i);
+    return {
+        elemento: el, fonte: fonte, indice: indice,
+        desabilitado: !!el.disabled || el.getAttribute('aria-disabled') === 'true'
+            || !!contagem,
+        contagem: contagem ? parseFloat(contagem[1]) : null,
+    };
+};
+if (cache && visivel(cache) && ehStep(cache)) return resultado(cache, 'cache', -1);
+for (let i = 0; i < xpaths.length; i++) {
+    const lista = document.evaluate(
+        xpaths[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    for (let j = 0; j < lista.snapshotLength; j++) {
+        const el = lista.snapshotItem(j);
+        if (visivel(el)) return resultado(el, i === 0 ? 'seletor' : 'descoberta', i);
+    }
+}
+for (const el of document.querySelectorAll('button, a, input')) {
+    if (visivel(el) && ehStep(el)) return resultado(el, 'descoberta', -1);
+}
+return null;
+"""
+
+# Aguarda o botão de step sair do cooldown (desabilitado ou com contagem)
+SCRIPT_AGUARDAR_STEP_LIBERADO = """
+const [botao, timeoutMs] = arguments;
+const callback = arguments[arguments.length - 1];
+const liberado = () => botao.isConnected && !botao.disabled
+    && botao.getAttribute('aria-disabled') !== 'true'
+    && !/\\d\\s*s(?:ec)?\\b/i.test(botao.textContent || '');
+if (liberado() || !botao.isConnected) {
+    callback(botao.isConnected);
+} else {
+    let timer = null;
+    const observador = new MutationObserver(() => {
+        if (liberado() || !botao.isConnected) terminar(botao.isConnected);
+    });
+    function terminar(ok) {
+        observador.disconnect();
+        clearTimeout(timer);
+        callback(ok);
+    }
+    observador.observe(botao, {
+        attributes: true, childList: true, subtree: true, characterData: true,
+    });
+    timer = setTimeout(() => terminar(liberado()), timeoutMs);
+}
+"""
+
+# Espera máxima pelo fim do cooldown quando não há contagem visível
+TIMEOUT_COOLDOWN_STEP = 15.0
+
+# Requisições do step observadas na rede (resposta lida via CDP)
+PADROES_URL_STEP = ("/travel/perform", "/api/travel", "/api/action/travel")
+TIMEOUT_RESPOSTA_STEP = 3.0
+
+# Capturas seguidas sem resposta antes de desistir da captura na sessão
+MAX_FALHAS_CAPTURA = 5
+
+# Desfechos em que não há nada na página além do próximo step
+DESFECHOS_SEM_ACAO = ("nada", "item")
+
+# Janela das métricas de desempenho
+JANELA_METRICAS_STEP = 3600
+INTERVALO_RELATORIO_STEP = 50
+
+
+class ResultadoStep(Enum):
+    """Resultado de uma tentativa de step."""
+
+    PASSO = "stepped"
+    COOLDOWN = "cooldown"
+    NAO_ENCONTRADO = "none_found"
+    ERRO = "error"
+
+
+@dataclass
+class StepOutcome:
+    """O que o step produziu, segundo a resposta da requisição."""
+
+    tipo: str = "desconhecido"  # nada, item, npc, material, desconhecido
+    texto: str = ""
+    nome: str | None = None
+    nivel: int | None = None
+    url_acao: str | None = None
+    espera: float | None = None
+    local: str | None = None
+    xp: int | None = None
+    gold: int | None = None
+
+    @property
+    def sem_acao(self) -> bool:
+        """Indica que a próxima ação é outro step (sem consultar o DOM)."""
+        return self.tipo in DESFECHOS_SEM_ACAO
+
+
+def _texto_sem_html(valor: Any) -> str:
+    """Remove tags HTML e espaços extras de um texto."""
+    return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", str(valor or ""))).strip()
+
+
+def _inteiro(valor: Any) -> int | None:
+    """Converte números como "1,234" em int (None se não for número)."""
     try:
-        log_fn(f"🌐 URL atual: {driver.current_url}")
-        log_fn("🔍 Procurando botão 'Take a step'...")
-        botoes = driver.find_elements(By.XPATH, "//button[contains(., 'Take a step')]")
-        if not botoes:
-            botoes = driver.find_elements(By.XPATH, "//a[contains(., 'Take a step')]")
-        log_fn(f"Encontrados {len(botoes)} botões 'Take a step'.")
-        for botao in botoes:
-            log_fn(
-                f"Botão exibido: {botao.is_displayed()}, habilitado: {botao.is_enabled()}"
-            )
-            if botao.is_displayed() and botao.is_enabled():
-                delay = random.uniform(1.5, 2.5)
-                log_fn(f"Aguardando {delay:.2f}s antes de clicar no botão.")
-                time.sleep(delay)
-                botao.click()
-                registrar_acao("Passo")
-                log_fn("✔ Passo realizado")
-                return True
-        log_fn("⏳ Nenhum botão de passo disponível para clicar.")
-        return False
-    except Exception as e:
-        log_fn(f"⚠️ Erro ao tentar passo: {e}")
-        return False
+        return int(str(valor).replace(",", "")) if valor is not None else None
+    except ValueError:
+        return None
 
 
-def tentar_passo_modular(log_box: tk.Text | None) -> bool:
-    """Versão modular otimizada para tentar dar um passo - DETECÇÃO RÁPIDA."""
-    driver = get_driver()
-    if not driver:
-        return False
-
+def interpretar_resposta_step(corpo: str) -> StepOutcome:
+    """Converte o corpo JSON da resposta do step em um StepOutcome."""
     try:
-        # Busca rápida usando buscar_botao_por_texto otimizado
-        resultado = buscar_botao_por_texto("Take a step", todos=False)
-        if not resultado:
-            return False
-
-        # Verifica se é uma lista ou um elemento único
-        botao = resultado[0] if isinstance(resultado, list) else resultado
-
-        # Clica no botão encontrado com delay mínimo
-        if clicar_elemento(botao):
-            inserir_log(log_box, "✔ Passo realizado", "info")
-            registrar_acao("Passo")
-            return True
+        dados = json.loads(corpo)
+    except ValueError:
+        return StepOutcome()
+    if not isinstance(dados, dict):
+        return StepOutcome()
+
+    texto = _texto_sem_html(
+        dados.get("text") or dados.get("resultText") or dados.get("message")
+    )
+    desfecho = StepOutcome(texto=texto)
+
+    espera = dados.get("wait_length") or dados.get("nextwait") or dados.get("wait")
+    try:
+        desfecho.espera = float(espera) if espera is not None else None
+    except (TypeError, ValueError):
+        pass
+
+    bruto = json.dumps(dados)
+    npc = re.search(r"/npcs/attack/[\w-]+", bruto)
+    material = re.search(r"/crafting/material/gather/[\w-]+", bruto)
+    tipo = str(dados.get("step_type") or dados.get("type") or "").lower()
+
+    if npc or tipo == "npc":
+        desfecho.tipo = "npc"
+        desfecho.url_acao = f"https://web.simple-mmo.com{npc.group(0)}" if npc else None
+    elif material or tipo == "material":
+        desfecho.tipo = "material"
+        desfecho.url_acao = (
+            f"https://web.simple-mmo.com{material.group(0)}" if material else None
+        )
+    elif tipo == "item" or dados.get("item"):
+        desfecho.tipo = "item"
+    elif tipo in ("text", "nothing"):
+        desfecho.tipo = "nada"
+
+    local = dados.get("location") or dados.get("current_location")
+    if isinstance(local, dict):
+        local = local.get("name")
+    if local:
+        desfecho.local = _texto_sem_html(local)
+    desfecho.xp = _inteiro(dados.get("exp") or dados.get("xp"))
+    desfecho.gold = _inteiro(dados.get("gold"))
+
+    nome = dados.get("name") or dados.get("title") or dados.get("heading")
+    if nome:
+        desfecho.nome = _texto_sem_html(nome)
+    nivel = re.search(r"level\s*(\d+)", texto, re.IGNORECASE)
+    if nivel:
+        desfecho.nivel = int(nivel.group(1))
+    return desfecho
+
+
+@dataclass
+class TentativaStep:
+    """Resultado estruturado de uma tentativa de step."""
+
+    resultado: ResultadoStep
+    latencia: float = 0.0
+    fonte: str | None = None
+    detalhe: str = ""
+    desfecho: StepOutcome | None = None
+
+    @property
+    def deu_passo(self) -> bool:
+        return self.resultado == ResultadoStep.PASSO
+
+
+class MotorStep:
+    """
+    Motor único de step: resolve o botão (cache → seletor aprendido →
+    descoberta), clica com uma única primitiva e mede o desempenho.
+    """
+
+    def __init__(self):
+        self._alvo = None
+        self._acertos = [0] * len(SELETORES_STEP)
+        self._passos: deque[float] = deque()
+        self._latencias: deque[float] = deque(maxlen=200)
+        self._cooldowns: deque[float] = deque(maxlen=100)
+        self._ultimo_clique = 0.0
+        self._falhas_captura = 0
+        self._lock = threading.Lock()
+
+    def _seletores_ordenados(self) -> list[int]:
+        """Índices dos seletores, do mais acertado para o menos."""
+        return sorted(
+            range(len(SELETORES_STEP)), key=lambda i: self._acertos[i], reverse=True
+        )
 
-        return False
-    except Exception as e:
-        inserir_log(log_box, f"⚠️ Erro ao tentar passo: {e}", "error")
+    def resolver(self, driver) -> dict[str, Any] | None:
+        """Localiza o botão de step em um único execute_script."""
+        ordem = self._seletores_ordenados()
+        try:
+            alvo = driver.execute_script(
+                SCRIPT_RESOLVER_STEP, self._alvo, [SELETORES_STEP[i] for i in ordem]
+            )
+        except StaleElementReferenceException:
+            self._alvo = None
+            alvo = driver.execute_script(
+                SCRIPT_RESOLVER_STEP, None, [SELETORES_STEP[i] for i in ordem]
+            )
+        if not alvo:
+            self._alvo = None
+            return None
+
+        self._alvo = alvo["elemento"]
+        if alvo["indice"] >= 0:
+            alvo["indice"] = ordem[alvo["indice"]]
+        return alvo
+
+    def _clicar(self, elemento) -> bool:
+        """Primitiva única de clique do motor (com scroll até o botão)."""
+        if clicar_elemento(elemento):
+            return True
+        self._alvo = None
         return False
 
+    def _intervalo_minimo(self) -> float:
+        """Espaçamento mínimo configurado entre steps."""
+        try:
+            return max(0.0, float(obter_configuracao("intervalo_minimo_step")))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def aguardar_liberacao(self, driver, alvo: dict[str, Any]) -> bool:
+        """Aguarda o botão sair do cooldown por notificação de mudança."""
+        timeout = TIMEOUT_COOLDOWN_STEP
+        if alvo.get("contagem") is not None:
+            timeout = min(timeout, alvo["contagem"] + 2)
+
+        configurar_timeout_script(driver)
+        liberado = bool(
+            driver.execute_async_script(
+                SCRIPT_AGUARDAR_STEP_LIBERADO, alvo["elemento"], int(timeout * 1000)
+            )
+        )
+        if liberado and time.time() - self._ultimo_clique < 60:
+            self._cooldowns.append(time.time() - self._ultimo_clique)
+        return liberado
+
+    def executar(
+        self, log_box: tk.Text | None = None, aguardar_cooldown: bool = True
+    ) -> TentativaStep:
+        """
+        Tenta dar um step e retorna o resultado estruturado.
+
+        Com `aguardar_cooldown`, um botão em cooldown é observado até reabilitar
+        e o step sai imediatamente, respeitando o intervalo mínimo configurado.
+        """
+        driver = get_driver()
+        if not driver:
+            return TentativaStep(ResultadoStep.ERRO, detalhe="Driver não disponível")
+
+        inicio = time.time()
+        try:
+            alvo = self.resolver(driver)
+            if alvo is None:
+                return TentativaStep(ResultadoStep.NAO_ENCONTRADO, time.time() - inicio)
+            if alvo["desabilitado"]:
+                if not (aguardar_cooldown and self.aguardar_liberacao(driver, alvo)):
+                    return TentativaStep(
+                        ResultadoStep.COOLDOWN, time.time() - inicio, alvo["fonte"]
+                    )
 
-def executar_step_interno(log_box: tk.Text | None) -> bool:
-    """Executa um step internamente sem logging externo - OTIMIZADO."""
-    driver = get_driver()
-    if not driver:
-        return False
+            espera = self._intervalo_minimo() - (time.time() - self._ultimo_clique)
+            if espera > 0:
+                sleep_interrompivel(espera)
 
-    try:
-        # Busca rápida usando buscar_botao_por_texto otimizado
-        resultado = buscar_botao_por_texto("Take a step", todos=False)
-        if not resultado:
+            captura = (
+                obter_configuracao("captura_rede_step")
+                and self._falhas_captura < MAX_FALHAS_CAPTURA
+                and ativar_captura_rede()
+            )
+            if captura:
+                descartar_eventos_rede()
+            else:
+                drenar_eventos_rede()
+
+            inicio_clique = time.time()
+            if not self._clicar(alvo["elemento"]):
+                return TentativaStep(
+                    ResultadoStep.ERRO,
+                    time.time() - inicio,
+                    alvo["fonte"],
+                    "Alvo obsoleto",
+                )
+            self._ultimo_clique = time.time()
+            latencia = self._ultimo_clique - inicio_clique
+        except Exception as e:
+            self._alvo = None
+            return TentativaStep(
+                ResultadoStep.ERRO, time.time() - inicio, detalhe=str(e)
+            )
+
+        self._registrar_passo(alvo["indice"], latencia, log_box)
+        registrar_acao("Passo")
+        desfecho = self._capturar_desfecho() if captura else None
+        if desfecho is not None:
+            estatisticas.registrar_passo(
+                desfecho.tipo, desfecho.local, desfecho.xp, desfecho.gold
+            )
+        else:
+            estatisticas.registrar_passo("desconhecido")
+        return TentativaStep(
+            ResultadoStep.PASSO, latencia, alvo["fonte"], desfecho=desfecho
+        )
+
+    def _capturar_desfecho(self) -> StepOutcome | None:
+        """Lê o desfecho do step na resposta de rede (None se não capturada)."""
+        resposta = capturar_resposta(PADROES_URL_STEP, TIMEOUT_RESPOSTA_STEP)
+        if not resposta or not resposta.get("corpo"):
+            self._falhas_captura += 1
+            if self._falhas_captura == MAX_FALHAS_CAPTURA:
+                desativar_captura_rede()
+            return None
+        self._falhas_captura = 0
+        return interpretar_resposta_step(resposta["corpo"])
+
+    def _registrar_passo(
+        self, indice: int, latencia: float, log_box: tk.Text | None
+    ) -> None:
+        """Atualiza ranking de seletores e métricas após um step."""
+        agora = time.time()
+        with self._lock:
+            if indice >= 0:
+                self._acertos[indice] += 1
+            self._passos.append(agora)
+            while self._passos and agora - self._passos[0] > JANELA_METRICAS_STEP:
+                self._passos.popleft()
+            self._latencias.append(latencia)
+            total = len(self._passos)
+
+        if total % INTERVALO_RELATORIO_STEP == 0:
+            metricas = self.metricas()
+            teorico = metricas["passos_hora_teorico"]
             inserir_log(
                 log_box,
-                "🔍 Nenhum botão de step encontrado para execução interna",
-                debug=True,
+                f"🚶 {metricas['passos_hora']:.0f} steps/h "
+                f"(teórico {teorico:.0f}"
+                + (")" if teorico else " - sem amostras)")
+                + f", latência média {metricas['latencia_media'] * 1000:.0f}ms",
             )
-            return False
-
-        # Verifica se é uma lista ou um elemento único
-        botao = resultado[0] if isinstance(resultado, list) else resultado
 
-        # Clica no botão encontrado
-        if clicar_elemento(botao):
-            registrar_acao("Passo")
-            inserir_log(log_box, "🚶‍♂️ Step interno executado com sucesso", debug=True)
-            return True
+    def cooldown_estimado(self) -> float | None:
+        """Mediana do cooldown observado do botão de step."""
+        if not self._cooldowns:
+            return None
+        ordenados = sorted(self._cooldowns)
+        return ordenados[len(ordenados) // 2]
+
+    def metricas(self) -> dict[str, float]:
+        """
+        Steps/hora alcançados, teóricos (limite imposto pelo cooldown e pelo
+        intervalo mínimo) e latência média do motor.
+        """
+        agora = time.time()
+        with self._lock:
+            passos = [t for t in self._passos if agora - t <= JANELA_METRICAS_STEP]
+            latencias = list(self._latencias)
+        cooldown = self.cooldown_estimado()
+        teorico = (
+            3600 / max(cooldown, self._intervalo_minimo(), 0.1) if cooldown else 0.0
+        )
 
-        inserir_log(log_box, "❌ Falha ao clicar em botão de step interno", debug=True)
-        return False
-    except Exception as e:
-        inserir_log(log_box, f"❌ Erro no step interno: {e}", debug=True)
-        return False
+        if len(passos) >= 2:
+            duracao = max(agora - passos[0], 1.0)
+            passos_hora = len(passos) * 3600 / duracao
+        else:
+            passos_hora = float(len(passos))
+        return {
+            "passos_hora": passos_hora,
+            "passos_hora_teorico": teorico,
+            "latencia_media": sum(latencias) / len(latencias) if latencias else 0.0,
+        }
+
+    def exportar(self) -> dict[str, int]:
+        """Exporta o ranking de seletores para o checkpoint."""
+        return dict(zip(SELETORES_STEP, self._acertos))
+
+    def restaurar(self, ranking: dict[str, int]) -> None:
+        """Restaura o ranking de seletores salvo no checkpoint."""
+        self._acertos = [int(ranking.get(s, 0)) for s in SELETORES_STEP]
+
+
+_motor = MotorStep()
+checkpoint.registrar_provedor("step_seletores", _motor.exportar, _motor.restaurar)
+
+
+def executar_step(log_box: tk.Text | None = None) -> TentativaStep:
+    """Ponto de entrada do motor de step."""
+    tentativa = _motor.executar(log_box)
+    if tentativa.deu_passo:
+        desfecho = tentativa.desfecho
+        if desfecho and desfecho.tipo != "desconhecido":
+            inserir_log(log_box, f"✔ Passo realizado ({desfecho.tipo})")
+        else:
+            inserir_log(log_box, "✔ Passo realizado")
+    elif tentativa.resultado == ResultadoStep.ERRO:
+        inserir_log(log_box, f"⚠️ Erro ao dar passo: {tentativa.detalhe}", debug=True)
+    else:
+        inserir_log(
+            log_box, f"⏳ Step indisponível ({tentativa.resultado.value})", debug=True
+        )
+    return tentativa
 
 
-def dar_step(log_box=None) -> bool:
-    """Versão otimizada da função de dar passo - DETECÇÃO ULTRA-RÁPIDA COM DEBUG."""
-    inserir_log(log_box, "🔍 Iniciando tentativa de dar step...", debug=True)
+def metricas_step() -> dict[str, float]:
+    """Steps por hora (alcançados e teóricos) e latência média do motor."""
+    return _motor.metricas()
 
-    # Primeira tentativa: função ultra-rápida
-    inserir_log(log_box, "🚀 Tentando função rápida...", debug=True)
-    if clicar_step_rapido(log_box):
-        inserir_log(log_box, "✅ Step realizado pela função rápida", debug=True)
-        return True
 
-    inserir_log(log_box, "⚠️ Função rápida falhou, tentando fallback...", debug=True)
+# ===============================
+# FUNÇÕES DE PASSO (STEP) - COMPATIBILIDADE
+# ===============================
 
-    # Fallback: versão original com delay reduzido
-    try:
-        driver = get_driver()
-        if not driver:
-            inserir_log(log_box, "❌ Driver não disponível")
-            return False
 
-        inserir_log(log_box, "🔍 Procurando botões Take a step...", debug=True)
+def tentar_passo(driver, log_fn=print) -> bool:
+    """Função original mantida para compatibilidade."""
+    tentativa = _motor.executar()
+    log_fn("✔ Passo realizado" if tentativa.deu_passo else "⏳ Nenhum passo dado")
+    return tentativa.deu_passo
 
-        # Busca otimizada: primeiro tenta botões, depois links se necessário
-        botoes = driver.find_elements(
-            By.XPATH, "//button[contains(., 'Take a step')]"
-        ) or driver.find_elements(By.XPATH, "//a[contains(., 'Take a step')]")
 
-        inserir_log(log_box, f"📊 Encontrados {len(botoes)} elementos", debug=True)
+def tentar_passo_modular(log_box: tk.Text | None) -> bool:
+    """Mantida para compatibilidade: delega ao motor de step."""
+    return executar_step(log_box).deu_passo
 
-        # Verifica apenas os primeiros 2 elementos para acelerar
-        for i, botao in enumerate(botoes[:2]):
-            try:
-                is_displayed = botao.is_displayed()
-                is_enabled = botao.is_enabled()
-                text = botao.text.strip() if hasattr(botao, "text") else "N/A"
 
-                inserir_log(
-                    log_box,
-                    f"🔍 Elemento {i + 1}: '{text}' (display: {is_displayed}, enabled: {is_enabled})",
-                    debug=True,
-                )
+def executar_step_interno(log_box: tk.Text | None) -> bool:
+    """Mantida para compatibilidade: delega ao motor de step."""
+    return _motor.executar(log_box).deu_passo
 
-                if is_displayed and is_enabled:
-                    # Delay mínimo - apenas o necessário para parecer humano
-                    delay = random.uniform(0.3, 0.7)
-                    inserir_log(
-                        log_box,
-                        f"⏰ Aguardando {delay:.2f}s antes do clique...",
-                        debug=True,
-                    )
-                    time.sleep(delay)
-
-                    botao.click()
-                    registrar_acao("Passo")
-                    inserir_log(log_box, "✔ Passo realizado (fallback)")
-                    return True
-                else:
-                    inserir_log(
-                        log_box,
-                        f"❌ Elemento {i + 1} não disponível para clique",
-                        debug=True,
-                    )
-            except Exception as e:
-                inserir_log(log_box, f"❌ Erro no elemento {i + 1}: {e}", debug=True)
-                continue  # Tenta próximo botão se este falhar
 
-        inserir_log(log_box, "⏳ Nenhum botão de passo disponível")
-        return False
-    except Exception as e:
-        inserir_log(log_box, f"⚠️ Erro ao dar passo: {e}")
+def dar_step(log_box=None) -> bool:
+    """Dá um step pelo motor de step."""
+    return executar_step(log_box).deu_passo
+
+
+URL_TRAVEL = "https://web.simple-mmo.com/travel"
+
+# Volta ao travel sem recarregar: link do menu do site ou histórico
+SCRIPT_NAVEGAR_TRAVEL = """
+const visivel = (el) => !!el && el.getClientRects().length > 0;
+const link = Array.from(document.querySelectorAll("a[href]")).find((a) => {
+    const url = new URL(a.href, location.href);
+    return url.pathname === '/travel' && visivel(a);
+});
+if (link) { link.click(); return 'link'; }
+if (document.referrer && new URL(document.referrer).pathname === '/travel') {
+    history.back();
+    return 'historico';
+}
+return null;
+"""
+
+# Painel do travel pronto: na URL do travel e com o botão de step presente
+SCRIPT_TRAVEL_PRONTO = """
+return location.pathname.startsWith('/travel')
+    && document.readyState !== 'loading'
+    && Array.from(document.querySelectorAll('button, a'))
+        .some((el) => /take a step/i.test(el.textContent || ''));
+"""
+
+TIMEOUT_NAVEGACAO_PAGINA = 5.0
+TIMEOUT_NAVEGACAO_RECARGA = 15.0
+
+
+def _aguardar_travel_pronto(driver, timeout: float) -> bool:
+    """Aguarda o painel do travel ficar pronto."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(SCRIPT_TRAVEL_PRONTO)
+        )
+        return True
+    except Exception:
         return False
 
 
 def navegar_para_travel(log_box=None) -> None:
-    """Navega para a página de travel."""
+    """
+    Navega para a página de travel.
+
+    Tenta primeiro a navegação dentro da página (link do travel ou histórico)
+    e recorre ao carregamento completo da URL se ela não funcionar. O tempo
+    de cada caminho é registrado nas estatísticas.
+    """
     try:
         driver = get_driver()
         if not driver:
             inserir_log(log_box, "❌ Driver não disponível")
             return
 
+        inicio = time.time()
+        caminho = None
+        try:
+            caminho = driver.execute_script(SCRIPT_NAVEGAR_TRAVEL)
+        except Exception:
+            caminho = None
+
+        if caminho and _aguardar_travel_pronto(driver, TIMEOUT_NAVEGACAO_PAGINA):
+            duracao = time.time() - inicio
+            estatisticas.registrar_navegacao(caminho, duracao, True)
+            inserir_log(
+                log_box, f"🧭 Travel via {caminho} ({duracao:.1f}s)", debug=True
+            )
+            return
+        if caminho:
+            estatisticas.registrar_navegacao(caminho, time.time() - inicio, False)
+
         inserir_log(log_box, "🧭 Navegando para travel...")
-        driver.get("https://web.simple-mmo.com/travel")
-        time.sleep(2)
+        inicio = time.time()
+        driver.get(URL_TRAVEL)
+        sucesso = _aguardar_travel_pronto(driver, TIMEOUT_NAVEGACAO_RECARGA)
+        estatisticas.registrar_navegacao("recarga", time.time() - inicio, sucesso)
 
     except Exception as e:
         inserir_log(log_box, f"⚠️ Erro ao navegar: {e}")
@@ -213,171 +603,18 @@ def verificar_botoes_step() -> int:
 
 
 def buscar_botao_step_rapido() -> bool:
-    """Busca específica ultra-rápida para botões Take a step."""
+    """Indica se há botão de step disponível para clique."""
     driver = get_driver()
     if not driver:
         return False
 
     try:
-        # XPath direto e mais específico
-        xpath = "//button[contains(., 'Take a step')]"
-        botoes = driver.find_elements(By.XPATH, xpath)
-
-        # Verifica apenas o primeiro elemento encontrado
-        if botoes:
-            botao = botoes[0]
-            return botao.is_displayed() and botao.is_enabled()
-
-        # Fallback para links (raramente usado)
-        xpath_link = "//a[contains(., 'Take a step')]"
-        links = driver.find_elements(By.XPATH, xpath_link)
-        if links:
-            link = links[0]
-            return link.is_displayed() and link.is_enabled()
-
-        return False
+        alvo = _motor.resolver(driver)
     except Exception:
         return False
+    return alvo is not None and not alvo["desabilitado"]
 
 
 def clicar_step_rapido(log_box=None) -> bool:
-    """Clica rapidamente no botão Take a step sem delays desnecessários - COM DEBUG E FALLBACKS."""
-    driver = get_driver()
-    if not driver:
-        inserir_log(log_box, "❌ Driver não disponível (função rápida)", debug=True)
-        return False
-
-    try:
-        inserir_log(log_box, "🔍 Buscando botões (função rápida)...", debug=True)
-
-        # Lista de XPaths para tentar (do mais específico ao mais geral)
-        xpath_variants = [
-            "//button[contains(., 'Take a step')]",
-            "//button[contains(text(), 'Take a step')]",
-            "//button[text()='Take a step']",
-            "//button[contains(., 'step')]",
-            "//input[@type='submit'][contains(@value, 'Take a step')]",
-            "//input[@type='button'][contains(@value, 'Take a step')]",
-        ]
-
-        botoes = []
-        for xpath in xpath_variants:
-            try:
-                elementos = driver.find_elements(By.XPATH, xpath)
-                if elementos:
-                    botoes.extend(elementos)
-                    inserir_log(
-                        log_box,
-                        f"📊 XPath '{xpath}' encontrou {len(elementos)} elementos",
-                        debug=True,
-                    )
-            except Exception as e:
-                inserir_log(log_box, f"❌ Erro no XPath '{xpath}': {e}", debug=True)
-
-        inserir_log(
-            log_box, f"📊 Total de elementos encontrados: {len(botoes)}", debug=True
-        )
-
-        if botoes:
-            # Tenta o primeiro botão válido
-            for i, botao in enumerate(botoes[:3]):  # Máximo 3 tentativas
-                try:
-                    is_displayed = botao.is_displayed()
-                    is_enabled = botao.is_enabled()
-                    text = (
-                        botao.text.strip()
-                        if hasattr(botao, "text")
-                        else botao.get_attribute("value") or "N/A"
-                    )
-
-                    inserir_log(
-                        log_box,
-                        f"🔍 Botão {i + 1}: '{text}' (display: {is_displayed}, enabled: {is_enabled})",
-                        debug=True,
-                    )
-
-                    if is_displayed and is_enabled:
-                        # Delay mínimo apenas para parecer humano
-                        delay = random.uniform(0.2, 0.5)
-                        inserir_log(
-                            log_box, f"⏰ Delay rápido: {delay:.2f}s", debug=True
-                        )
-                        time.sleep(delay)
-
-                        botao.click()
-                        registrar_acao("Passo")
-                        inserir_log(log_box, "✔ Passo realizado (rápido)")
-                        return True
-                    else:
-                        inserir_log(
-                            log_box, f"❌ Botão {i + 1} não disponível", debug=True
-                        )
-                except Exception as e:
-                    inserir_log(log_box, f"❌ Erro no botão {i + 1}: {e}", debug=True)
-
-        # Fallback para links
-        inserir_log(log_box, "🔍 Tentando links (função rápida)...", debug=True)
-        xpath_link_variants = [
-            "//a[contains(., 'Take a step')]",
-            "//a[contains(text(), 'Take a step')]",
-            "//a[text()='Take a step']",
-            "//a[contains(., 'step')]",
-        ]
-
-        links = []
-        for xpath in xpath_link_variants:
-            try:
-                elementos = driver.find_elements(By.XPATH, xpath)
-                if elementos:
-                    links.extend(elementos)
-                    inserir_log(
-                        log_box,
-                        f"📊 XPath link '{xpath}' encontrou {len(elementos)} elementos",
-                        debug=True,
-                    )
-            except Exception as e:
-                inserir_log(
-                    log_box, f"❌ Erro no XPath link '{xpath}': {e}", debug=True
-                )
-
-        inserir_log(log_box, f"📊 Total de links encontrados: {len(links)}", debug=True)
-
-        if links:
-            link = links[0]
-            try:
-                is_displayed = link.is_displayed()
-                is_enabled = link.is_enabled()
-                text = link.text.strip() if hasattr(link, "text") else "N/A"
-
-                inserir_log(
-                    log_box,
-                    f"🔍 Link: '{text}' (display: {is_displayed}, enabled: {is_enabled})",
-                    debug=True,
-                )
-
-                if is_displayed and is_enabled:
-                    delay = random.uniform(0.2, 0.5)
-                    time.sleep(delay)
-                    link.click()
-                    registrar_acao("Passo")
-                    inserir_log(log_box, "✔ Passo realizado (rápido - link)")
-                    return True
-                else:
-                    inserir_log(
-                        log_box, "❌ Link não disponível (função rápida)", debug=True
-                    )
-            except Exception as e:
-                inserir_log(log_box, f"❌ Erro no link: {e}", debug=True)
-
-        inserir_log(
-            log_box, "❌ Nenhum elemento válido encontrado (função rápida)", debug=True
-        )
-        return False
-    except Exception as e:
-        inserir_log(log_box, f"⚠️ Erro no step rápido: {e}")
-        return False
-
-
-# ===============================
-# FUNÇÕES DE PASSO (STEP) - ORIGINAIS
-# ===============================
+    """Mantida para compatibilidade: delega ao motor de step."""
+    return executar_step(log_box).deu_passo
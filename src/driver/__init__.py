@@ -5,6 +5,7 @@ Gerenciamento essencial do Selenium WebDriver e ações básicas de automação.
 Módulos essenciais:
     manager: Gerenciamento do WebDriver (get_driver, iniciar_driver, finalizar_driver)
     actions: Ações básicas (clicar_elemento, buscar_botao_por_texto, url_comeca_com, janela_valida)
+    rede: Captura de respostas de rede via CDP (capturar_resposta)
 
 Uso recomendado:
     from driver.manager import get_driver, iniciar_driver
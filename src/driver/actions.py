@@ -156,3 +156,68 @@ def janela_valida() -> bool:
         return True
     except Exception:
         return False
+
+
+# Timeout de execute_async_script (cobre o maior long-poll do bot)
+TIMEOUT_SCRIPT_ASSINCRONO = 20
+
+_driver_timeout_script: int | None = None
+
+
+def configurar_timeout_script(driver) -> None:
+    """Ajusta o timeout de scripts assíncronos uma vez por driver."""
+    global _driver_timeout_script
+
+    if _driver_timeout_script != id(driver):
+        driver.set_script_timeout(TIMEOUT_SCRIPT_ASSINCRONO)
+        _driver_timeout_script = id(driver)
+
+
+# Hash barato da região relevante da página (painel do travel): texto e
+# estado dos botões. Calculado no navegador em uma única chamada.
+SCRIPT_FINGERPRINT = """
+const passo = Array.from(document.querySelectorAll('button, a'))
+    .find((el) => el.textContent.includes('Take a step'));
+let regiao = document.querySelector('main') || document.body;
+if (passo) {
+    regiao = passo.closest('[x-data]') || passo.parentElement || regiao;
+}
+let texto = regiao.innerText || '';
+for (const el of regiao.querySelectorAll('button, a')) {
+    texto += '|' + el.textContent.trim() + ':' + (el.disabled ? 0 : 1);
+}
+let hash = 5381;
+for (let i = 0; i < texto.length; i++) {
+    hash = ((hash << 5) + hash + texto.charCodeAt(i)) | 0;
+}
+return window.location.pathname + '#' + hash;
+"""
+
+
+def obter_fingerprint_pagina() -> str | None:
+    """Retorna um fingerprint da região relevante da página (None se falhar)."""
+    driver = get_driver()
+    if not driver:
+        return None
+
+    try:
+        return driver.execute_script(SCRIPT_FINGERPRINT)
+    except Exception:
+        return None
+
+
+def aguardar_mudanca_pagina(
+    fingerprint: str, timeout: float = 10.0, intervalo: float = 0.3
+) -> bool:
+    """Aguarda o fingerprint da página mudar. Retorna True se mudou."""
+    driver = get_driver()
+    if not driver:
+        return True
+
+    try:
+        WebDriverWait(driver, timeout, intervalo).until(
+            lambda d: obter_fingerprint_pagina() != fingerprint
+        )
+        return True
+    except TimeoutException:
+        return False
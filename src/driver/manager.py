@@ -51,6 +51,8 @@ def iniciar_driver() -> webdriver.Chrome | None:
         chrome_options.add_experimental_option(
             "debuggerAddress", config["remote_debugging_address"]
         )
+        # Eventos Network.* para a captura de respostas (driver.rede)
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
         service = Service(config["chromedriver_path"])
         _driver = webdriver.Chrome(service=service, options=chrome_options)
@@ -91,6 +93,8 @@ def conectar_ao_browser_existente() -> webdriver.Chrome | None:
         chrome_options.add_experimental_option(
             "debuggerAddress", config["remote_debugging_address"]
         )
+        # Eventos Network.* para a captura de respostas (driver.rede)
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
         service = Service(config["chromedriver_path"])
         _driver = webdriver.Chrome(service=service, options=chrome_options)
@@ -0,0 +1,147 @@
+"""
+Captura de respostas de rede via Chrome DevTools Protocol.
+
+Usa o log de performance do ChromeDriver (eventos Network.*) para encontrar
+a resposta de uma requisição e Network.getResponseBody para ler o corpo,
+sem precisar consultar o DOM.
+"""
+
+import json
+import logging
+import time
+from typing import Any
+
+from .manager import get_driver
+
+# O ChromeDriver acumula o log de performance desde o início da sessão;
+# sem captura ativa ele é esvaziado periodicamente para não crescer sem limite
+INTERVALO_DRENAGEM = 30.0
+
+_driver_rede_ativa: int | None = None
+_ultima_drenagem = 0.0
+
+
+def ativar_captura_rede() -> bool:
+    """Habilita o domínio Network do CDP uma vez por driver."""
+    global _driver_rede_ativa
+
+    driver = get_driver()
+    if not driver:
+        return False
+
+    if _driver_rede_ativa == id(driver):
+        return True
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.get_log("performance")  # Descarta eventos antigos
+        _driver_rede_ativa = id(driver)
+        return True
+    except Exception as e:
+        logging.warning(f"Captura de rede indisponível: {e}")
+        return False
+
+
+def desativar_captura_rede() -> None:
+    """Desabilita o domínio Network do CDP e descarta os eventos pendentes."""
+    global _driver_rede_ativa
+
+    driver = get_driver()
+    if not driver or _driver_rede_ativa != id(driver):
+        return
+
+    _driver_rede_ativa = None
+    try:
+        driver.execute_cdp_cmd("Network.disable", {})
+    except Exception:
+        pass
+    descartar_eventos_rede()
+
+
+def drenar_eventos_rede() -> None:
+    """Esvazia o log de performance a cada INTERVALO_DRENAGEM sem captura ativa."""
+    global _ultima_drenagem
+
+    if time.time() - _ultima_drenagem < INTERVALO_DRENAGEM:
+        return
+    _ultima_drenagem = time.time()
+    descartar_eventos_rede()
+
+
+def descartar_eventos_rede() -> None:
+    """Esvazia o log de performance antes de uma ação a ser observada."""
+    driver = get_driver()
+    if not driver:
+        return
+
+    try:
+        driver.get_log("performance")
+    except Exception:
+        pass
+
+
+def capturar_resposta(
+    padroes_url: tuple[str, ...], timeout: float = 3.0, intervalo: float = 0.05
+) -> dict[str, Any] | None:
+    """
+    Aguarda a resposta de uma requisição cuja URL contenha um dos padrões.
+
+    Returns:
+        Dict com url, status e corpo (texto), ou None se não capturada
+    """
+    driver = get_driver()
+    if not driver or _driver_rede_ativa != id(driver):
+        return None
+
+    limite = time.time() + timeout
+    pendente: dict[str, Any] | None = None
+
+    while time.time() < limite:
+        try:
+            entradas = driver.get_log("performance")
+        except Exception:
+            return None
+
+        for entrada in entradas:
+            try:
+                mensagem = json.loads(entrada["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            metodo = mensagem.get("method")
+            params = mensagem.get("params", {})
+            if metodo == "Network.responseReceived" and pendente is None:
+                resposta = params.get("response", {})
+                url = resposta.get("url", "")
+                if any(padrao in url for padrao in padroes_url):
+                    pendente = {
+                        "request_id": params.get("requestId"),
+                        "url": url,
+                        "status": resposta.get("status"),
+                    }
+            elif (
+                metodo == "Network.loadingFinished"
+                and pendente is not None
+                and params.get("requestId") == pendente["request_id"]
+            ):
+                return _ler_corpo(driver, pendente)
+
+        time.sleep(intervalo)
+
+    # Resposta vista mas sem loadingFinished no prazo: tenta ler mesmo assim
+    return _ler_corpo(driver, pendente) if pendente else None
+
+
+def _ler_corpo(driver, pendente: dict[str, Any]) -> dict[str, Any] | None:
+    """Lê o corpo da resposta pelo requestId."""
+    try:
+        corpo = driver.execute_cdp_cmd(
+            "Network.getResponseBody", {"requestId": pendente["request_id"]}
+        )
+    except Exception:
+        return None
+    return {
+        "url": pendente["url"],
+        "status": pendente["status"],
+        "corpo": corpo.get("body", ""),
+    }
@@ -6,7 +6,7 @@ Fornece a base para expansão futura e modularidade.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import threading
 import time
@@ -159,9 +159,40 @@ class PlayerData:
 class BotConfiguration:
     """Configuração do bot"""
 
+    # Conta (separa os tempos aprendidos da coleta)
+    account_name: str = "padrao"
+
     # Modos de operação
     attack_mode: bool = True
     gather_mode: bool = True
+    page_combat_mode: bool = False  # Combate conduzido por rotina na página
+    page_gather_mode: bool = False  # Coleta conduzida por rotina na página
+    quest_mode: bool = False
+    arena_mode: bool = False
+
+    # Fração do máximo de quest points que dispara um lote de quests
+    quest_threshold: float = 0.8
+
+    # Arena: intervalo entre rodadas (segundos) e lutas por rodada
+    arena_interval: float = 600.0
+    arena_max_fights: int = 5
+
+    # Planejador: ordena as atividades pelo valor por segundo; fração máxima
+    # do tempo da última hora gasta na arena
+    planner_mode: bool = False
+    arena_time_budget: float = 0.25
+
+    # Piso do intervalo entre ataques e entre steps (segundos)
+    attack_min_interval: float = 0.5
+    step_min_interval: float = 0.5
+
+    # Política de encontros: objetivo (xp, gold) e valor mínimo por segundo
+    objective: str = "xp"
+    min_encounter_value: float = 0.0
+
+    # Modelo de valor da coleta: peso por tipo (chop, mine...) e por material
+    gather_type_weights: Dict[str, float] = field(default_factory=dict)
+    material_values: Dict[str, float] = field(default_factory=dict)
 
     # Configurações de timing
     update_interval: int = 8
@@ -181,8 +212,25 @@ class BotConfiguration:
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário"""
         return {
+            "conta": self.account_name,
             "modo_attack_ativo": self.attack_mode,
             "modo_coleta_ativo": self.gather_mode,
+            "modo_combate_pagina": self.page_combat_mode,
+            "modo_coleta_pagina": self.page_gather_mode,
+            "modo_quest_ativo": self.quest_mode,
+            "limite_quest": self.quest_threshold,
+            "modo_arena_ativo": self.arena_mode,
+            "intervalo_arena": self.arena_interval,
+            "max_lutas_arena": self.arena_max_fights,
+            "planejador_ativo": self.planner_mode,
+            "fracao_maxima_arena": self.arena_time_budget,
+            "intervalo_minimo_ataque": self.attack_min_interval,
+            "intervalo_minimo_step": self.step_min_interval,
+            "objetivo": self.objective,
+            "valor_minimo_encontro": self.min_encounter_value,
+            "pesos_coleta": self.gather_type_weights,
+            "valor_materiais": self.material_values,
+            "limite_cura": self.healing_threshold,
         }
 
 
@@ -108,6 +108,22 @@ class BotControlComponent(UIComponent):
             command=self._update_gather_mode,
         ).pack(anchor="w", pady=2)
 
+        # Modos opcionais: chave de configuração -> (variável, rótulo, nome no log)
+        self.optional_modes: Dict[str, tuple] = {}
+        for chave, rotulo, nome in (
+            ("modo_quest_ativo", "📜 Modo de Quest", "Modo de quest"),
+            ("modo_arena_ativo", "🏟️ Modo de Arena", "Modo de arena"),
+            ("planejador_ativo", "🧠 Planejador", "Planejador"),
+        ):
+            var = tk.BooleanVar(value=False)
+            ttk.Checkbutton(
+                modes_frame,
+                text=rotulo,
+                variable=var,
+                command=lambda c=chave: self._update_optional_mode(c),
+            ).pack(anchor="w", pady=2)
+            self.optional_modes[chave] = (var, nome)
+
         # Botões de ação
         button_frame = ttk.Frame(self.frame)
         button_frame.pack(fill="x", pady=(10, 5))
@@ -197,6 +213,47 @@ class BotControlComponent(UIComponent):
                 },
             )
 
+    def _update_optional_mode(self, chave: str) -> None:
+        """Atualiza um dos modos opcionais (quest, arena, planejador)."""
+        var, nome = self.optional_modes[chave]
+        enabled = var.get()
+        try:
+            from core.context import atualizar_configuracao
+
+            atualizar_configuracao(chave, enabled)
+            self.publish_event(
+                EventType.LOG_MESSAGE,
+                {
+                    "entry": LogEntry(
+                        LogLevel.INFO,
+                        f"{'✅' if enabled else '❌'} {nome} {'ativado' if enabled else 'desativado'}",
+                        component="BotControl",
+                    )
+                },
+            )
+        except Exception as e:
+            self.publish_event(
+                EventType.LOG_MESSAGE,
+                {
+                    "entry": LogEntry(
+                        LogLevel.ERROR,
+                        f"Erro ao atualizar {nome.lower()}: {e}",
+                        component="BotControl",
+                    )
+                },
+            )
+
+    def _bot_configuration(self) -> BotConfiguration:
+        """Monta a configuração do bot a partir dos modos marcados na UI."""
+        modos = {chave: var.get() for chave, (var, _) in self.optional_modes.items()}
+        return BotConfiguration(
+            attack_mode=self.attack_mode_var.get(),
+            gather_mode=self.gather_mode_var.get(),
+            quest_mode=modos["modo_quest_ativo"],
+            arena_mode=modos["modo_arena_ativo"],
+            planner_mode=modos["planejador_ativo"],
+        )
+
     def _open_browser(self) -> None:
         """Abre o navegador para o SimpleMMO."""
         try:
@@ -291,6 +348,8 @@ class BotControlComponent(UIComponent):
             definir_bot_rodando(True)
             atualizar_configuracao("finalizar_bot", False)
 
+            config = self._bot_configuration()
+
             # Atualizar UI
             self.bot_status_var.set("🟢 Bot Ativo")
             self.start_button.config(state="disabled")
@@ -299,7 +358,7 @@ class BotControlComponent(UIComponent):
             # Iniciar bot em thread separada
             def run_bot():
                 try:
-                    iniciar_bot()
+                    iniciar_bot(config_bot=config)
                 except Exception as e:
                     self.publish_event(
                         EventType.LOG_MESSAGE,
@@ -424,6 +483,8 @@ class BotControlComponent(UIComponent):
 
             self.attack_mode_var.set(attack_enabled)
             self.gather_mode_var.set(gather_enabled)
+            for chave, (var, _) in self.optional_modes.items():
+                var.set(bool(obter_configuracao(chave)))
 
         except Exception as e:
             self.publish_event(
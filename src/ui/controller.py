@@ -1,13 +1,16 @@
 from core import bot_loop, context
+from ui.base import BotConfiguration
 
 
 def iniciar_bot(log_fn=print, config_bot=None):
-    """Inicia o bot com configurações específicas."""
+    """Inicia o bot com configurações específicas (dict ou BotConfiguration)."""
     if config_bot is None:
         config_bot = {
             "modo_attack_ativo": True,
             "modo_coleta_ativo": True,
         }
+    elif isinstance(config_bot, BotConfiguration):
+        config_bot = config_bot.to_dict()
 
     # Usar as novas funções de estado
     context.definir_bot_rodando(True)
@@ -164,10 +164,7 @@ class ModernBotGUI:
                 # Importar e iniciar o controlador do bot
                 from ui import controller
 
-                controller.iniciar_bot(
-                    self._log_from_bot,
-                    config.__dict__ if hasattr(config, "__dict__") else config,
-                )
+                controller.iniciar_bot(self._log_from_bot, config)
 
                 # Publicar status de sucesso
                 self.event_manager.publish(
@@ -7,6 +7,7 @@ Módulos essenciais:
     logger: Sistema de logging simplificado (inserir_log)
     timing: Controle de tempo e pausas (sleep_interrompivel, tempo_aleatorio)
     notifier: Notificações para o usuário (notificar)
+    persistencia: Persistência local em JSON (caminho_dados, salvar_json_atomico)
 """
 
 __version__ = "4.0.0"
@@ -15,6 +16,13 @@ __description__ = "Utilitários essenciais simplificados"
 from .config import carregar_config, get_chromedriver_path, get_project_root
 from .logger import inserir_log
 from .notifier import notificar
+from .persistencia import (
+    anexar_jsonl,
+    caminho_dados,
+    carregar_json,
+    ler_jsonl,
+    salvar_json_atomico,
+)
 from .timing import sleep_interrompivel, tempo_aleatorio
 
 __all__ = [
@@ -25,4 +33,9 @@ __all__ = [
     "sleep_interrompivel",
     "tempo_aleatorio",
     "notificar",
+    "caminho_dados",
+    "carregar_json",
+    "salvar_json_atomico",
+    "anexar_jsonl",
+    "ler_jsonl",
 ]
@@ -0,0 +1,77 @@
+"""
+Persistência SimpleMMO Bot
+
+Este módulo grava e lê os arquivos da pasta de dados do bot: JSON salvo de
+forma atômica (checkpoint e estado aprendido) e registros JSONL anexados
+linha a linha (estatísticas), tolerando arquivos ausentes ou corrompidos.
+"""
+
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from .config import get_project_root
+
+PASTA_DADOS = "data"
+
+
+def caminho_dados(nome_arquivo: str) -> Path:
+    """Retorna o caminho de um arquivo na pasta de dados do bot."""
+    pasta = get_project_root() / PASTA_DADOS
+    pasta.mkdir(parents=True, exist_ok=True)
+    return pasta / nome_arquivo
+
+
+def salvar_json_atomico(caminho: Path, dados: Any) -> None:
+    """Salva JSON de forma atômica (arquivo temporário + os.replace)."""
+    fd, caminho_tmp = tempfile.mkstemp(
+        dir=str(caminho.parent), prefix=f".{caminho.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(dados, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(caminho_tmp, caminho)
+    except Exception:
+        try:
+            os.remove(caminho_tmp)
+        except OSError:
+            pass
+        raise
+
+
+def carregar_json(caminho: Path, padrao: Any = None) -> Any:
+    """Carrega um arquivo JSON, retornando o padrão se ausente ou corrompido."""
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return padrao
+
+
+def anexar_jsonl(caminho: Path, registro: dict[str, Any]) -> None:
+    """Anexa um registro a um arquivo JSON Lines (uma linha por registro)."""
+    with open(caminho, "a", encoding="utf-8") as f:
+        f.write(json.dumps(registro, ensure_ascii=False, separators=(",", ":")))
+        f.write("\n")
+
+
+def ler_jsonl(caminho: Path) -> list[dict[str, Any]]:
+    """Lê todos os registros de um arquivo JSON Lines, ignorando linhas inválidas."""
+    registros = []
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            for linha in f:
+                linha = linha.strip()
+                if not linha:
+                    continue
+                try:
+                    registros.append(json.loads(linha))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return registros
@@ -1,7 +1,7 @@
 import random
 import time
 
-from core.context import encerrado, rodando
+from core import context
 
 
 def tempo_aleatorio(
@@ -18,10 +18,15 @@ def tempo_aleatorio(
 
 
 def sleep_interrompivel(segundos: float) -> None:
-    """Sleep que pode ser interrompido pela parada do bot."""
+    """
+    Sleep que pode ser interrompido pela parada do bot.
+
+    Os estados são lidos de `core.context` a cada verificação: importar os nomes
+    copiaria os valores do momento do import.
+    """
     inicio = time.time()
 
     while time.time() - inicio < segundos:
-        if encerrado or not rodando:
+        if context.encerrado or not context.rodando:
             break
         time.sleep(0.1)
@@ -0,0 +1,6 @@
+"""Configuração compartilhada dos testes: torna os pacotes de src importáveis."""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
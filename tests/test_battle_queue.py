@@ -0,0 +1,77 @@
+"""Testes da fila de batalhas (prioridade, deduplicação e expiração)."""
+
+from core import battle_queue
+from core.battle_queue import BattleQueue
+
+
+def test_retira_por_prioridade_de_origem_e_ordem_de_chegada():
+    fila = BattleQueue()
+    fila.adicionar("/arena/1", "Arena 1", "arena")
+    fila.adicionar("/manual/1", "Manual 1", "manual")
+    fila.adicionar("/travel/1", "Travel 1", "travel")
+    fila.adicionar("/travel/2", "Travel 2", "travel")
+
+    lote = fila.retirar_lote(10)
+
+    assert [b.url for b in lote] == ["/travel/1", "/travel/2", "/manual/1", "/arena/1"]
+    assert len(fila) == 0
+
+
+def test_retirar_lote_respeita_o_tamanho():
+    fila = BattleQueue()
+    for i in range(4):
+        fila.adicionar(f"/travel/{i}", f"NPC {i}", "travel")
+
+    assert len(fila.retirar_lote(3)) == 3
+    assert len(fila) == 1
+
+
+def test_url_repetida_nao_entra_duas_vezes():
+    fila = BattleQueue()
+
+    assert fila.adicionar("/travel/1", "NPC", "travel")
+    assert not fila.adicionar("/travel/1", "NPC", "manual")
+    assert len(fila) == 1
+
+
+def test_fila_cheia_recusa_novas_entradas():
+    fila = BattleQueue(tamanho_maximo=2)
+    fila.adicionar("/a", "A")
+    fila.adicionar("/b", "B")
+
+    assert not fila.adicionar("/c", "C")
+    assert len(fila) == 2
+
+
+def test_entradas_expiradas_sao_descartadas(monkeypatch):
+    monkeypatch.setitem(battle_queue.VALIDADE, "travel", -1.0)
+    fila = BattleQueue()
+    fila.adicionar("/travel/velha", "Velha", "travel")
+    fila.adicionar("/manual/1", "Manual", "manual")
+
+    assert len(fila) == 1
+    assert [b.url for b in fila.retirar_lote(5)] == ["/manual/1"]
+
+
+def test_exportar_e_restaurar_preservam_a_ordem():
+    origem = BattleQueue()
+    origem.adicionar("/arena/1", "Arena", "arena")
+    origem.adicionar("/travel/1", "Travel", "travel")
+
+    copia = BattleQueue()
+    copia.restaurar(origem.exportar())
+
+    assert [b.url for b in copia.retirar_lote(5)] == ["/travel/1", "/arena/1"]
+
+
+def test_retirar_lote_por_origem_mantem_as_demais():
+    fila = BattleQueue()
+    fila.adicionar("/travel/1", "Travel", "travel")
+    fila.adicionar("/arena/1", "Arena 1", "arena")
+    fila.adicionar("/manual/1", "Manual", "manual")
+    fila.adicionar("/arena/2", "Arena 2", "arena")
+
+    lote = fila.retirar_lote(5, origem="arena")
+
+    assert [b.url for b in lote] == ["/arena/1", "/arena/2"]
+    assert [b.url for b in fila.retirar_lote(5)] == ["/travel/1", "/manual/1"]
@@ -0,0 +1,77 @@
+"""Testes do registro de eventos e dos agregados por NPC."""
+
+import time
+
+import pytest
+
+from core import estatisticas
+from core.estatisticas import RegistroEventos
+
+
+@pytest.fixture
+def lutas(monkeypatch, tmp_path):
+    """Histórico de lutas isolado em um diretório temporário."""
+    monkeypatch.setattr(estatisticas, "caminho_dados", lambda nome: tmp_path / nome)
+    agregado = estatisticas._agregado_npc()
+    registro = RegistroEventos("lutas.jsonl", agregadores=(agregado,))
+    monkeypatch.setattr(estatisticas, "_lutas_por_npc", agregado)
+    monkeypatch.setattr(estatisticas, "lutas", registro)
+    return registro
+
+
+def test_agregado_por_npc_igual_ao_calculado_na_janela(lutas):
+    estatisticas.registrar_luta("Goblin", 4, 10.0, "vitoria", xp=10, gold=None)
+    estatisticas.registrar_luta("goblin (Level 3)", 6, 20.0, "vitoria", xp=30, gold=5)
+    estatisticas.registrar_luta("Rato", 2, 5.0, "vitoria")
+
+    agregado = estatisticas.tempo_medio_por_npc()
+
+    assert agregado == estatisticas.tempo_medio_por_npc(desde=0.0)
+    assert agregado["goblin"] == {
+        "lutas": 2,
+        "duracao_media": 15.0,
+        "ataques_medios": 5.0,
+        "xp_medio": 20.0,
+        "gold_medio": 5.0,
+    }
+    assert agregado["rato"]["xp_medio"] is None
+
+
+def test_agregado_inclui_o_historico_gravado(lutas, tmp_path, monkeypatch):
+    estatisticas.registrar_luta("Goblin", 4, 10.0, "vitoria", xp=10)
+
+    # Nova sessão: o agregado é refeito a partir do arquivo
+    agregado = estatisticas._agregado_npc()
+    monkeypatch.setattr(estatisticas, "_lutas_por_npc", agregado)
+    monkeypatch.setattr(
+        estatisticas, "lutas", RegistroEventos("lutas.jsonl", agregadores=(agregado,))
+    )
+    estatisticas.registrar_luta("Goblin", 6, 20.0, "vitoria", xp=30)
+
+    assert estatisticas.tempo_medio_por_npc()["goblin"]["lutas"] == 2
+
+
+def test_evento_entra_no_cache_mesmo_se_a_escrita_falhar(lutas, monkeypatch):
+    def falhar(caminho, registro):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(estatisticas, "anexar_jsonl", falhar)
+    estatisticas.registrar_luta("Goblin", 4, 10.0, "vitoria")
+
+    assert len(lutas) == 1
+    assert estatisticas.tempo_medio_por_npc()["goblin"]["lutas"] == 1
+
+
+def test_cache_mantem_apenas_a_retencao(monkeypatch, tmp_path):
+    monkeypatch.setattr(estatisticas, "caminho_dados", lambda nome: tmp_path / nome)
+    registro = RegistroEventos("eventos.jsonl", retencao=3600.0)
+    agora = time.time()
+    registro.anexar({"timestamp": agora - 7200})
+    registro.anexar({"timestamp": agora - 1800})
+    registro.anexar({"timestamp": agora})
+
+    # Nova sessão: a carga descarta o que está fora da retenção
+    recarregado = RegistroEventos("eventos.jsonl", retencao=3600.0)
+
+    assert len(recarregado) == 2
+    assert [e["timestamp"] for e in recarregado.registros(agora - 60)] == [agora]
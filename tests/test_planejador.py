@@ -0,0 +1,86 @@
+"""Testes do planejador de sessão (viabilidade, ordem e simulação)."""
+
+from core import planejador
+from core.planejador import Amostras, Recursos
+
+
+def test_viaveis_sem_restricoes_inclui_todas_as_atividades():
+    assert planejador.viaveis(Recursos()) == set(planejador.ORDEM_FIXA)
+
+
+def test_viaveis_risco_de_hp_exclui_luta_e_arena():
+    assert planejador.viaveis(Recursos(risco_hp=True)) == {"step", "coleta", "quest"}
+
+
+def test_viaveis_sem_energia_ou_cota_de_arena_exclui_arena():
+    assert "arena" not in planejador.viaveis(Recursos(energia=0))
+    assert "arena" not in planejador.viaveis(Recursos(fracao_arena=1.0))
+
+
+def test_viaveis_sem_quest_points_exclui_quest():
+    assert "quest" not in planejador.viaveis(Recursos(pontos_quest=0))
+
+
+def test_decidir_ordena_pelo_valor_por_segundo():
+    valores = {"step": 1.0, "luta": 3.0, "coleta": 0.5, "arena": 2.0, "quest": 0.2}
+
+    plano = planejador.decidir(valores, Recursos(pontos_quest=1, maximo_quest=100))
+
+    assert plano.ordem == ["luta", "arena", "step", "coleta", "quest"]
+    assert plano.permite("arena")
+    assert not plano.permite("coleta")
+    assert plano.custo_oportunidade == 1.0
+
+
+def test_decidir_atividade_sem_medicao_vem_antes_do_step():
+    valores = {"step": 1.0, "luta": 0.5, "coleta": None, "arena": 0.1, "quest": 0.1}
+
+    plano = planejador.decidir(valores, Recursos(pontos_quest=1, maximo_quest=100))
+
+    assert plano.ordem.index("coleta") < plano.ordem.index("step")
+    assert plano.ordem.index("luta") > plano.ordem.index("step")
+
+
+def test_decidir_quest_points_no_limite_passam_a_frente():
+    valores = {"step": 1.0, "luta": 3.0, "coleta": 2.0, "arena": 2.0, "quest": 0.1}
+
+    plano = planejador.decidir(valores, Recursos(pontos_quest=100, maximo_quest=100))
+
+    assert plano.ordem[0] == "quest"
+
+
+def test_simular_sessao_sem_passos_nao_simula():
+    assert planejador.simular_sessao(Amostras(), planejador.politica_planejador) == (
+        0.0,
+        {},
+    )
+
+
+def test_simular_sessao_luta_contra_cada_npc_revelado():
+    amostras = Amostras(
+        passos=[("npc", 0.0)],
+        duracao_passo=2.0,
+        lutas={"travel": [(10.0, 100.0)]},
+    )
+
+    total, tempos = planejador.simular_sessao(
+        amostras, planejador.politica_planejador, duracao=120.0
+    )
+
+    assert total == 1000.0
+    assert tempos == {"step": 20.0, "luta": 100.0}
+
+
+def test_simular_sessao_politica_que_so_da_steps():
+    amostras = Amostras(
+        passos=[("npc", 0.0)],
+        duracao_passo=2.0,
+        lutas={"travel": [(10.0, 100.0)]},
+    )
+
+    total, tempos = planejador.simular_sessao(
+        amostras, lambda valores, recursos: ["step"], duracao=120.0
+    )
+
+    assert total == 0.0
+    assert tempos == {"step": 120.0}
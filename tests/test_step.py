@@ -0,0 +1,30 @@
+"""Testes do motor de step (espaçamento mínimo entre steps)."""
+
+import time
+
+from core import context, estatisticas, step
+
+
+def test_steps_consecutivos_respeitam_o_intervalo_minimo(monkeypatch):
+    monkeypatch.setattr(context, "rodando", True)
+    monkeypatch.setattr(context, "encerrado", False)
+    monkeypatch.setitem(context.configuracoes_bot, "intervalo_minimo_step", 0.3)
+    monkeypatch.setitem(context.configuracoes_bot, "captura_rede_step", False)
+    monkeypatch.setattr(step, "get_driver", lambda: object())
+    monkeypatch.setattr(step, "drenar_eventos_rede", lambda: None)
+    monkeypatch.setattr(step, "registrar_acao", lambda acao: None)
+    monkeypatch.setattr(estatisticas, "registrar_passo", lambda *a, **k: None)
+
+    motor = step.MotorStep()
+    cliques: list[float] = []
+    alvo = {"elemento": None, "indice": 0, "fonte": "cache", "desabilitado": False}
+    monkeypatch.setattr(motor, "resolver", lambda driver: dict(alvo))
+    monkeypatch.setattr(
+        motor, "_clicar", lambda elemento: cliques.append(time.monotonic()) or True
+    )
+
+    for _ in range(3):
+        assert motor.executar().deu_passo
+
+    intervalos = [b - a for a, b in zip(cliques, cliques[1:])]
+    assert all(intervalo >= 0.3 for intervalo in intervalos)
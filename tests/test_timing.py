@@ -0,0 +1,25 @@
+"""Testes do sleep interrompível."""
+
+import time
+
+from core import context
+from utils.timing import sleep_interrompivel
+
+
+def test_sleep_interrompivel_dorme_com_o_bot_rodando(monkeypatch):
+    monkeypatch.setattr(context, "rodando", True)
+    monkeypatch.setattr(context, "encerrado", False)
+
+    inicio = time.monotonic()
+    sleep_interrompivel(0.3)
+
+    assert time.monotonic() - inicio >= 0.3
+
+
+def test_sleep_interrompivel_retorna_com_o_bot_parado(monkeypatch):
+    monkeypatch.setattr(context, "rodando", False)
+
+    inicio = time.monotonic()
+    sleep_interrompivel(5.0)
+
+    assert time.monotonic() - inicio < 0.5